@@ -5,6 +5,7 @@ Quotes on Binance, executes swaps on Jupiter (Solana)
 import logging
 import argparse
 import asyncio
+import signal
 
 # Setup console logging - only show warnings/errors
 logging.basicConfig(
@@ -16,6 +17,7 @@ logger = logging.getLogger(__name__)
 # Import modules
 from config import TradingBotConfig
 from bot.trading_bot import TradingBot
+from utils import event_loop
 from commands.bot_commands import (
     test_binance_order,
     test_jupiter_swap,
@@ -25,6 +27,7 @@ from commands.bot_commands import (
     cmd_orders,
     cmd_close_all,
     cmd_liquidate,
+    close_managers,
     interactive_mode
 )
 
@@ -64,39 +67,53 @@ async def main():
         config.no_hedge_mode = True
         logger.info("⚠️  NO-HEDGE MODE ENABLED: DEX hedging will be skipped")
 
-    # Default to interactive mode
-    if args.mode == 'interactive':
-        await interactive_mode(config)
+    # `docker stop` sends SIGTERM, which PID 1 ignores by default; cancel the
+    # main task instead so the finally blocks and the atexit log flush run
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+    except NotImplementedError:  # no loop signal handlers on Windows
+        pass
 
-    elif args.mode == 'trade':
-        logger.info(f"Starting arbitrage bot: {args.symbol} ${args.usd_amount:.2f} USD")
-        bot = TradingBot(args.symbol, args.usd_amount, config)
-        await bot.start()
+    try:
+        # Default to interactive mode
+        if args.mode == 'interactive':
+            await interactive_mode(config)
 
-    elif args.mode == 'cex-order':
-        await test_binance_order(args.symbol, args.usd_amount, config, args.price)
+        elif args.mode == 'trade':
+            logger.info(f"Starting arbitrage bot: {args.symbol} ${args.usd_amount:.2f} USD")
+            bot = TradingBot(args.symbol, args.usd_amount, config)
+            await bot.start()
 
-    elif args.mode == 'dex-swap':
-        await test_jupiter_swap(config, args.usd_amount, args.symbol)
+        elif args.mode == 'cex-order':
+            await test_binance_order(args.symbol, args.usd_amount, config, args.price)
 
-    elif args.mode == 'approve':
-        await cmd_approve_token(args.symbol, config, args.approve_amount)
+        elif args.mode == 'dex-swap':
+            await test_jupiter_swap(config, args.usd_amount, args.symbol)
 
-    elif args.mode == 'stop':
-        await cmd_stop(config)
+        elif args.mode == 'approve':
+            await cmd_approve_token(args.symbol, config, args.approve_amount)
 
-    elif args.mode == 'balance':
-        await cmd_balance(args.symbol, config)
+        elif args.mode == 'stop':
+            await cmd_stop(config)
 
-    elif args.mode == 'orders':
-        await cmd_orders(args.symbol, config)
+        elif args.mode == 'balance':
+            await cmd_balance(args.symbol, config)
 
-    elif args.mode == 'close-all':
-        await cmd_close_all(args.symbol, config)
+        elif args.mode == 'orders':
+            await cmd_orders(args.symbol, config)
 
-    elif args.mode == 'liquidate':
-        await cmd_liquidate(args.symbol, config)
+        elif args.mode == 'close-all':
+            await cmd_close_all(args.symbol, config)
+
+        elif args.mode == 'liquidate':
+            await cmd_liquidate(args.symbol, config)
+    finally:
+        # Release the shared exchange sessions opened by one-shot commands
+        await close_managers()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        event_loop.run(main())
+    except asyncio.CancelledError:
+        logger.warning("Stopped by SIGTERM")
@@ -2,6 +2,7 @@
 Main trading bot orchestrator
 """
 import os
+import time
 import asyncio
 import logging
 from config import TradingBotConfig, get_market_config
@@ -11,9 +12,16 @@ from managers.jupiter_manager import JupiterSwapManager
 from managers.okx_dex_manager import OKXDexManager
 from bot.status_display import StatusDisplay
 from utils.logging_setup import bot_logger, trades_logger
+from utils.token_units import TOKEN_DECIMALS, USD_STABLE_INPUTS, base_units
 
 logger = logging.getLogger(__name__)
 
+# Backoff between stream reconnect attempts (seconds)
+STREAM_RECONNECT_MIN_DELAY = 1.0
+STREAM_RECONNECT_MAX_DELAY = 30.0
+# Streams that ran this long count as healthy and reset the backoff (seconds)
+STREAM_HEALTHY_AFTER = 60.0
+
 
 class TradingBot:
     def __init__(self, symbol: str, usd_amount: float, config: TradingBotConfig, enable_status_display: bool = True):
@@ -48,6 +56,17 @@ class TradingBot:
         self.dex_provider = dex_provider
         self.dex_chain = dex_chain
 
+        # Hedge swaps convert the CEX fill's USD value straight to input token
+        # units, so the input must be a known USD stablecoin. Checked here so a
+        # bad market fails before any CEX order can fill unhedged.
+        if not config.no_hedge_mode:
+            if dex_provider == 'okx' and dex_chain == 'bsc':
+                hedge_input = self.market_config.get('input_token')
+            else:
+                hedge_input = self.market_config.get('input_mint')
+            if hedge_input not in USD_STABLE_INPUTS:
+                raise ValueError(f"DEX input token for {symbol} must be a known USD stablecoin, got: {hedge_input}")
+
         # Initialize Jupiter (for Solana markets)
         if dex_provider == 'jupiter' or dex_chain == 'solana':
             self.jupiter = JupiterSwapManager(
@@ -67,21 +86,25 @@ class TradingBot:
                 passphrase=config.okx_passphrase,
                 solana_private_key=config.solana_private_key if dex_chain == 'solana' else None,
                 bsc_private_key=config.bsc_private_key if dex_chain == 'bsc' else None,
-                max_slippage=config.max_slippage
+                max_slippage=config.max_slippage,
+                solana_rpc_urls=config.solana_rpc_urls
             )
         else:
             self.okx_dex = None
+        self._dex_warmup = None  # OKX connection warmup task, started in start()
 
         self.running = True
         self.order_filled = False
         self.price_update_counter = 0  # Track price updates for periodic logging
+        self.last_checked_price = None  # Price last passed to should_update_order
 
     async def validate_existing_orders(self) -> bool:
         """
         Check if there are existing open orders and validate if they're still appropriate.
         Returns True if we should place a new order, False if existing order is still valid.
         """
-        open_orders = self.cex.get_open_orders(self.cex_symbol)
+        # CEX managers use blocking REST clients; run them off the event loop
+        open_orders = await asyncio.to_thread(self.cex.get_open_orders, self.cex_symbol)
 
         if not open_orders:
             logger.info("No existing orders found")
@@ -89,7 +112,7 @@ class TradingBot:
             return True  # No orders, should place new one
 
         # Get current market price
-        current_price = self.cex.get_current_price(self.cex_symbol)
+        current_price = await asyncio.to_thread(self.cex.get_current_price, self.cex_symbol)
         if not current_price:
             logger.error("Failed to get current price for order validation")
             return True  # If we can't get price, place new order anyway
@@ -136,13 +159,15 @@ class TradingBot:
             if should_cancel:
                 logger.info(f"Cancelling existing order {order_id}: {cancel_reason}")
                 bot_logger.info(f"STARTUP_CANCEL | Symbol: {self.symbol} | OrderID: {order_id} | Reason: {cancel_reason}")
-                self.cex.cancel_order(self.cex_symbol, order_id)
+                await asyncio.to_thread(self.cex.cancel_order, self.cex_symbol, order_id)
                 return True  # Should place new order
             else:
                 # Order is still valid, use it
                 logger.info(f"Existing order {order_id} is still valid, keeping it")
                 bot_logger.info(f"STARTUP_KEEP | Symbol: {self.symbol} | OrderID: {order_id} | Order still valid")
                 self.cex.current_order_id = order_id
+                if hasattr(self.cex, 'order_symbol'):
+                    self.cex.order_symbol = self.cex_symbol
                 self.cex.last_order_price = order_price
                 self.cex.market_price_at_order = reference_price
 
@@ -170,41 +195,109 @@ class TradingBot:
             self.status_display.start()
             self.status_display.add_action(f"🚀 Bot started: {self.symbol} | ${self.usd_amount:.2f} USD")
 
-        # Check and validate existing orders
-        should_place_new_order = await self.validate_existing_orders()
+        try:
+            # Connect to OKX and the chain RPCs while the CEX side starts up
+            if self.okx_dex:
+                self._dex_warmup = asyncio.create_task(self.okx_dex.warmup())
+
+            # Check and validate existing orders
+            should_place_new_order = await self.validate_existing_orders()
+
+            if should_place_new_order:
+                # Managers with an async order path fetch precision and price together
+                async_orders = hasattr(self.cex, 'place_limit_sell_order_async')
+                if async_orders:
+                    current_price = await self.cex.prepare_order(self.cex_symbol)
+                else:
+                    current_price = await asyncio.to_thread(self.cex.get_current_price, self.cex_symbol)
+                if not current_price:
+                    logger.error("Failed to get initial price")
+                    bot_logger.error(f"BOT_ERROR | Failed to get initial price for {self.symbol}")
+                    return
+
+                quote_price = current_price * (1 + self.config.mark_up_percent / 100)
+                if async_orders:
+                    await self.cex.place_limit_sell_order_async(self.cex_symbol, self.usd_amount, quote_price, current_price)
+                else:
+                    await asyncio.to_thread(self.cex.place_limit_sell_order, self.cex_symbol, self.usd_amount, quote_price, current_price)
+
+            # Streams only stop by raising; reconnect with backoff until stopped
+            delay = STREAM_RECONNECT_MIN_DELAY
+            while self.running and not self.order_filled:
+                started = time.monotonic()
+                try:
+                    await self.run_streams()
+                except* Exception as eg:
+                    for exc in eg.exceptions:
+                        logger.error("Stream monitor failed: %s", exc)
+                        bot_logger.error("STREAM_ERROR | Symbol: %s | %s", self.symbol, exc)
+
+                if not self.running or self.order_filled:
+                    break
+                if time.monotonic() - started >= STREAM_HEALTHY_AFTER:
+                    delay = STREAM_RECONNECT_MIN_DELAY
+                logger.warning("Streams stopped, reconnecting in %.0fs", delay)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, STREAM_RECONNECT_MAX_DELAY)
+        finally:
+            # Also runs when the bot task is cancelled (REPL stop, SIGTERM).
+            # A warmup still connecting must not outlive the session it uses
+            if self._dex_warmup is not None:
+                self._dex_warmup.cancel()
+                await asyncio.gather(self._dex_warmup, return_exceptions=True)
+                self._dex_warmup = None
+            # CEX first: its close() waits for a hedge still running on the DEX managers
+            if hasattr(self.cex, 'close'):
+                await self.cex.close()
+            if self.jupiter:
+                await self.jupiter.close()
+            if self.okx_dex:
+                await self.okx_dex.close()
+
+            # Log bot stop
+            bot_logger.info(f"BOT_STOP | Symbol: {self.symbol}")
+
+    async def run_streams(self):
+        """Run price and order fill monitoring until either one stops
+
+        The two monitors share a TaskGroup, so if one raises (or returns
+        while the bot is still running) the other is cancelled and start()
+        can reconnect both together.
+        """
+        if hasattr(self.cex, 'start_streams'):
+            # Price and fill updates share one multiplexed WebSocket
+            await self._until_stopped(self.monitor_streams_websocket(), "Price/order stream")
+            return
 
-        if should_place_new_order:
-            current_price = self.cex.get_current_price(self.cex_symbol)
-            if not current_price:
-                logger.error("Failed to get initial price")
-                bot_logger.error(f"BOT_ERROR | Failed to get initial price for {self.symbol}")
-                return
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(self._until_stopped(self.monitor_prices_websocket(), "Price monitor"))
+            tg.create_task(self._until_stopped(self.monitor_order_fill_websocket(), "Order fill monitor"))
 
-            quote_price = current_price * (1 + self.config.mark_up_percent / 100)
-            self.cex.place_limit_sell_order(self.cex_symbol, self.usd_amount, quote_price, current_price)
+    async def _until_stopped(self, monitor, name: str):
+        """Await a monitor, treating a quiet return as a failure
 
-        await asyncio.gather(
-            self.monitor_prices_websocket(),
-            self.monitor_order_fill_websocket()
-        )
+        A monitor that returns while the bot is still running has stopped
+        watching (e.g. a user stream that ended after one fill); raising
+        makes run_streams() tear down its partner and reconnect both.
+        """
+        await monitor
+        if self.running and not self.order_filled:
+            raise ConnectionError(f"{name} ended")
 
-        # Log bot stop
-        bot_logger.info(f"BOT_STOP | Symbol: {self.symbol}")
+    async def monitor_streams_websocket(self):
+        """Monitor prices and order fills over a single multiplexed WebSocket"""
+        logger.info("Using multiplexed WebSocket for price and order fill monitoring")
+        await self.cex.start_streams(self.cex_symbol, self._handle_price_update, self._handle_order_fill)
 
     async def monitor_prices_websocket(self):
         """Monitor price changes via WebSocket and update orders"""
-        try:
-            # Check if CEX manager supports price stream
-            if hasattr(self.cex, 'start_price_stream'):
-                logger.info("Using WebSocket for price monitoring")
-                await self.cex.start_price_stream(self.cex_symbol, self._handle_price_update)
-            else:
-                # Fallback to polling for CEX providers without WebSocket
-                logger.info("Using REST polling for price monitoring")
-                await self._monitor_prices_polling()
-        except Exception as e:
-            logger.error(f"WebSocket price monitoring failed: {e}")
-            logger.warning("Falling back to REST polling...")
+        # Check if CEX manager supports price stream
+        if hasattr(self.cex, 'start_price_stream'):
+            logger.info("Using WebSocket for price monitoring")
+            await self.cex.start_price_stream(self.cex_symbol, self._handle_price_update)
+        else:
+            # Polling for CEX providers without a price WebSocket
+            logger.info("Using REST polling for price monitoring")
             await self._monitor_prices_polling()
 
     async def _handle_price_update(self, current_price: float):
@@ -212,7 +305,7 @@ class TradingBot:
         # DIAGNOSTIC: Always increment counter, even if bot not running
         self.price_update_counter += 1
         if self.price_update_counter % 10 == 0:
-            bot_logger.info(f"WEBSOCKET_CALLBACK | Counter: {self.price_update_counter} | Running: {self.running} | Filled: {self.order_filled}")
+            bot_logger.info("WEBSOCKET_CALLBACK | Counter: %s | Running: %s | Filled: %s", self.price_update_counter, self.running, self.order_filled)
 
         if not self.running or self.order_filled:
             return
@@ -221,7 +314,7 @@ class TradingBot:
 
             # Log WebSocket activity every 10 updates regardless of order status (for diagnostics)
             if self.price_update_counter % 10 == 0:
-                bot_logger.info(f"WEBSOCKET_ACTIVE | Symbol: {self.symbol} | Updates: {self.price_update_counter} | Price: ${current_price:.8f} | Has_Order: {self.cex.market_price_at_order is not None}")
+                bot_logger.info("WEBSOCKET_ACTIVE | Symbol: %s | Updates: %s | Price: $%.8f | Has_Order: %s", self.symbol, self.price_update_counter, current_price, self.cex.market_price_at_order is not None)
 
             # Log price update (debug for every update, info every 100 updates)
             if self.cex.market_price_at_order:
@@ -229,29 +322,36 @@ class TradingBot:
 
                 # Log at INFO level every 100 updates (~5 minutes if 3s intervals)
                 if self.price_update_counter % 100 == 0:
-                    logger.info(f"📊 Price stream active: ${current_price:.8f} ({price_change:+.2f}% from order) | Updates: {self.price_update_counter}")
-                    bot_logger.info(f"PRICE_STREAM_ACTIVE | Symbol: {self.symbol} | Current: ${current_price:.8f} | Change: {price_change:+.2f}% | Updates: {self.price_update_counter}")
+                    logger.info("📊 Price stream active: $%.8f (%+.2f%% from order) | Updates: %s", current_price, price_change, self.price_update_counter)
+                    bot_logger.info("PRICE_STREAM_ACTIVE | Symbol: %s | Current: $%.8f | Change: %+.2f%% | Updates: %s", self.symbol, current_price, price_change, self.price_update_counter)
                 else:
-                    logger.debug(f"Price update: ${current_price:.8f} ({price_change:+.2f}% from order reference)")
-                    bot_logger.debug(f"PRICE_UPDATE | Symbol: {self.symbol} | Current: ${current_price:.8f} | Change: {price_change:+.2f}%")
+                    logger.debug("Price update: $%.8f (%+.2f%% from order reference)", current_price, price_change)
+                    bot_logger.debug("PRICE_UPDATE | Symbol: %s | Current: $%.8f | Change: %+.2f%%", self.symbol, current_price, price_change)
+
+            # Skip the update check for moves under a tenth of the threshold
+            # since the last price we actually checked
+            last = self.last_checked_price
+            if last and abs(current_price - last) / last * 100 < self.config.price_change_threshold / 10:
+                return
+            self.last_checked_price = current_price
 
             # Check if order needs updating
             if self.cex.should_update_order(current_price, self.config.price_change_threshold):
-                logger.info(f"Market moved {self.config.price_change_threshold}% from ${self.cex.market_price_at_order:.8f}, updating order")
+                logger.info("Market moved %s%% from $%.8f, updating order", self.config.price_change_threshold, self.cex.market_price_at_order)
 
                 if self.cex.current_order_id:
                     # Use modify_order instead of cancel+create
                     new_quote_price = current_price * (1 + self.config.mark_up_percent / 100)
-                    logger.info(f"Modifying order: ${self.cex.last_order_price:.8f} → ${new_quote_price:.8f}")
-                    self.cex.modify_order(self.cex_symbol, self.cex.current_order_id, self.usd_amount, new_quote_price, current_price)
+                    logger.info("Modifying order: $%.8f → $%.8f", self.cex.last_order_price, new_quote_price)
+                    await asyncio.to_thread(self.cex.modify_order, self.cex_symbol, self.cex.current_order_id, self.usd_amount, new_quote_price, current_price)
         except Exception as e:
-            logger.error(f"Error handling price update: {e}")
+            logger.error("Error handling price update: %s", e)
 
     async def _monitor_prices_polling(self):
         """Fallback: Monitor price changes via REST API polling"""
         while self.running and not self.order_filled:
             try:
-                current_price = self.cex.get_current_price(self.cex_symbol)
+                current_price = await asyncio.to_thread(self.cex.get_current_price, self.cex_symbol)
 
                 if current_price and self.cex.should_update_order(
                     current_price,
@@ -262,7 +362,7 @@ class TradingBot:
                     if self.cex.current_order_id:
                         # Use modify_order instead of cancel+create
                         new_quote_price = current_price * (1 + self.config.mark_up_percent / 100)
-                        self.cex.modify_order(self.cex_symbol, self.cex.current_order_id, self.usd_amount, new_quote_price, current_price)
+                        await asyncio.to_thread(self.cex.modify_order, self.cex_symbol, self.cex.current_order_id, self.usd_amount, new_quote_price, current_price)
 
                 await asyncio.sleep(2)
             except Exception as e:
@@ -271,13 +371,8 @@ class TradingBot:
     
     async def monitor_order_fill_websocket(self):
         """Monitor order fills via WebSocket for instant notifications"""
-        try:
-            logger.info("Using WebSocket for real-time order fill monitoring")
-            await self.cex.start_user_stream(self._handle_order_fill)
-        except Exception as e:
-            logger.error(f"WebSocket monitoring failed: {e}")
-            logger.warning("Falling back to polling mode...")
-            await self.monitor_order_fill()
+        logger.info("Using WebSocket for real-time order fill monitoring")
+        await self.cex.start_user_stream(self._handle_order_fill)
 
     async def _handle_order_fill(self, filled_order: dict):
         """Handle order fill event from WebSocket
@@ -321,10 +416,10 @@ class TradingBot:
 
                 # Get current price and place new order
                 logger.info("📊 Placing new order to continue trading...")
-                current_price = self.cex.get_current_price(self.cex_symbol)
+                current_price = await asyncio.to_thread(self.cex.get_current_price, self.cex_symbol)
                 if current_price:
                     quote_price = current_price * (1 + self.config.mark_up_percent / 100)
-                    self.cex.place_limit_sell_order(self.cex_symbol, self.usd_amount, quote_price, current_price)
+                    await asyncio.to_thread(self.cex.place_limit_sell_order, self.cex_symbol, self.usd_amount, quote_price, current_price)
                     logger.info(f"✓ New order placed at ${quote_price:.8f} | Continue trading...")
                     bot_logger.info(f"NEW_ORDER_PLACED | Symbol: {self.symbol} | Price: ${quote_price:.8f} | Continuing arbitrage")
                 else:
@@ -345,34 +440,6 @@ class TradingBot:
             import traceback
             logger.error(traceback.format_exc())
 
-    async def monitor_order_fill(self):
-        """Monitor if our limit order gets filled (POLLING FALLBACK)
-
-        This is the fallback method using REST API polling.
-        WebSocket monitoring is preferred for instant notifications.
-        """
-        logger.info("Using polling mode for order fill monitoring (1s interval)")
-        while self.running and not self.order_filled:
-            try:
-                if not self.cex.current_order_id:
-                    await asyncio.sleep(5)
-                    continue
-
-                filled_order = self.cex.check_order_filled(
-                    self.symbol,
-                    self.cex.current_order_id
-                )
-
-                if filled_order:
-                    await self._handle_order_fill(filled_order)
-
-                await asyncio.sleep(1)
-            except Exception as e:
-                logger.error(f"Error in monitor_order_fill: {e}")
-                import traceback
-                logger.error(traceback.format_exc())
-                await asyncio.sleep(5)
-    
     async def execute_dex_buy(self, filled_order: dict) -> bool:
         """Execute purchase on DEX after being filled on CEX
 
@@ -421,10 +488,11 @@ class TradingBot:
             logger.error("Missing input_mint or output_mint for Jupiter swap")
             return False
 
-        # Use actual USD value from CEX fill
-        amount_in_lamports = int(usd_value * 1e6)  # Convert USD to USDC lamports (6 decimals)
+        # Use actual USD value from CEX fill (input is a stablecoin, checked in __init__)
+        amount_in_lamports = base_units(input_mint, usd_value)  # USD -> stablecoin lamports
+        lamports_per_usd = 10 ** TOKEN_DECIMALS[input_mint]
         logger.info(f"Jupiter swap amount: ${usd_value:.2f} USD = {amount_in_lamports} lamports")
-        bot_logger.info(f"JUPITER_AMOUNT_CALC | CEX_Fill_USD: ${usd_value:.8f} | Requested_Lamports: {amount_in_lamports} | Requested_USDC: {amount_in_lamports/1e6:.6f}")
+        bot_logger.info(f"JUPITER_AMOUNT_CALC | CEX_Fill_USD: ${usd_value:.8f} | Requested_Lamports: {amount_in_lamports} | Requested_USDC: {amount_in_lamports/lamports_per_usd:.6f}")
 
         # Retry logic for getting Jupiter order (up to 3 attempts with exponential backoff)
         order = None
@@ -456,13 +524,13 @@ class TradingBot:
 
         # Extract Jupiter trade details for logging
         jupiter_in_amount_lamports = float(order.get('inAmount', 0))
-        jupiter_in_amount = jupiter_in_amount_lamports / 1e6  # Convert from lamports to USDC
+        jupiter_in_amount = jupiter_in_amount_lamports / lamports_per_usd  # Convert from lamports to USD
         jupiter_out_amount = float(order.get('outAmount', 0))
 
         # Validate Jupiter returned the amount we requested
         amount_discrepancy_pct = abs(jupiter_in_amount_lamports - amount_in_lamports) / amount_in_lamports * 100 if amount_in_lamports > 0 else 0
         if amount_discrepancy_pct > 5.0:  # More than 5% difference
-            logger.warning(f"⚠️  Jupiter amount mismatch! Requested: {amount_in_lamports} lamports (${amount_in_lamports/1e6:.6f}), Got: {int(jupiter_in_amount_lamports)} lamports (${jupiter_in_amount:.6f}) - {amount_discrepancy_pct:.1f}% difference")
+            logger.warning(f"⚠️  Jupiter amount mismatch! Requested: {amount_in_lamports} lamports (${amount_in_lamports/lamports_per_usd:.6f}), Got: {int(jupiter_in_amount_lamports)} lamports (${jupiter_in_amount:.6f}) - {amount_discrepancy_pct:.1f}% difference")
             bot_logger.warning(f"JUPITER_AMOUNT_MISMATCH | Requested_Lamports: {amount_in_lamports} | Received_Lamports: {int(jupiter_in_amount_lamports)} | Discrepancy_Pct: {amount_discrepancy_pct:.2f}%")
 
         # Retry logic for executing Jupiter swap (up to 3 attempts with exponential backoff)
@@ -550,11 +618,9 @@ class TradingBot:
         if self.dex_chain == 'bsc':
             input_token = market.get('input_token')
             output_token = market.get('output_token')
-            decimals = 18  # BSC USDT has 18 decimals
         elif self.dex_chain == 'solana':
             input_token = market.get('input_mint')
             output_token = market.get('output_mint')
-            decimals = 6  # Solana USDC has 6 decimals
         else:
             logger.error(f"Unsupported chain for OKX: {self.dex_chain}")
             return False
@@ -563,8 +629,8 @@ class TradingBot:
             logger.error(f"Missing token addresses for OKX {self.dex_chain} swap")
             return False
 
-        # Convert USD to token amount (with proper decimals)
-        amount = str(int(usd_value * (10 ** decimals)))
+        # Convert USD to token amount (input is a stablecoin, checked in __init__)
+        amount = str(base_units(input_token, usd_value))
         logger.info(f"OKX swap amount: ${usd_value:.2f} USD = {amount} base units")
         bot_logger.info(f"OKX_AMOUNT_CALC | CEX_Fill_USD: ${usd_value:.8f} | Amount: {amount} | Chain: {self.dex_chain}")
 
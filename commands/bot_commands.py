@@ -2,9 +2,14 @@
 Bot command functions
 """
 import os
-import json
+import sys
+import time
 import asyncio
 import logging
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Dict, List, Optional
+import aiohttp
 from binance.exceptions import BinanceAPIException
 from managers.binance_manager import BinanceManager
 from managers.jupiter_manager import JupiterSwapManager
@@ -12,20 +17,217 @@ from managers.okx_dex_manager import OKXDexManager
 from bot.trading_bot import TradingBot
 from config import TradingBotConfig, get_market_config
 from utils.logging_setup import orders_logger, trades_logger
-from web3 import Web3
+from utils import json_utils
+from utils.token_units import USD_STABLE_INPUTS, base_units
+from web3 import Web3, AsyncWeb3, AsyncHTTPProvider
+from web3.exceptions import TimeExhausted, TransactionNotFound
+from eth_account import Account
 
 logger = logging.getLogger(__name__)
 
+# Static REPL text, built once at import instead of on every 'help'
+BANNER_TEXT = """
+╔══════════════════════════════════════╗
+║        Meme Arbitrage Bot v2.0       ║
+║     Interactive Command Interface    ║
+╚══════════════════════════════════════╝
+
+"""
+
+HELP_TEXT = """
+Available Commands:
+
+📊 MONITORING:
+  balance          - Show account balances and positions
+  orders           - List all open orders
+  status           - Show current bot status
+  recent           - Show last 10 bot actions and current state
+  price            - Get current market price
+
+🤖 TRADING:
+  start            - Start arbitrage bot with current settings
+  stop             - Stop running arbitrage bot
+  cex-order <amt> [price] - Place CEX order (e.g., cex-order 10 or cex-order 10 0.42)
+  dex-swap <amt>   - Execute DEX swap (e.g., dex-swap 10)
+
+⚙️  SETTINGS:
+  set symbol <SYM> - Change trading symbol (e.g., set symbol PIPPINUSDT)
+  set amount <USD> - Change USD amount for both CEX and DEX (e.g., set amount 50.0)
+  set markup <PCT> - Change perp order markup % above market (e.g., set markup 4.0)
+  set threshold <PCT> - Change price change threshold % for order updates (e.g., set threshold 0.3)
+  set slippage <PCT> - Change max slippage % for Jupiter swaps (e.g., set slippage 1.5)
+  set nohedge <on/off> - Toggle no-hedge mode (CEX-only, skip DEX hedging)
+  show             - Show current settings
+
+🛡️  RISK MANAGEMENT:
+  close-all        - Cancel all open orders
+  liquidate        - Emergency: close all positions (⚠️ CAUTION)
+
+💡 EXAMPLES:
+  price            - Check current market price
+  start            - Start bot with current settings
+  recent           - View last 10 bot actions
+  set symbol SOLUSDT - Change to SOLUSDT
+  set amount 25.0  - Trade with $25 USD
+  set markup 5.0   - 5% markup for volatile tokens
+  set threshold 0.2 - Update orders on 0.2% price moves
+  set slippage 2.0 - Allow 2% slippage for low liquidity
+  balance          - Check account status
+  stop             - Stop the bot
+
+"""
+
+# Accepted spellings for on/off settings and yes/no prompts
+TRUTHY = frozenset({'on', 'true', '1', 'yes'})
+FALSY = frozenset({'off', 'false', '0', 'no'})
+CONFIRM = frozenset({'yes', 'y'})
+
+# Max in-flight cancel requests when cmd_close_all falls back to per-order cancels
+CANCEL_CONCURRENCY = 10
+
+# BSC JSON-RPC endpoint used for token approvals
+BSC_RPC_URL = 'https://bsc-dataseed1.binance.org'
+
+# ERC20 ABI subset used for approvals (approve, allowance, decimals)
+ERC20_ABI = [
+    {
+        "constant": False,
+        "inputs": [
+            {"name": "_spender", "type": "address"},
+            {"name": "_value", "type": "uint256"}
+        ],
+        "name": "approve",
+        "outputs": [{"name": "", "type": "bool"}],
+        "type": "function"
+    },
+    {
+        "constant": True,
+        "inputs": [
+            {"name": "_owner", "type": "address"},
+            {"name": "_spender", "type": "address"}
+        ],
+        "name": "allowance",
+        "outputs": [{"name": "", "type": "uint256"}],
+        "type": "function"
+    },
+    {
+        "constant": True,
+        "inputs": [],
+        "name": "decimals",
+        "outputs": [{"name": "", "type": "uint8"}],
+        "type": "function"
+    }
+]
+
+# Last-known allowances keyed by wallet/token/spender; lets repeat approvals of
+# an already-unlimited allowance skip the RPC entirely
+ALLOWANCE_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'meme-arb-bot', 'allowance.json')
+# Anything at or above this is treated as an unlimited approval
+UNLIMITED_ALLOWANCE = 2**255
+
+# Lazily created BSC AsyncWeb3 instance (and its HTTP session) and ERC20
+# contracts keyed by checksum address
+_BSC_W3 = None
+_BSC_SESSION = None
+_TOKEN_CONTRACTS: dict = {}
+
+# Next nonce per wallet, tracked locally after the first chain read
+_NONCES: dict = {}
+
+# BSC gas price is reused for this many seconds before re-querying the node
+GAS_PRICE_TTL = 10.0
+_gas_price_cache = (0.0, None)  # (monotonic fetch time, price in wei)
+
+# Dedicated thread for blocking input() so the default executor stays free
+# for exchange calls dispatched through _run()
+_STDIN_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='stdin')
+
+# Manager instances, lazily created on first use and shared by every command
+# in this process so REST sessions and keep-alive connections are reused
+_managers: dict = {}
+
+
+def _get_binance(config: TradingBotConfig) -> BinanceManager:
+    """Return the shared BinanceManager for the configured API key"""
+    key = ('binance', config.binance_api_key)
+    binance = _managers.get(key)
+    if binance is None:
+        binance = _managers[key] = BinanceManager(config.binance_api_key, config.binance_api_secret)
+    return binance
+
+
+def _get_jupiter(config: TradingBotConfig) -> JupiterSwapManager:
+    """Return the shared JupiterSwapManager for the configured wallet and API key"""
+    key = ('jupiter', config.jupiter_api_key, config.solana_private_key)
+    jupiter = _managers.get(key)
+    if jupiter is None:
+        jupiter = _managers[key] = JupiterSwapManager(
+            config.solana_private_key,
+            config.jupiter_api_url,
+            config.jupiter_api_key,
+            config.max_slippage
+        )
+    # Slippage can be changed from the REPL with 'set slippage'
+    jupiter.max_slippage = config.max_slippage
+    return jupiter
+
+
+async def close_managers():
+    """Close async sessions held by the shared managers and the BSC provider"""
+    for manager in list(_managers.values()):
+        if hasattr(manager, 'close'):
+            try:
+                await manager.close()
+            except Exception as e:
+                logger.error("Error closing %s: %s", type(manager).__name__, e)
+    _managers.clear()
+
+    global _BSC_W3, _BSC_SESSION
+    if _BSC_SESSION is not None:
+        await _BSC_SESSION.close()
+        _BSC_W3 = None
+        _BSC_SESSION = None
+        _TOKEN_CONTRACTS.clear()
+
+
+def _dumps_pretty(obj) -> str:
+    """Indented JSON for console output"""
+    return json_utils.dumps(obj, pretty=True)
+
+
+def _write_lines(lines: list):
+    """Write a display block to stdout in a single call"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+async def _ainput(prompt: str) -> str:
+    """Read a line from stdin without tying up the default executor
+
+    asyncio.to_thread() always uses the default executor, so this keeps an
+    explicit run_in_executor() on the dedicated stdin thread instead.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_STDIN_EXECUTOR, input, prompt)
+
+
+async def _run(func, *args, **kwargs):
+    """Run a blocking call (exchange REST, signing) in a worker thread"""
+    return await asyncio.to_thread(func, *args, **kwargs)
+
 
 async def test_binance_order(symbol: str, usd_amount: float, config: TradingBotConfig, limit_price: float = None):
     """Place a CEX order"""
     print(f"\n=== Placing CEX Order ({symbol}, ${usd_amount:.2f} USD) ===")
 
-    binance = BinanceManager(config.binance_api_key, config.binance_api_secret)
+    binance = _get_binance(config)
 
     try:
-        # Get current price
-        price = binance.get_current_price(symbol)
+        # Fetch the price and warm the symbol filters (used to round qty/price
+        # when placing) concurrently; filters stay cached on the shared manager
+        price, _ = await asyncio.gather(
+            binance.get_current_price_async(symbol),
+            _run(binance._get_symbol_precision, symbol)
+        )
         if not price:
             print("❌ Failed to get price")
             return
@@ -37,7 +239,7 @@ async def test_binance_order(symbol: str, usd_amount: float, config: TradingBotC
         else:
             test_price = price * 1.02
             print(f"Using default limit price (2% above market): ${test_price:.8f}")
-        order = binance.place_limit_sell_order(symbol, usd_amount, test_price, price)
+        order = await _run(binance.place_limit_sell_order, symbol, usd_amount, test_price, price)
 
         if not order:
             print("❌ Failed to place order")
@@ -52,18 +254,19 @@ async def test_binance_order(symbol: str, usd_amount: float, config: TradingBotC
         # Cancel order
         print(f"Cancelling order {order_id}...")
         try:
-            binance.client.futures_cancel_order(symbol=symbol, orderId=order_id)
+            client = await binance.connect()
+            await client.futures_cancel_order(symbol=symbol, orderId=order_id)
             print(f"✓ Order cancelled successfully")
         except BinanceAPIException as e:
             print(f"❌ Error cancelling order: {e}")
-            logger.error(f"Error cancelling order: {e}")
+            logger.error("Error cancelling order: %s", e)
             return
 
         print("✓ Test completed successfully!\n")
 
     except Exception as e:
         print(f"❌ Test failed: {e}")
-        logger.error(f"Test failed: {e}")
+        logger.error("Test failed: %s", e)
         return
 
 
@@ -94,19 +297,13 @@ async def test_jupiter_swap(config: TradingBotConfig, usd_amount: float = 0.10,
 
     except Exception as e:
         print(f"❌ Swap failed: {e}")
-        logger.error(f"Swap failed: {e}")
-        import traceback
+        logger.error("Swap failed: %s", e)
         traceback.print_exc()
 
 
 async def _execute_jupiter_swap_command(config: TradingBotConfig, market: dict, usd_amount: float):
     """Execute Jupiter swap"""
-    jupiter = JupiterSwapManager(
-        config.solana_private_key,
-        config.jupiter_api_url,
-        config.jupiter_api_key,
-        config.max_slippage
-    )
+    jupiter = _get_jupiter(config)
 
     input_mint = market.get('input_mint')
     output_mint = market.get('output_mint')
@@ -114,12 +311,15 @@ async def _execute_jupiter_swap_command(config: TradingBotConfig, market: dict,
     if not input_mint or not output_mint:
         print("❌ Missing input_mint or output_mint for Jupiter swap")
         return
+    if input_mint not in USD_STABLE_INPUTS:
+        print(f"❌ Input mint must be a known USD stablecoin to size the swap in USD, got: {input_mint}")
+        return
 
     print(f"Input mint: {input_mint}")
     print(f"Output mint: {output_mint}")
 
-    # Convert USD amount to lamports (6 decimals for USDT/USDC)
-    amount = int(usd_amount * 1e6)
+    # Convert USD amount to stablecoin lamports
+    amount = base_units(input_mint, usd_amount)
     print(f"Amount: {amount} lamports (${usd_amount:.2f} USD)")
 
     # Get order from Jupiter
@@ -134,8 +334,9 @@ async def _execute_jupiter_swap_command(config: TradingBotConfig, market: dict,
     print(f"Transaction size: {len(order.get('transaction', ''))} chars")
 
     # Log order details (excluding large transaction field)
-    order_info = {k: v for k, v in order.items() if k != 'transaction'}
-    print(f"Order details: {json.dumps(order_info, indent=2)}")
+    order_info = order.copy()
+    order_info.pop('transaction', None)
+    print(f"Order details: {_dumps_pretty(order_info)}")
 
     # Execute the swap
     print("\n2. Executing swap...")
@@ -155,24 +356,13 @@ async def _execute_okx_swap_command(config: TradingBotConfig, market: dict, usd_
     """Execute OKX DEX swap"""
     from managers.okx_dex_manager import OKXDexManager
 
-    okx = OKXDexManager(
-        api_key=config.okx_api_key,
-        secret_key=config.okx_secret_key,
-        passphrase=config.okx_passphrase,
-        solana_private_key=config.solana_private_key if dex_chain == 'solana' else None,
-        bsc_private_key=config.bsc_private_key if dex_chain == 'bsc' else None,
-        max_slippage=config.max_slippage
-    )
-
     # Get token addresses based on chain
     if dex_chain == 'bsc':
         input_token = market.get('input_token')
         output_token = market.get('output_token')
-        decimals = 18  # BSC USDT
     elif dex_chain == 'solana':
         input_token = market.get('input_mint')
         output_token = market.get('output_mint')
-        decimals = 6  # Solana USDC
     else:
         print(f"❌ Unsupported chain: {dex_chain}")
         return
@@ -180,19 +370,35 @@ async def _execute_okx_swap_command(config: TradingBotConfig, market: dict, usd_
     if not input_token or not output_token:
         print(f"❌ Missing token addresses for {dex_chain} swap")
         return
+    if input_token not in USD_STABLE_INPUTS:
+        print(f"❌ Input token must be a known USD stablecoin to size the swap in USD, got: {input_token}")
+        return
+
+    okx = OKXDexManager(
+        api_key=config.okx_api_key,
+        secret_key=config.okx_secret_key,
+        passphrase=config.okx_passphrase,
+        solana_private_key=config.solana_private_key if dex_chain == 'solana' else None,
+        bsc_private_key=config.bsc_private_key if dex_chain == 'bsc' else None,
+        max_slippage=config.max_slippage,
+        solana_rpc_urls=config.solana_rpc_urls
+    )
 
     print(f"Input token: {input_token}")
     print(f"Output token: {output_token}")
 
     # Convert USD amount to token base units
-    amount = str(int(usd_amount * (10 ** decimals)))
+    amount = str(base_units(input_token, usd_amount))
     print(f"Amount: {amount} base units (${usd_amount:.2f} USD)")
 
     # Execute the swap
     print("\n1. Executing OKX DEX swap...")
     print(f"⚠️  This will actually execute the swap on {dex_chain.upper()}!")
 
-    swap_result = await okx.swap(dex_chain, input_token, output_token, amount)
+    try:
+        swap_result = await okx.swap(dex_chain, input_token, output_token, amount)
+    finally:
+        await okx.close()
 
     if not swap_result or not swap_result.get('success'):
         print("❌ Failed to execute swap")
@@ -212,6 +418,91 @@ async def _execute_okx_swap_command(config: TradingBotConfig, market: dict, usd_
         print(f"View on Solscan: {solscan_url}")
 
 
+async def _bsc_w3() -> AsyncWeb3:
+    """Return the shared BSC AsyncWeb3 instance (one HTTP session for all approvals)"""
+    global _BSC_W3, _BSC_SESSION
+    if _BSC_W3 is None:
+        provider = AsyncHTTPProvider(BSC_RPC_URL)
+        _BSC_SESSION = aiohttp.ClientSession()
+        await provider.cache_async_session(_BSC_SESSION)
+        _BSC_W3 = AsyncWeb3(provider)
+    return _BSC_W3
+
+
+def _token_contract(w3: AsyncWeb3, token_address: str):
+    """Return a cached ERC20 contract instance for a token address"""
+    address = Web3.to_checksum_address(token_address)
+    contract = _TOKEN_CONTRACTS.get(address)
+    if contract is None:
+        contract = _TOKEN_CONTRACTS[address] = w3.eth.contract(address=address, abi=ERC20_ABI)
+    return contract
+
+
+async def _peek_nonce(w3: AsyncWeb3, address: str) -> int:
+    """Next nonce for a wallet, read from the chain ('pending') only on first use"""
+    nonce = _NONCES.get(address)
+    if nonce is None:
+        nonce = _NONCES[address] = await w3.eth.get_transaction_count(address, 'pending')
+    return nonce
+
+
+async def _gas_price(w3: AsyncWeb3) -> int:
+    """Current BSC gas price, cached for GAS_PRICE_TTL seconds"""
+    global _gas_price_cache
+    fetched_at, price = _gas_price_cache
+    now = time.monotonic()
+    if price is None or now - fetched_at > GAS_PRICE_TTL:
+        price = await w3.eth.gas_price
+        _gas_price_cache = (now, price)
+    return price
+
+
+async def _wait_for_receipt(w3: AsyncWeb3, tx_hash, timeout: float = 120):
+    """Poll for a transaction receipt with backoff (1s growing to 5s)
+
+    web3's wait_for_transaction_receipt polls every 0.1s, which is hundreds of
+    RPC calls for one ~3s BSC block; this backs off between attempts.
+    """
+    delay = 1.0
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            receipt = await w3.eth.get_transaction_receipt(tx_hash)
+            if receipt:
+                return receipt
+        except TransactionNotFound:
+            pass
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.5, 5.0)
+    raise TimeExhausted(f"Transaction {tx_hash.hex()} not mined after {timeout} seconds")
+
+
+def _allowance_key(wallet: str, token: str, spender: str) -> str:
+    """Cache key for an owner/token/spender allowance"""
+    return f"{wallet}:{token}:{spender}".lower()
+
+
+def _load_allowance_cache() -> dict:
+    """Load cached allowances, or an empty dict if missing/unreadable"""
+    try:
+        with open(ALLOWANCE_CACHE_FILE) as f:
+            return json_utils.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_allowance(key: str, allowance: int):
+    """Persist the last-known allowance for a wallet/token/spender"""
+    try:
+        cache = _load_allowance_cache()
+        cache[key] = allowance
+        os.makedirs(os.path.dirname(ALLOWANCE_CACHE_FILE), exist_ok=True)
+        with open(ALLOWANCE_CACHE_FILE, 'w') as f:
+            json_utils.dump(cache, f)
+    except OSError as e:
+        logger.debug("Could not write allowance cache: %s", e)
+
+
 async def cmd_approve_token(symbol: str, config: TradingBotConfig, amount: float = None):
     """Approve token for DEX trading
 
@@ -245,8 +536,7 @@ async def cmd_approve_token(symbol: str, config: TradingBotConfig, amount: float
 
     except Exception as e:
         print(f"❌ Approval failed: {e}")
-        logger.error(f"Approval failed: {e}")
-        import traceback
+        logger.error("Approval failed: %s", e)
         traceback.print_exc()
 
 
@@ -261,68 +551,50 @@ async def _approve_bsc_token(config: TradingBotConfig, market: dict, amount: flo
 
     print(f"\nToken to approve: {token_address}")
 
-    # Initialize Web3
-    rpc_url = 'https://bsc-dataseed1.binance.org'
-    w3 = Web3(Web3.HTTPProvider(rpc_url))
+    # Shared AsyncWeb3 connection to BSC
+    w3 = await _bsc_w3()
 
     if not config.bsc_private_key:
         print("❌ BSC_PRIVATE_KEY not configured in .env")
         return
 
-    account = w3.eth.account.from_key(config.bsc_private_key)
+    account = Account.from_key(config.bsc_private_key)
     print(f"Wallet: {account.address}")
 
     # OKX DEX router address (from failed transaction)
     spender = '0x3156020dfF8D99af1dDC523ebDfb1ad2018554a0'
     print(f"Spender (OKX Router): {spender}")
 
-    # ERC20 ABI (approve function)
-    erc20_abi = [
-        {
-            "constant": False,
-            "inputs": [
-                {"name": "_spender", "type": "address"},
-                {"name": "_value", "type": "uint256"}
-            ],
-            "name": "approve",
-            "outputs": [{"name": "", "type": "bool"}],
-            "type": "function"
-        },
-        {
-            "constant": True,
-            "inputs": [
-                {"name": "_owner", "type": "address"},
-                {"name": "_spender", "type": "address"}
-            ],
-            "name": "allowance",
-            "outputs": [{"name": "", "type": "uint256"}],
-            "type": "function"
-        },
-        {
-            "constant": True,
-            "inputs": [],
-            "name": "decimals",
-            "outputs": [{"name": "", "type": "uint8"}],
-            "type": "function"
-        }
-    ]
+    # Token contract instance (cached per address)
+    token_contract = _token_contract(w3, token_address)
 
-    # Create token contract instance
-    token_contract = w3.eth.contract(
-        address=Web3.to_checksum_address(token_address),
-        abi=erc20_abi
-    )
+    spender_address = Web3.to_checksum_address(spender)
+    cache_key = _allowance_key(account.address, token_contract.address, spender_address)
+
+    # An unlimited allowance seen earlier covers any amount - skip the RPCs
+    cached_allowance = _load_allowance_cache().get(cache_key, 0)
+    if cached_allowance >= UNLIMITED_ALLOWANCE:
+        print("✓ Allowance already unlimited (cached), skipping approval tx")
+        return
+
+    # allowance, nonce, gas price (and decimals when needed) are independent
+    # reads, so issue them concurrently instead of one RPC round-trip each
+    reads = [
+        token_contract.functions.allowance(account.address, spender_address).call(),
+        _peek_nonce(w3, account.address),
+        _gas_price(w3)
+    ]
+    if amount is not None:
+        reads.append(token_contract.functions.decimals().call())
+    results = await asyncio.gather(*reads, return_exceptions=True)
+    current_allowance, nonce, gas_price = results[:3]
 
     # Check current allowance
-    try:
-        current_allowance = token_contract.functions.allowance(
-            account.address,
-            Web3.to_checksum_address(spender)
-        ).call()
-        print(f"\nCurrent allowance: {current_allowance / 1e18:.6f} tokens")
-    except Exception as e:
-        print(f"⚠️  Could not check allowance: {e}")
+    if isinstance(current_allowance, Exception):
+        print(f"⚠️  Could not check allowance: {current_allowance}")
         current_allowance = 0
+    else:
+        print(f"\nCurrent allowance: {current_allowance / 1e18:.6f} tokens")
 
     # Determine approval amount
     if amount is None:
@@ -330,23 +602,29 @@ async def _approve_bsc_token(config: TradingBotConfig, market: dict, amount: flo
         approve_amount = 2**256 - 1
         print(f"Approval amount: UNLIMITED (max uint256)")
     else:
-        # Get token decimals
-        try:
-            decimals = token_contract.functions.decimals().call()
-        except:
+        # Token decimals
+        decimals = results[3]
+        if isinstance(decimals, Exception):
             decimals = 18  # Default to 18
         approve_amount = int(amount * (10 ** decimals))
         print(f"Approval amount: {amount} tokens ({approve_amount} base units)")
 
+    if current_allowance >= approve_amount:
+        print("✓ Allowance already sufficient, skipping approval tx")
+        _save_allowance(cache_key, current_allowance)
+        return
+
     # Build approval transaction
     print("\n📝 Building approval transaction...")
 
     try:
-        nonce = w3.eth.get_transaction_count(account.address)
-        gas_price = w3.eth.gas_price
+        if isinstance(nonce, Exception):
+            raise nonce
+        if isinstance(gas_price, Exception):
+            raise gas_price
 
-        approve_txn = token_contract.functions.approve(
-            Web3.to_checksum_address(spender),
+        approve_txn = await token_contract.functions.approve(
+            spender_address,
             approve_amount
         ).build_transaction({
             'from': account.address,
@@ -361,11 +639,14 @@ async def _approve_bsc_token(config: TradingBotConfig, market: dict, amount: flo
 
         # Sign transaction
         print("\n✍️  Signing transaction...")
-        signed_txn = account.sign_transaction(approve_txn)
+        # secp256k1 signing is CPU work; keep it off the event loop
+        signed_txn = await _run(account.sign_transaction, approve_txn)
 
         # Send transaction
         print("📤 Sending transaction...")
-        tx_hash = w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+        tx_hash = await w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+        # Nonce is consumed once the node accepts the tx, whatever its outcome
+        _NONCES[account.address] = nonce + 1
         tx_hash_hex = tx_hash.hex()
 
         print(f"✓ Transaction sent: {tx_hash_hex}")
@@ -373,25 +654,27 @@ async def _approve_bsc_token(config: TradingBotConfig, market: dict, amount: flo
 
         # Wait for confirmation
         print("\n⏳ Waiting for confirmation...")
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        receipt = await _wait_for_receipt(w3, tx_hash, timeout=120)
 
         if receipt['status'] == 1:
             print(f"✅ Token approved successfully!")
             print(f"Gas used: {receipt['gasUsed']:,}")
 
             # Check new allowance
-            new_allowance = token_contract.functions.allowance(
+            new_allowance = await token_contract.functions.allowance(
                 account.address,
-                Web3.to_checksum_address(spender)
+                spender_address
             ).call()
             print(f"New allowance: {new_allowance / 1e18:.6f} tokens")
+            _save_allowance(cache_key, new_allowance)
         else:
             print(f"❌ Transaction failed!")
             print(f"Receipt: {receipt}")
 
     except Exception as e:
+        # Local nonce may be out of sync with the chain now; re-read it next time
+        _NONCES.pop(account.address, None)
         print(f"❌ Error during approval: {e}")
-        import traceback
         traceback.print_exc()
 
 
@@ -400,39 +683,51 @@ async def cmd_stop(config: TradingBotConfig):
     logger.info("🛑 Stop command - Bot stopping gracefully")
     # In a real implementation, this would signal running bot processes to stop
     # For now, just exit
-    import sys
     sys.exit(0)
 
 
 
 async def cmd_balance(symbol: str, config: TradingBotConfig):
     """Show balance of tokens and perpetual positions"""
-    print(f"\n=== Balance Check for {symbol} ===")
+    lines = [f"\n=== Balance Check for {symbol} ==="]
 
     try:
-        binance = BinanceManager(config.binance_api_key, config.binance_api_secret)
-        jupiter = JupiterSwapManager(config.solana_private_key, config.jupiter_api_url, config.jupiter_api_key, config.max_slippage)
+        client = await _get_binance(config).connect()
+        jupiter = _get_jupiter(config)
+
+        # Fetch Binance account info and positions concurrently
+        account, positions = await asyncio.gather(
+            client.futures_account(),
+            client.futures_position_information(symbol=symbol),
+            return_exceptions=True
+        )
 
-        # Get Binance futures account info
+        # Binance futures account info
         try:
-            account = binance.client.futures_account()
+            if isinstance(account, BaseException):
+                raise account
             total_balance = float(account.get('totalWalletBalance', 0))
             available_balance = float(account.get('availableBalance', 0))
             unrealized_pnl = float(account.get('totalUnrealizedProfit', 0))
 
-            print(f"💰 Binance Futures Account:")
-            print(f"   Total Balance: ${total_balance:.2f} USDT")
-            print(f"   Available: ${available_balance:.2f} USDT")
-            print(f"   Unrealized PnL: ${unrealized_pnl:.2f} USDT")
+            lines.append(f"💰 Binance Futures Account:")
+            lines.append(f"   Total Balance: ${total_balance:.2f} USDT")
+            lines.append(f"   Available: ${available_balance:.2f} USDT")
+            lines.append(f"   Unrealized PnL: ${unrealized_pnl:.2f} USDT")
+        except Exception as e:
+            lines.append(f"❌ Error getting Binance balance: {e}")
+            logger.error("Error getting Binance balance: %s", e)
 
-            # Get positions for the specific symbol
-            positions = binance.client.futures_position_information(symbol=symbol)
+        # Positions for the specific symbol
+        try:
+            if isinstance(positions, BaseException):
+                raise positions
             for pos in positions:
                 if float(pos['positionAmt']) != 0:
-                    print(f"   {symbol} Position: {pos['positionAmt']} @ ${pos['entryPrice']} (PnL: ${pos['unRealizedProfit']})")
+                    lines.append(f"   {symbol} Position: {pos['positionAmt']} @ ${pos['entryPrice']} (PnL: ${pos['unRealizedProfit']})")
         except Exception as e:
-            print(f"❌ Error getting Binance balance: {e}")
-            logger.error(f"Error getting Binance balance: {e}")
+            lines.append(f"❌ Error getting Binance positions: {e}")
+            logger.error("Error getting Binance positions: %s", e)
 
         # Get Solana wallet balance
         try:
@@ -442,23 +737,26 @@ async def cmd_balance(symbol: str, config: TradingBotConfig):
                 input_mint = market['input_mint']
                 output_mint = market['output_mint']
             except (ValueError, KeyError) as e:
-                print(f"⚠️  Could not load market config for {symbol}: {e}")
+                lines.append(f"⚠️  Could not load market config for {symbol}: {e}")
                 input_mint = "N/A"
                 output_mint = "N/A"
 
-            print(f"🔗 Solana Wallet: {str(jupiter.keypair.pubkey())}")
-            print(f"   Input Token (USDC): {input_mint}")
-            print(f"   Output Token: {output_mint}")
+            lines.append(f"🔗 Solana Wallet: {str(jupiter.keypair.pubkey())}")
+            lines.append(f"   Input Token (USDC): {input_mint}")
+            lines.append(f"   Output Token: {output_mint}")
             # Note: Getting actual token balances requires additional RPC calls
-            print("   (Use Solscan to view detailed token balances)")
+            lines.append("   (Use Solscan to view detailed token balances)")
 
         except Exception as e:
-            print(f"❌ Error getting Solana balance: {e}")
-            logger.error(f"Error getting Solana balance: {e}")
+            lines.append(f"❌ Error getting Solana balance: {e}")
+            logger.error("Error getting Solana balance: %s", e)
 
     except Exception as e:
-        print(f"❌ Balance check failed: {e}")
-        logger.error(f"Balance check failed: {e}")
+        lines.append(f"❌ Balance check failed: {e}")
+        logger.error("Balance check failed: %s", e)
+
+    finally:
+        _write_lines(lines)
 
 
 
@@ -467,14 +765,14 @@ async def cmd_orders(symbol: str, config: TradingBotConfig):
     print(f"\n=== Open Orders for {symbol} ===")
 
     try:
-        binance = BinanceManager(config.binance_api_key, config.binance_api_secret)
-        orders = binance.client.futures_get_open_orders(symbol=symbol)
+        client = await _get_binance(config).connect()
+        orders = await client.futures_get_open_orders(symbol=symbol)
 
         if not orders:
             print("📭 No open orders")
             return
 
-        print(f"📋 Found {len(orders)} open order(s):")
+        lines = [f"📋 Found {len(orders)} open order(s):"]
         for order in orders:
             side = order['side']
             quantity = order['origQty']
@@ -482,39 +780,91 @@ async def cmd_orders(symbol: str, config: TradingBotConfig):
             order_id = order['orderId']
             time_created = order['time']
 
-            print(f"   OrderID: {order_id} | {side} {quantity} {symbol} @ ${price} | Created: {time_created}")
+            lines.append(f"   OrderID: {order_id} | {side} {quantity} {symbol} @ ${price} | Created: {time_created}")
+        _write_lines(lines)
 
     except Exception as e:
         print(f"❌ Error getting orders: {e}")
-        logger.error(f"Error getting orders: {e}")
+        logger.error("Error getting orders: %s", e)
+
+
+
+async def _snapshot(symbol: str, config: TradingBotConfig, include_account: bool = False) -> dict:
+    """Fetch positions and open orders (and optionally the account) in one concurrent read
+
+    Returns:
+        dict with 'positions', 'open_orders' and, if requested, 'account'
+    """
+    client = await _get_binance(config).connect()
+    calls = [
+        client.futures_position_information(symbol=symbol),
+        client.futures_get_open_orders(symbol=symbol)
+    ]
+    if include_account:
+        calls.append(client.futures_account())
+    results = await asyncio.gather(*calls)
 
+    snapshot = {'positions': results[0], 'open_orders': results[1]}
+    if include_account:
+        snapshot['account'] = results[2]
+    return snapshot
 
 
-async def cmd_close_all(symbol: str, config: TradingBotConfig):
-    """Close all open orders"""
+async def cmd_close_all(symbol: str, config: TradingBotConfig, orders: list = None):
+    """Close all open orders
+
+    Args:
+        symbol: Trading symbol
+        config: Bot configuration
+        orders: Open orders already fetched by the caller (skips the re-fetch)
+    """
     print(f"\n=== Closing All Orders for {symbol} ===")
 
     try:
-        binance = BinanceManager(config.binance_api_key, config.binance_api_secret)
-        orders = binance.client.futures_get_open_orders(symbol=symbol)
+        client = await _get_binance(config).connect()
+        if orders is None:
+            orders = await client.futures_get_open_orders(symbol=symbol)
 
         if not orders:
             print("📭 No open orders to close")
             return
 
         print(f"🗑️  Closing {len(orders)} order(s)...")
-        for order in orders:
-            try:
-                result = binance.client.futures_cancel_order(symbol=symbol, orderId=order['orderId'])
-                print(f"   ✅ Cancelled OrderID: {order['orderId']}")
-                orders_logger.info(f"ORDER_CANCELLED | Symbol: {symbol} | OrderID: {order['orderId']} | Reason: Manual_Close_All")
-            except Exception as e:
-                print(f"   ❌ Failed to cancel OrderID {order['orderId']}: {e}")
-                logger.error(f"Failed to cancel OrderID {order['orderId']}: {e}")
+        order_ids = [order['orderId'] for order in orders]
+        log_cancel = orders_logger.info
+        log_err = logger.error
+
+        # One DELETE /fapi/v1/allOpenOrders instead of a request per order
+        try:
+            await client.futures_cancel_all_open_orders(symbol=symbol)
+            for order_id in order_ids:
+                print(f"   ✅ Cancelled OrderID: {order_id}")
+                log_cancel("ORDER_CANCELLED | Symbol: %s | OrderID: %s | Reason: Manual_Close_All", symbol, order_id)
+            return
+        except Exception as e:
+            print(f"⚠️  Cancel-all failed ({e}), cancelling orders individually...")
+            log_err("Cancel-all failed for %s, falling back to per-order cancels: %s", symbol, e)
+
+        # Fallback: cancel concurrently, capped to stay inside Binance's request weight limits
+        semaphore = asyncio.Semaphore(CANCEL_CONCURRENCY)
+
+        async def cancel(order_id):
+            async with semaphore:
+                return await client.futures_cancel_order(symbol=symbol, orderId=order_id)
+
+        results = await asyncio.gather(*(cancel(order_id) for order_id in order_ids), return_exceptions=True)
+
+        for order_id, result in zip(order_ids, results):
+            if isinstance(result, BaseException):
+                print(f"   ❌ Failed to cancel OrderID {order_id}: {result}")
+                log_err("Failed to cancel OrderID %s: %s", order_id, result)
+            else:
+                print(f"   ✅ Cancelled OrderID: {order_id}")
+                log_cancel("ORDER_CANCELLED | Symbol: %s | OrderID: %s | Reason: Manual_Close_All", symbol, order_id)
 
     except Exception as e:
         print(f"❌ Error closing orders: {e}")
-        logger.error(f"Error closing orders: {e}")
+        logger.error("Error closing orders: %s", e)
 
 
 
@@ -524,349 +874,405 @@ async def cmd_liquidate(symbol: str, config: TradingBotConfig):
     print("⚠️  This will close all positions and may result in losses!")
 
     try:
-        binance = BinanceManager(config.binance_api_key, config.binance_api_secret)
+        client = await _get_binance(config).connect()
 
-        # Close all open orders first
-        await cmd_close_all(symbol, config)
+        # One shared read of positions and open orders; nothing else to do when flat
+        snapshot = await _snapshot(symbol, config)
+        open_orders = snapshot['open_orders']
+        open_positions = [pos for pos in snapshot['positions'] if float(pos['positionAmt']) != 0]
+
+        if not open_positions and not open_orders:
+            print("📭 No open orders or positions - nothing to liquidate")
+            return
 
-        # Get current positions
-        positions = binance.client.futures_position_information(symbol=symbol)
+        # Close all open orders first
+        if open_orders:
+            await cmd_close_all(symbol, config, orders=open_orders)
 
-        for pos in positions:
+        async def close_position(pos):
             position_amt = float(pos['positionAmt'])
-            if position_amt != 0:
-                # Close position with market order
-                side = 'BUY' if position_amt < 0 else 'SELL'  # Opposite side to close
-                quantity = abs(position_amt)
-
-                try:
-                    order = binance.client.futures_create_order(
-                        symbol=symbol,
-                        side=side,
-                        type='MARKET',
-                        quantity=quantity
-                    )
-                    print(f"   ✅ Closed position: {side} {quantity} {symbol} (OrderID: {order['orderId']})")
-                    trades_logger.info(f"POSITION_CLOSED | Symbol: {symbol} | Binance_OrderID: {order['orderId']} | Side: {side} | Quantity: {quantity} | Type: MARKET | Reason: Liquidation")
-                except Exception as e:
-                    print(f"   ❌ Failed to close position: {e}")
-                    logger.error(f"Failed to close position: {e}")
+            # Close position with market order
+            side = 'BUY' if position_amt < 0 else 'SELL'  # Opposite side to close
+            quantity = abs(position_amt)
+
+            try:
+                order = await client.futures_create_order(
+                    symbol=symbol,
+                    side=side,
+                    type='MARKET',
+                    quantity=quantity
+                )
+                print(f"   ✅ Closed position: {side} {quantity} {symbol} (OrderID: {order['orderId']})")
+                trades_logger.info("POSITION_CLOSED | Symbol: %s | Binance_OrderID: %s | Side: %s | Quantity: %s | Type: MARKET | Reason: Liquidation", symbol, order['orderId'], side, quantity)
+            except Exception as e:
+                print(f"   ❌ Failed to close position: {e}")
+                logger.error("Failed to close position: %s", e)
+
+        await asyncio.gather(*(close_position(pos) for pos in open_positions))
 
         # Note: Solana token liquidation would require additional implementation
         print("💡 Note: Solana token liquidation requires manual implementation via Jupiter")
 
     except Exception as e:
         print(f"❌ Liquidation failed: {e}")
-        logger.error(f"Liquidation failed: {e}")
+        logger.error("Liquidation failed: %s", e)
 
 
 
-async def interactive_mode(config: TradingBotConfig):
-    """Interactive command mode - wait for user commands"""
-    current_symbol = 'PIPPINUSDT'
-    current_amount = 100.0
-    current_markup = config.mark_up_percent
-    current_threshold = config.price_change_threshold
-    current_slippage = config.max_slippage
-    current_no_hedge = config.no_hedge_mode
-    running_bot = None
-
-    hedge_status = "OFF (CEX-only)" if current_no_hedge else "ON (full arbitrage)"
-    print(f"""
-╔══════════════════════════════════════╗
-║        Meme Arbitrage Bot v2.0       ║
-║     Interactive Command Interface    ║
-╚══════════════════════════════════════╝
+class ReplContext:
+    """Mutable state shared by the interactive command handlers"""
+    __slots__ = ('config', 'symbol', 'amount', 'markup', 'threshold', 'slippage',
+                 'no_hedge', 'running_bot', 'bot_task', 'settings_cache', 'done')
+
+    def __init__(self, config: TradingBotConfig):
+        self.config = config
+        self.symbol = 'PIPPINUSDT'
+        self.amount = 100.0
+        self.markup = config.mark_up_percent
+        self.threshold = config.price_change_threshold
+        self.slippage = config.max_slippage
+        self.no_hedge = config.no_hedge_mode
+        self.running_bot = None
+        self.bot_task = None
+        self.settings_cache = None  # formatted 'show' block, rebuilt after a 'set'
+        self.done = False
 
+
+async def _cmd_quit(parts: List[str], ctx: ReplContext):
+    if ctx.running_bot:
+        print("⚠️  Bot is still running. Use 'stop' command first.")
+        return
+
+    # Check for open orders before quitting
+    try:
+        client = await _get_binance(ctx.config).connect()
+        open_orders = await client.futures_get_open_orders(symbol=ctx.symbol)
+
+        if open_orders:
+            lines = [f"\n⚠️  You have {len(open_orders)} open order(s) for {ctx.symbol}:"]
+            for order in open_orders:
+                lines.append(f"   OrderID: {order['orderId']} | {order['side']} {order['origQty']} @ ${order['price']}")
+            _write_lines(lines)
+
+            close_orders = await _ainput("\n🗑️  Close all orders before exit? (yes/no): ")
+            if close_orders.lower() in CONFIRM:
+                await cmd_close_all(ctx.symbol, ctx.config, orders=open_orders)
+                print("✅ All orders closed")
+            else:
+                print("ℹ️  Orders left open")
+    except Exception as e:
+        logger.error("Error checking orders on exit: %s", e)
+
+    print("👋 Goodbye!")
+    ctx.done = True
+
+
+async def _cmd_help(parts: List[str], ctx: ReplContext):
+    sys.stdout.write(HELP_TEXT)
+
+
+async def _cmd_status(parts: List[str], ctx: ReplContext):
+    if ctx.running_bot:
+        print(f"🟢 Bot is RUNNING - {ctx.symbol} ${ctx.amount:.2f} USD")
+    else:
+        print(f"🔴 Bot is STOPPED - Settings: {ctx.symbol} ${ctx.amount:.2f} USD")
+
+
+async def _cmd_recent(parts: List[str], ctx: ReplContext):
+    if ctx.running_bot and ctx.running_bot.status_display:
+        ctx.running_bot.status_display.display()
+    else:
+        print("ℹ️  Bot is not running. No recent actions to display.")
+
+
+async def _cmd_price(parts: List[str], ctx: ReplContext):
+    try:
+        if ctx.running_bot and ctx.running_bot.cex.current_price:
+            # Use cached price from running bot
+            price = ctx.running_bot.cex.current_price
+            print(f"💰 Current {ctx.symbol} price: ${price:.8f}")
+        else:
+            # Fetch fresh price
+            price = await _get_binance(ctx.config).get_current_price_async(ctx.symbol)
+            if price:
+                print(f"💰 Current {ctx.symbol} price: ${price:.8f}")
+            else:
+                print(f"❌ Failed to get price for {ctx.symbol}")
+    except Exception as e:
+        print(f"❌ Error getting price: {e}")
+
+
+async def _cmd_show(parts: List[str], ctx: ReplContext):
+    if ctx.settings_cache is None:
+        hedge_status = "OFF (CEX-only)" if ctx.no_hedge else "ON (full arbitrage)"
+        ctx.settings_cache = f"""
 Current Settings:
-  Symbol: {current_symbol} | USD: ${current_amount:.2f} | Markup: {current_markup:.4f}% | Threshold: {current_threshold:.4f}% | Slippage: {current_slippage:.4f}%
+  Symbol: {ctx.symbol}
+  USD Amount: ${ctx.amount:.2f} (used for both Binance perps and Jupiter DEX)
+  Markup: {ctx.markup:.4f}% (perp order above market price)
+  Threshold: {ctx.threshold:.4f}% (price change to update orders)
+  Slippage: {ctx.slippage:.4f}% (max slippage for Jupiter swaps)
   Hedging: {hedge_status}
+"""
+    print(f"{ctx.settings_cache}  Bot Status: {'🟢 RUNNING' if ctx.running_bot else '🔴 STOPPED'}\n")
 
-Type 'help' for available commands or 'quit' to exit.
-""")
 
-    while True:
-        try:
-            # Use async input to allow bot tasks to run concurrently
-            loop = asyncio.get_event_loop()
-            command = await loop.run_in_executor(None, input, f"[{current_symbol}] $ ")
-            command = command.strip().lower()
+def _parse_setting(ctx: ReplContext, raw: str, name: str, low: float, high: float, low_label: str, example: str) -> Optional[float]:
+    """Parse a bounded float setting; returns None after printing why it was rejected"""
+    try:
+        value = float(raw)
+    except ValueError:
+        print(f"❌ Invalid {name}. Use decimal format (e.g., {example})")
+        return None
+    if value <= low or value > high:
+        print(f"❌ {name.capitalize()} must be between {low_label}% and {high:g}%")
+        return None
+    if ctx.running_bot:
+        print(f"⚠️  Cannot change {name} while bot is running. Use 'stop' first.")
+        return None
+    return value
+
+
+async def _set_symbol(value: str, ctx: ReplContext):
+    if ctx.running_bot:
+        print("⚠️  Cannot change symbol while bot is running. Use 'stop' first.")
+        return
+    ctx.symbol = value.upper()
+    ctx.settings_cache = None
+    print(f"✅ Symbol changed to {ctx.symbol}")
 
-            if not command:
-                continue
 
-            parts = command.split()
-            cmd = parts[0]
-
-            if cmd in ['quit', 'exit', 'q']:
-                if running_bot:
-                    print("⚠️  Bot is still running. Use 'stop' command first.")
-                    continue
-
-                # Check for open orders before quitting
-                try:
-                    binance = BinanceManager(config.binance_api_key, config.binance_api_secret)
-                    open_orders = binance.get_open_orders(current_symbol)
-
-                    if open_orders:
-                        print(f"\n⚠️  You have {len(open_orders)} open order(s) for {current_symbol}:")
-                        for order in open_orders:
-                            print(f"   OrderID: {order['orderId']} | {order['side']} {order['origQty']} @ ${order['price']}")
-
-                        close_orders = await loop.run_in_executor(None, input, "\n🗑️  Close all orders before exit? (yes/no): ")
-                        if close_orders.lower() in ['yes', 'y']:
-                            await cmd_close_all(current_symbol, config)
-                            print("✅ All orders closed")
-                        else:
-                            print("ℹ️  Orders left open")
-                except Exception as e:
-                    logger.error(f"Error checking orders on exit: {e}")
-
-                print("👋 Goodbye!")
-                break
-
-            elif cmd == 'help':
-                print("""
-Available Commands:
+async def _set_amount(value: str, ctx: ReplContext):
+    try:
+        new_amount = float(value)
+    except ValueError:
+        print("❌ Invalid amount. Use decimal format (e.g., 25.0)")
+        return
+    if new_amount <= 0:
+        print("❌ Amount must be positive")
+        return
+    if ctx.running_bot:
+        print("⚠️  Cannot change amount while bot is running. Use 'stop' first.")
+        return
+    ctx.amount = new_amount
+    ctx.settings_cache = None
+    print(f"✅ USD amount changed to ${ctx.amount:.2f}")
 
-📊 MONITORING:
-  balance          - Show account balances and positions
-  orders           - List all open orders
-  status           - Show current bot status
-  recent           - Show last 10 bot actions and current state
-  price            - Get current market price
 
-🤖 TRADING:
-  start            - Start arbitrage bot with current settings
-  stop             - Stop running arbitrage bot
-  cex-order <amt> [price] - Place CEX order (e.g., cex-order 10 or cex-order 10 0.42)
-  dex-swap <amt>   - Execute DEX swap (e.g., dex-swap 10)
+async def _set_markup(value: str, ctx: ReplContext):
+    new_markup = _parse_setting(ctx, value, 'markup', 0, 50, '0.1', '3.5')
+    if new_markup is None:
+        return
+    ctx.markup = ctx.config.mark_up_percent = new_markup
+    ctx.settings_cache = None
+    print(f"✅ Markup changed to {ctx.markup:.4f}%")
 
-⚙️  SETTINGS:
-  set symbol <SYM> - Change trading symbol (e.g., set symbol PIPPINUSDT)
-  set amount <USD> - Change USD amount for both CEX and DEX (e.g., set amount 50.0)
-  set markup <PCT> - Change perp order markup % above market (e.g., set markup 4.0)
-  set threshold <PCT> - Change price change threshold % for order updates (e.g., set threshold 0.3)
-  set slippage <PCT> - Change max slippage % for Jupiter swaps (e.g., set slippage 1.5)
-  set nohedge <on/off> - Toggle no-hedge mode (CEX-only, skip DEX hedging)
-  show             - Show current settings
 
-🛡️  RISK MANAGEMENT:
-  close-all        - Cancel all open orders
-  liquidate        - Emergency: close all positions (⚠️ CAUTION)
+async def _set_threshold(value: str, ctx: ReplContext):
+    new_threshold = _parse_setting(ctx, value, 'threshold', 0, 10, '0.1', '0.5')
+    if new_threshold is None:
+        return
+    ctx.threshold = ctx.config.price_change_threshold = new_threshold
+    ctx.settings_cache = None
+    print(f"✅ Price change threshold changed to {ctx.threshold:.1f}%")
 
-💡 EXAMPLES:
-  price            - Check current market price
-  start            - Start bot with current settings
-  recent           - View last 10 bot actions
-  set symbol SOLUSDT - Change to SOLUSDT
-  set amount 25.0  - Trade with $25 USD
-  set markup 5.0   - 5% markup for volatile tokens
-  set threshold 0.2 - Update orders on 0.2% price moves
-  set slippage 2.0 - Allow 2% slippage for low liquidity
-  balance          - Check account status
-  stop             - Stop the bot
-""")
 
-            elif cmd == 'status':
-                if running_bot:
-                    print(f"🟢 Bot is RUNNING - {current_symbol} ${current_amount:.2f} USD")
-                else:
-                    print(f"🔴 Bot is STOPPED - Settings: {current_symbol} ${current_amount:.2f} USD")
-
-            elif cmd == 'recent':
-                if running_bot and running_bot.status_display:
-                    running_bot.status_display.display()
-                else:
-                    print("ℹ️  Bot is not running. No recent actions to display.")
-
-            elif cmd == 'price':
-                try:
-                    if running_bot and running_bot.cex.current_price:
-                        # Use cached price from running bot
-                        price = running_bot.cex.current_price
-                        print(f"💰 Current {current_symbol} price: ${price:.8f}")
-                    else:
-                        # Fetch fresh price
-                        binance = BinanceManager(config.binance_api_key, config.binance_api_secret)
-                        price = binance.get_current_price(current_symbol)
-                        if price:
-                            print(f"💰 Current {current_symbol} price: ${price:.8f}")
-                        else:
-                            print(f"❌ Failed to get price for {current_symbol}")
-                except Exception as e:
-                    print(f"❌ Error getting price: {e}")
-
-            elif cmd == 'show':
-                hedge_status = "OFF (CEX-only)" if current_no_hedge else "ON (full arbitrage)"
-                print(f"""
-Current Settings:
-  Symbol: {current_symbol}
-  USD Amount: ${current_amount:.2f} (used for both Binance perps and Jupiter DEX)
-  Markup: {current_markup:.4f}% (perp order above market price)
-  Threshold: {current_threshold:.4f}% (price change to update orders)
-  Slippage: {current_slippage:.4f}% (max slippage for Jupiter swaps)
+async def _set_slippage(value: str, ctx: ReplContext):
+    new_slippage = _parse_setting(ctx, value, 'slippage', 0, 20, '0.1', '1.5')
+    if new_slippage is None:
+        return
+    ctx.slippage = ctx.config.max_slippage = new_slippage
+    ctx.settings_cache = None
+    print(f"✅ Max slippage changed to {ctx.slippage:.4f}%")
+
+
+async def _set_nohedge(value: str, ctx: ReplContext):
+    value = value.lower()
+    if value in TRUTHY:
+        enabled = True
+    elif value in FALSY:
+        enabled = False
+    else:
+        print("❌ Invalid value. Use: on/off, true/false, yes/no, 1/0")
+        return
+    if ctx.running_bot:
+        print("⚠️  Cannot change hedge mode while bot is running. Use 'stop' first.")
+        return
+    ctx.no_hedge = ctx.config.no_hedge_mode = enabled
+    ctx.settings_cache = None
+    if enabled:
+        print("✅ No-hedge mode ENABLED: Bot will place CEX orders but skip DEX hedging")
+    else:
+        print("✅ No-hedge mode DISABLED: Bot will execute full arbitrage (CEX + DEX)")
+
+
+SET_HANDLERS: Dict[str, Callable[[str, ReplContext], Awaitable[None]]] = {
+    'symbol': _set_symbol,
+    'amount': _set_amount,
+    'markup': _set_markup,
+    'threshold': _set_threshold,
+    'slippage': _set_slippage,
+    'nohedge': _set_nohedge,
+}
+
+
+async def _cmd_set(parts: List[str], ctx: ReplContext):
+    if len(parts) < 3:
+        print(f"❌ Unknown command '{parts[0].lower()}'. Type 'help' for available commands.")
+        return
+    handler = SET_HANDLERS.get(parts[1].lower())
+    if handler:
+        await handler(parts[2], ctx)
+    else:
+        print("❌ Unknown setting. Use: set symbol|amount|markup|threshold|slippage|nohedge <value>")
+
+
+def _report_bot_exit(task: asyncio.Task):
+    """Surface a background bot crash instead of letting it die silently"""
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error("Bot task crashed: %s", exc, exc_info=exc)
+        print(f"\n❌ Bot stopped with an error: {exc}")
+
+
+async def _cmd_start(parts: List[str], ctx: ReplContext):
+    if ctx.running_bot:
+        print("⚠️  Bot is already running. Use 'stop' first to restart.")
+        return
+    print(f"🚀 Starting arbitrage bot: {ctx.symbol} ${ctx.amount:.2f} USD")
+    ctx.running_bot = TradingBot(ctx.symbol, ctx.amount, ctx.config)
+    # Start bot in background task; keep a reference so it isn't collected
+    ctx.bot_task = asyncio.create_task(ctx.running_bot.start())
+    ctx.bot_task.add_done_callback(_report_bot_exit)
+    print("✅ Bot started in background! Use 'stop' to halt trading.")
+
+
+async def _cmd_stop(parts: List[str], ctx: ReplContext):
+    if ctx.running_bot:
+        ctx.running_bot.running = False
+        ctx.running_bot = None
+        # The streams block in recv(); cancel the task so its sockets and
+        # sessions are closed (start() cleans up in a finally)
+        if ctx.bot_task:
+            ctx.bot_task.cancel()
+            await asyncio.gather(ctx.bot_task, return_exceptions=True)
+            ctx.bot_task = None
+        print("🛑 Bot stopped successfully")
+    else:
+        print("ℹ️  Bot is not running")
+
+
+async def _cmd_balance(parts: List[str], ctx: ReplContext):
+    await cmd_balance(ctx.symbol, ctx.config)
+
+
+async def _cmd_orders(parts: List[str], ctx: ReplContext):
+    await cmd_orders(ctx.symbol, ctx.config)
+
+
+async def _cmd_close_all(parts: List[str], ctx: ReplContext):
+    await cmd_close_all(ctx.symbol, ctx.config)
+
+
+async def _cmd_liquidate(parts: List[str], ctx: ReplContext):
+    confirm = await _ainput("⚠️  WARNING: This will close all positions! Type 'YES' to confirm: ")
+    if confirm == 'YES':
+        await cmd_liquidate(ctx.symbol, ctx.config)
+    else:
+        print("❌ Liquidation cancelled")
+
+
+async def _cmd_cex_order(parts: List[str], ctx: ReplContext):
+    # Parse amount and optional price
+    if len(parts) < 2:
+        print("❌ Usage: cex-order <amount> [price]")
+        return
+    try:
+        amount = float(parts[1])
+        price = float(parts[2]) if len(parts) >= 3 else None
+    except ValueError:
+        print("❌ Invalid amount or price. Usage: cex-order <amount> [price]")
+        return
+    await test_binance_order(ctx.symbol, amount, ctx.config, price)
+
+
+async def _cmd_dex_swap(parts: List[str], ctx: ReplContext):
+    # Parse amount
+    if len(parts) < 2:
+        print("❌ Usage: dex-swap <amount>")
+        return
+    try:
+        amount = float(parts[1])
+    except ValueError:
+        print("❌ Invalid amount. Usage: dex-swap <amount>")
+        return
+    await test_jupiter_swap(ctx.config, amount, ctx.symbol)
+
+
+async def _cmd_test_binance(parts: List[str], ctx: ReplContext):
+    await test_binance_order(ctx.symbol, ctx.amount, ctx.config)
+
+
+async def _cmd_test_jupiter(parts: List[str], ctx: ReplContext):
+    await test_jupiter_swap(ctx.config)
+
+
+COMMANDS: Dict[str, Callable[[List[str], ReplContext], Awaitable[None]]] = {
+    'quit': _cmd_quit,
+    'exit': _cmd_quit,
+    'q': _cmd_quit,
+    'help': _cmd_help,
+    'status': _cmd_status,
+    'recent': _cmd_recent,
+    'price': _cmd_price,
+    'show': _cmd_show,
+    'set': _cmd_set,
+    'start': _cmd_start,
+    'stop': _cmd_stop,
+    'balance': _cmd_balance,
+    'orders': _cmd_orders,
+    'close-all': _cmd_close_all,
+    'liquidate': _cmd_liquidate,
+    'cex-order': _cmd_cex_order,
+    'dex-swap': _cmd_dex_swap,
+    'test-binance': _cmd_test_binance,
+    'test-jupiter': _cmd_test_jupiter,
+}
+
+
+async def interactive_mode(config: TradingBotConfig):
+    """Interactive command mode - wait for user commands"""
+    ctx = ReplContext(config)
+
+    hedge_status = "OFF (CEX-only)" if ctx.no_hedge else "ON (full arbitrage)"
+    sys.stdout.write(BANNER_TEXT)
+    print(f"""Current Settings:
+  Symbol: {ctx.symbol} | USD: ${ctx.amount:.2f} | Markup: {ctx.markup:.4f}% | Threshold: {ctx.threshold:.4f}% | Slippage: {ctx.slippage:.4f}%
   Hedging: {hedge_status}
-  Bot Status: {'🟢 RUNNING' if running_bot else '🔴 STOPPED'}
+
+Type 'help' for available commands or 'quit' to exit.
 """)
 
-            elif cmd == 'set' and len(parts) >= 3:
-                if parts[1] == 'symbol':
-                    new_symbol = parts[2].upper()
-                    if running_bot:
-                        print("⚠️  Cannot change symbol while bot is running. Use 'stop' first.")
-                    else:
-                        current_symbol = new_symbol
-                        print(f"✅ Symbol changed to {current_symbol}")
-
-                elif parts[1] == 'amount':
-                    try:
-                        new_amount = float(parts[2])
-                        if new_amount <= 0:
-                            print("❌ Amount must be positive")
-                            continue
-                        if running_bot:
-                            print("⚠️  Cannot change amount while bot is running. Use 'stop' first.")
-                        else:
-                            current_amount = new_amount
-                            print(f"✅ USD amount changed to ${current_amount:.2f}")
-                    except ValueError:
-                        print("❌ Invalid amount. Use decimal format (e.g., 25.0)")
-
-                elif parts[1] == 'markup':
-                    try:
-                        new_markup = float(parts[2])
-                        if new_markup <= 0 or new_markup > 50:
-                            print("❌ Markup must be between 0.1% and 50%")
-                            continue
-                        if running_bot:
-                            print("⚠️  Cannot change markup while bot is running. Use 'stop' first.")
-                        else:
-                            current_markup = new_markup
-                            config.mark_up_percent = new_markup
-                            print(f"✅ Markup changed to {current_markup:.4f}%")
-                    except ValueError:
-                        print("❌ Invalid markup. Use decimal format (e.g., 3.5)")
-
-                elif parts[1] == 'threshold':
-                    try:
-                        new_threshold = float(parts[2])
-                        if new_threshold <= 0 or new_threshold > 10:
-                            print("❌ Threshold must be between 0.1% and 10%")
-                            continue
-                        if running_bot:
-                            print("⚠️  Cannot change threshold while bot is running. Use 'stop' first.")
-                        else:
-                            current_threshold = new_threshold
-                            config.price_change_threshold = new_threshold
-                            print(f"✅ Price change threshold changed to {current_threshold:.1f}%")
-                    except ValueError:
-                        print("❌ Invalid threshold. Use decimal format (e.g., 0.5)")
-
-                elif parts[1] == 'slippage':
-                    try:
-                        new_slippage = float(parts[2])
-                        if new_slippage <= 0 or new_slippage > 20:
-                            print("❌ Slippage must be between 0.1% and 20%")
-                            continue
-                        if running_bot:
-                            print("⚠️  Cannot change slippage while bot is running. Use 'stop' first.")
-                        else:
-                            current_slippage = new_slippage
-                            config.max_slippage = new_slippage
-                            print(f"✅ Max slippage changed to {current_slippage:.4f}%")
-                    except ValueError:
-                        print("❌ Invalid slippage. Use decimal format (e.g., 1.5)")
-
-                elif parts[1] == 'nohedge':
-                    if parts[2] in ['on', 'true', '1', 'yes']:
-                        if running_bot:
-                            print("⚠️  Cannot change hedge mode while bot is running. Use 'stop' first.")
-                        else:
-                            current_no_hedge = True
-                            config.no_hedge_mode = True
-                            print("✅ No-hedge mode ENABLED: Bot will place CEX orders but skip DEX hedging")
-                    elif parts[2] in ['off', 'false', '0', 'no']:
-                        if running_bot:
-                            print("⚠️  Cannot change hedge mode while bot is running. Use 'stop' first.")
-                        else:
-                            current_no_hedge = False
-                            config.no_hedge_mode = False
-                            print("✅ No-hedge mode DISABLED: Bot will execute full arbitrage (CEX + DEX)")
-                    else:
-                        print("❌ Invalid value. Use: on/off, true/false, yes/no, 1/0")
-
-                else:
-                    print("❌ Unknown setting. Use: set symbol|amount|markup|threshold|slippage|nohedge <value>")
-
-            elif cmd == 'start':
-                if running_bot:
-                    print("⚠️  Bot is already running. Use 'stop' first to restart.")
-                else:
-                    print(f"🚀 Starting arbitrage bot: {current_symbol} ${current_amount:.2f} USD")
-                    running_bot = TradingBot(current_symbol, current_amount, config)
-                    # Start bot in background task
-                    asyncio.create_task(running_bot.start())
-                    print("✅ Bot started in background! Use 'stop' to halt trading.")
-
-            elif cmd == 'stop':
-                if running_bot:
-                    running_bot.running = False
-                    running_bot = None
-                    print("🛑 Bot stopped successfully")
-                else:
-                    print("ℹ️  Bot is not running")
-
-            elif cmd == 'balance':
-                await cmd_balance(current_symbol, config)
-
-            elif cmd == 'orders':
-                await cmd_orders(current_symbol, config)
-
-            elif cmd == 'close-all':
-                await cmd_close_all(current_symbol, config)
-
-            elif cmd == 'liquidate':
-                confirm = await loop.run_in_executor(None, input, "⚠️  WARNING: This will close all positions! Type 'YES' to confirm: ")
-                if confirm == 'YES':
-                    await cmd_liquidate(current_symbol, config)
-                else:
-                    print("❌ Liquidation cancelled")
-
-            elif cmd == 'cex-order':
-                # Parse amount and optional price
-                if len(parts) < 2:
-                    print("❌ Usage: cex-order <amount> [price]")
-                    continue
-                try:
-                    amount = float(parts[1])
-                    price = float(parts[2]) if len(parts) >= 3 else None
-                    await test_binance_order(current_symbol, amount, config, price)
-                except ValueError:
-                    print("❌ Invalid amount or price. Usage: cex-order <amount> [price]")
-
-            elif cmd == 'dex-swap':
-                # Parse amount
-                if len(parts) < 2:
-                    print("❌ Usage: dex-swap <amount>")
-                    continue
-                try:
-                    amount = float(parts[1])
-                    await test_jupiter_swap(config, amount, current_symbol)
-                except ValueError:
-                    print("❌ Invalid amount. Usage: dex-swap <amount>")
-
-            elif cmd == 'test-binance':
-                await test_binance_order(current_symbol, current_amount, config)
-
-            elif cmd == 'test-jupiter':
-                await test_jupiter_swap(config)
+    while not ctx.done:
+        try:
+            # Use async input to allow bot tasks to run concurrently
+            command = await _ainput(f"[{ctx.symbol}] $ ")
 
+            parts = command.split()
+            if not parts:
+                continue
+            cmd = parts[0].lower()
+
+            handler = COMMANDS.get(cmd)
+            if handler:
+                await handler(parts, ctx)
             else:
                 print(f"❌ Unknown command '{cmd}'. Type 'help' for available commands.")
 
         except KeyboardInterrupt:
-            if running_bot:
+            if ctx.running_bot:
                 print("\n⚠️  Bot is still running. Use 'stop' command first.")
                 continue
             print("\n👋 Goodbye!")
@@ -877,5 +1283,4 @@ Current Settings:
         except Exception as e:
             print(f"❌ Error: {e}")
 
-
-
+    await close_managers()
@@ -2,26 +2,42 @@
 Trading bot configuration
 """
 import os
-import json
+from functools import lru_cache
 from dotenv import load_dotenv
 
+from utils import json_utils
+
 # Load environment variables
 load_dotenv()
 
 
+# Parsed markets files keyed by path: (mtime, markets)
+_markets_cache = {}
+
+
 def load_markets(markets_file='markets.json'):
     """Load market configurations from JSON file
 
+    The parsed file is cached and only re-read when its mtime changes, so
+    edits to markets.json are picked up without restarting. The returned
+    dict is shared between callers and must not be mutated.
+
     Returns:
         dict: Market configurations keyed by symbol
     """
     try:
+        mtime = os.stat(markets_file).st_mtime
+        cached = _markets_cache.get(markets_file)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
         with open(markets_file, 'r') as f:
-            markets = json.load(f)
+            markets = json_utils.load(f)
+        _markets_cache[markets_file] = (mtime, markets)
         return markets
     except FileNotFoundError:
         raise FileNotFoundError(f"Markets configuration file not found: {markets_file}")
-    except json.JSONDecodeError as e:
+    except json_utils.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON in markets file: {e}")
 
 
@@ -46,6 +62,17 @@ def get_market_config(symbol: str, markets_file='markets.json'):
 
 
 class TradingBotConfig:
+    # Fixed attribute set: no per-instance __dict__, and typos in
+    # `config.<name> = ...` raise instead of silently adding a field
+    __slots__ = (
+        'binance_api_key', 'binance_api_secret',
+        'mexc_api_key', 'mexc_api_secret',
+        'solana_private_key', 'jupiter_api_url', 'jupiter_api_key',
+        'okx_api_key', 'okx_secret_key', 'okx_passphrase', 'bsc_private_key',
+        'solana_rpc_urls',
+        'mark_up_percent', 'price_change_threshold', 'max_slippage', 'no_hedge_mode',
+    )
+
     def __init__(self, mark_up_percent=None, price_change_threshold=None, max_slippage=None):
         # Binance credentials
         self.binance_api_key = os.getenv('BINANCE_API_KEY')
@@ -65,6 +92,11 @@ class TradingBotConfig:
         self.okx_secret_key = os.getenv('OKX_SECRET_KEY')
         self.okx_passphrase = os.getenv('OKX_PASSPHRASE')
         self.bsc_private_key = os.getenv('BSC_PRIVATE_KEY')  # Optional, for BSC swaps
+        # Comma-separated; OKX Solana swaps are broadcast to all of them at once
+        self.solana_rpc_urls = [
+            url.strip() for url in os.getenv('SOLANA_RPC_URLS', 'https://api.mainnet-beta.solana.com').split(',')
+            if url.strip()
+        ]
 
         # Trading parameters (use provided values or defaults)
         self.mark_up_percent = mark_up_percent if mark_up_percent is not None else 3.0
@@ -101,3 +133,13 @@ class TradingBotConfig:
 
         if missing:
             raise ValueError(f"Missing environment variables: {list(set(missing))}")
+
+
+@lru_cache(maxsize=1)
+def get_config() -> TradingBotConfig:
+    """Default-parameter TradingBotConfig, built (and validated) once per process
+
+    The instance is shared between callers and must not be mutated; construct
+    TradingBotConfig directly for custom trading parameters.
+    """
+    return TradingBotConfig()
@@ -1,24 +1,84 @@
 """
 Binance Futures API manager
 """
+import os
+import time
 import logging
 import asyncio
+import aiohttp
+from requests.adapters import HTTPAdapter
+from collections import namedtuple
 from typing import Optional, Callable
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
 from binance import AsyncClient, BinanceSocketManager
+import binance.streams
 
-from utils.logging_setup import bot_logger
+from utils import json_utils
+
+from utils.logging_setup import bot_logger, orders_logger
 
 logger = logging.getLogger(__name__)
 
+# Websocket frames are decoded inside binance.streams with its module-level
+# `json`; point it at orjson so user/price stream parsing skips stdlib json
+if json_utils.orjson is not None:
+    binance.streams.json = json_utils
+
+
+# Per-symbol rounding constants parsed once from exchange info
+SymbolPrecision = namedtuple(
+    'SymbolPrecision',
+    'qty_step price_step qty_decimals price_decimals min_qty min_price min_notional qty_step_inv price_step_inv'
+)
+
+# On-disk copy of futures_exchange_info(), reused across restarts
+EXCHANGE_INFO_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.cache', 'meme-arb-bot', 'futures_exchange_info.json')
+EXCHANGE_INFO_TTL = 3600  # seconds
+
+# Streamed mark prices younger than this are served without a REST call
+PRICE_STREAM_MAX_AGE = 5.0  # seconds
+
+
+# Binance expires an idle listenKey after 60 minutes
+LISTEN_KEY_TTL = 60 * 60  # seconds
+LISTEN_KEY_KEEPALIVE = 25 * 60  # seconds
+# A key this close to expiry is extended before a stream (re)connects on it
+LISTEN_KEY_REFRESH_MARGIN = 5 * 60  # seconds
+
+# Keep-alive pool sizes for the REST clients; order place/modify/cancel
+# calls then reuse warm TLS connections instead of reconnecting
+HTTP_POOL_CONNECTIONS = 10
+HTTP_POOL_MAXSIZE = 20
+
+
+class PooledAsyncClient(AsyncClient):
+    """AsyncClient whose aiohttp session uses a tuned keep-alive connector"""
+
+    def _init_session(self) -> aiohttp.ClientSession:
+        # Forward session_params (proxy, trust_env, ...) like the base class;
+        # an explicitly passed connector wins over the pooled one
+        session_params = dict(self._session_params)
+        if 'connector' not in session_params:
+            session_params['connector'] = aiohttp.TCPConnector(
+                limit=HTTP_POOL_MAXSIZE, ttl_dns_cache=300, enable_cleanup_closed=True
+            )
+        return aiohttp.ClientSession(loop=self.loop, headers=self._get_headers(), **session_params)
+
 
 class BinanceManager:
+    # futures_exchange_info() symbols keyed by symbol, shared by all instances
+    _exchange_info_cache: dict = {}
+    _exchange_info_fetched_at: float = 0.0
+
     def __init__(self, api_key: str, api_secret: str, status_display: Optional['StatusDisplay'] = None):
         self.client = Client(api_key=api_key, api_secret=api_secret)
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE)
+        self.client.session.mount('https://', adapter)
         self.api_key = api_key
         self.api_secret = api_secret
         self.current_price = None
+        self.current_price_ts = 0.0  # time.monotonic() of the last price update
         self.current_order_id = None
         self.last_order_price = None
         self.market_price_at_order = None
@@ -28,86 +88,203 @@ class BinanceManager:
         # WebSocket related
         self.async_client = None
         self.bsm = None
+        self._listen_key = None
+        self._listen_key_expiry = 0.0  # time.monotonic() when Binance drops the key
+        self._keepalive_task = None
+        self._fill_tasks = set()  # fill callbacks (DEX hedges) still running
         self.user_socket = None
         self.price_socket = None
         self.price_callback = None
+        self._price_event = asyncio.Event()  # set when current_price has a tick not yet dispatched
+
+    async def __aenter__(self) -> 'BinanceManager':
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def connect(self) -> AsyncClient:
+        """Create the shared AsyncClient on first use and return it"""
+        if not self.async_client:
+            self.async_client = await PooledAsyncClient.create(self.api_key, self.api_secret)
+            self.bsm = BinanceSocketManager(self.async_client)
+        return self.async_client
 
-    def _get_symbol_precision(self, symbol: str) -> dict:
+    async def close(self):
+        """Close the AsyncClient session if one was opened
+
+        Waits for fill callbacks still in flight first, so a hedge is never
+        cut off by the shutdown.
+        """
+        if self._fill_tasks:
+            await asyncio.gather(*self._fill_tasks, return_exceptions=True)
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        self._listen_key = None
+        self._listen_key_expiry = 0.0
+        if self.async_client:
+            await self.async_client.close_connection()
+            self.async_client = None
+            self.bsm = None
+
+    def _get_exchange_info(self, refresh: bool = False) -> dict:
+        """Return futures exchange info indexed by symbol
+
+        Shared by all instances and persisted to disk for EXCHANGE_INFO_TTL
+        seconds, so restarts and new managers skip the (large) REST call.
+        """
+        cls = BinanceManager
+        now = time.time()
+        if not refresh:
+            if cls._exchange_info_cache and now - cls._exchange_info_fetched_at < EXCHANGE_INFO_TTL:
+                return cls._exchange_info_cache
+
+            try:
+                mtime = os.path.getmtime(EXCHANGE_INFO_CACHE_FILE)
+                if now - mtime < EXCHANGE_INFO_TTL:
+                    with open(EXCHANGE_INFO_CACHE_FILE) as f:
+                        cls._exchange_info_cache = json_utils.load(f)
+                    cls._exchange_info_fetched_at = mtime
+                    logger.debug("Loaded exchange info from %s", EXCHANGE_INFO_CACHE_FILE)
+                    return cls._exchange_info_cache
+            except (OSError, ValueError):
+                pass
+
+        exchange_info = self.client.futures_exchange_info()
+        cls._exchange_info_cache = {s['symbol']: s for s in exchange_info['symbols']}
+        cls._exchange_info_fetched_at = now
+
+        try:
+            os.makedirs(os.path.dirname(EXCHANGE_INFO_CACHE_FILE), exist_ok=True)
+            tmp_file = f"{EXCHANGE_INFO_CACHE_FILE}.tmp"
+            with open(tmp_file, 'w') as f:
+                json_utils.dump(cls._exchange_info_cache, f)
+            os.replace(tmp_file, EXCHANGE_INFO_CACHE_FILE)
+        except OSError as e:
+            logger.debug("Could not write exchange info cache: %s", e)
+
+        return cls._exchange_info_cache
+
+    def _get_symbol_precision(self, symbol: str) -> Optional[SymbolPrecision]:
         """Get quantity and price precision for a symbol"""
         if symbol in self.symbol_precision:
             return self.symbol_precision[symbol]
 
         try:
-            exchange_info = self.client.futures_exchange_info()
-            for s in exchange_info['symbols']:
-                if s['symbol'] == symbol:
-                    filters = {f['filterType']: f for f in s['filters']}
-
-                    price_filter = filters.get('PRICE_FILTER', {})
-                    lot_size_filter = filters.get('LOT_SIZE', {})
-
-                    precision = {
-                        'qty_decimals': s['quantityPrecision'],
-                        'price_decimals': s['pricePrecision'],
-                        'min_qty': float(lot_size_filter.get('minQty', 0)),
-                        'qty_step': float(lot_size_filter.get('stepSize', 0)),
-                        'min_price': float(price_filter.get('minPrice', 0)),
-                        'price_step': float(price_filter.get('tickSize', 0)),
-                        'min_notional': float(filters.get('MIN_NOTIONAL', {}).get('notional', 0))
-                    }
-                    self.symbol_precision[symbol] = precision
-                    logger.info(f"Symbol {symbol}: qty_step={precision['qty_step']}, price_step={precision['price_step']}")
-                    return precision
-            logger.error(f"Symbol {symbol} not found in exchange info")
+            info_by_symbol = self._get_exchange_info()
+            s = info_by_symbol.get(symbol)
+            if s is None and time.time() - BinanceManager._exchange_info_fetched_at > 60:
+                # Cached copy may predate a new listing; refresh unless it is brand new
+                s = self._get_exchange_info(refresh=True).get(symbol)
+
+            if s is not None:
+                filters = {f['filterType']: f for f in s['filters']}
+
+                price_filter = filters.get('PRICE_FILTER', {})
+                lot_size_filter = filters.get('LOT_SIZE', {})
+
+                qty_step = float(lot_size_filter.get('stepSize', 0))
+                price_step = float(price_filter.get('tickSize', 0))
+                precision = SymbolPrecision(
+                    qty_step=qty_step,
+                    price_step=price_step,
+                    qty_decimals=s['quantityPrecision'],
+                    price_decimals=s['pricePrecision'],
+                    min_qty=float(lot_size_filter.get('minQty', 0)),
+                    min_price=float(price_filter.get('minPrice', 0)),
+                    min_notional=float(filters.get('MIN_NOTIONAL', {}).get('notional', 0)),
+                    # Reciprocals so formatting multiplies instead of dividing
+                    qty_step_inv=1.0 / qty_step if qty_step else 0.0,
+                    price_step_inv=1.0 / price_step if price_step else 0.0
+                )
+                self.symbol_precision[symbol] = precision
+                logger.info("Symbol %s: qty_step=%s, price_step=%s", symbol, precision.qty_step, precision.price_step)
+                return precision
+            logger.error("Symbol %s not found in exchange info", symbol)
             return None
         except Exception as e:
-            logger.error(f"Error getting symbol precision: {e}")
+            logger.error("Error getting symbol precision: %s", e)
             return None
 
     def _format_quantity(self, symbol: str, quantity: float) -> float:
         """Format quantity to match symbol's step size"""
-        precision = self._get_symbol_precision(symbol)
-        if not precision or precision['qty_step'] == 0:
-            return round(quantity, precision['qty_decimals'] if precision else 2)
+        p = self.symbol_precision.get(symbol) or self._get_symbol_precision(symbol)
+        if not p:
+            return round(quantity, 2)
+        if not p.qty_step:
+            return round(quantity, p.qty_decimals)
 
-        qty_step = precision['qty_step']
-        formatted = round(quantity / qty_step) * qty_step
+        formatted = round(round(quantity * p.qty_step_inv) * p.qty_step, p.qty_decimals)
 
-        if formatted < precision['min_qty']:
-            logger.warning(f"Quantity {formatted} below minimum {precision['min_qty']}")
+        if formatted < p.min_qty:
+            logger.warning("Quantity %s below minimum %s", formatted, p.min_qty)
 
         return formatted
 
     def _format_price(self, symbol: str, price: float) -> float:
         """Format price to match symbol's tick size"""
-        precision = self._get_symbol_precision(symbol)
-        if not precision or precision['price_step'] == 0:
-            return round(price, precision['price_decimals'] if precision else 2)
+        p = self.symbol_precision.get(symbol) or self._get_symbol_precision(symbol)
+        if not p:
+            return round(price, 2)
+        if not p.price_step:
+            return round(price, p.price_decimals)
+
+        return round(round(price * p.price_step_inv) * p.price_step, p.price_decimals)
 
-        price_step = precision['price_step']
-        formatted = round(price / price_step) * price_step
+    def _fresh_stream_price(self) -> Optional[float]:
+        """Mark price from the websocket stream if it is recent enough to use"""
+        if self.price_socket and self.current_price and time.monotonic() - self.current_price_ts < PRICE_STREAM_MAX_AGE:
+            return self.current_price
+        return None
 
-        decimals = precision['price_decimals']
-        return round(formatted, decimals)
+    def _record_price(self, symbol: str, price: float):
+        """Store a REST-fetched mark price and publish it"""
+        self.current_price = price
+        self.current_price_ts = time.monotonic()
+        logger.info("Current %s price: %s", symbol, price)
+
+        # Log to bot activity
+        bot_logger.info("PRICE_UPDATE | Symbol: %s | Price: $%.8f", symbol, price)
+
+        # Update status display
+        if self.status_display:
+            self.status_display.update_price(price)
 
     def get_current_price(self, symbol: str) -> float:
-        """Get current market price from Binance perpetual futures"""
+        """Get current market price from Binance perpetual futures
+
+        Uses the live mark price stream when it is running and fresh, and
+        only falls back to a REST request otherwise.
+        """
+        price = self._fresh_stream_price()
+        if price is not None:
+            return price
+
         try:
             ticker = self.client.futures_mark_price(symbol=symbol)
             price = float(ticker['markPrice'])
-            self.current_price = price
-            logger.info(f"Current {symbol} price: {price}")
-
-            # Log to bot activity
-            bot_logger.info(f"PRICE_UPDATE | Symbol: {symbol} | Price: ${price:.8f}")
+            self._record_price(symbol, price)
+            return price
+        except BinanceAPIException as e:
+            logger.error("Error fetching price: %s", e)
+            return None
 
-            # Update status display
-            if self.status_display:
-                self.status_display.update_price(price)
+    async def get_current_price_async(self, symbol: str) -> float:
+        """Async get_current_price using the shared AsyncClient for the REST fallback"""
+        price = self._fresh_stream_price()
+        if price is not None:
+            return price
 
+        try:
+            client = await self.connect()
+            ticker = await client.futures_mark_price(symbol=symbol)
+            price = float(ticker['markPrice'])
+            self._record_price(symbol, price)
             return price
         except BinanceAPIException as e:
-            logger.error(f"Error fetching price: {e}")
+            logger.error("Error fetching price: %s", e)
             return None
 
     def place_limit_sell_order(self, symbol: str, usd_amount: float, price: float, market_price: float) -> dict:
@@ -118,7 +295,7 @@ class BinanceManager:
             formatted_qty = self._format_quantity(symbol, token_quantity)
             formatted_price = self._format_price(symbol, price)
 
-            logger.info(f"Placing order: ${usd_amount:.2f} USD ({formatted_qty} {symbol}) at {formatted_price} (market: {market_price})")
+            logger.info("Placing order: $%.2f USD (%s %s) at %s (market: %s)", usd_amount, formatted_qty, symbol, formatted_price, market_price)
 
             order = self.client.futures_create_order(
                 symbol=symbol,
@@ -132,14 +309,11 @@ class BinanceManager:
             self.last_order_price = formatted_price
             self.market_price_at_order = market_price
 
-            # Log order details to separate file
-            from utils.logging_setup import orders_logger
-            orders_logger.info(f"ORDER_PLACED | Symbol: {symbol} | OrderID: {order['orderId']} | Side: SELL | USD_Amount: ${usd_amount:.2f} | Quantity: {formatted_qty} | Price: {formatted_price} | Market_Price: {market_price}")
+            # Log order details to orders.log and bot activity
+            orders_logger.info("ORDER_PLACED | Symbol: %s | OrderID: %s | Side: SELL | USD_Amount: $%.2f | Quantity: %s | Price: %s | Market_Price: %s", symbol, order['orderId'], usd_amount, formatted_qty, formatted_price, market_price)
+            bot_logger.info("ORDER_CREATED | Symbol: %s | OrderID: %s | Side: SELL | USD: $%.2f | Qty: %s | Price: $%.8f | Market: $%.8f", symbol, order['orderId'], usd_amount, formatted_qty, formatted_price, market_price)
 
-            # Log to bot activity
-            bot_logger.info(f"ORDER_CREATED | Symbol: {symbol} | OrderID: {order['orderId']} | Side: SELL | USD: ${usd_amount:.2f} | Qty: {formatted_qty} | Price: ${formatted_price:.8f} | Market: ${market_price:.8f}")
-
-            logger.info(f"Order placed: {order['orderId']} - Sell ${usd_amount:.2f} USD ({formatted_qty} {symbol}) at {formatted_price}")
+            logger.info("Order placed: %s - Sell $%.2f USD (%s %s) at %s", order['orderId'], usd_amount, formatted_qty, symbol, formatted_price)
 
             # Update status display
             if self.status_display:
@@ -148,7 +322,7 @@ class BinanceManager:
 
             return order
         except BinanceAPIException as e:
-            logger.error(f"Error placing order: {e}")
+            logger.error("Error placing order: %s", e)
             return None
 
     def modify_order(self, symbol: str, order_id: int, usd_amount: float, new_price: float, market_price: float) -> dict:
@@ -170,7 +344,7 @@ class BinanceManager:
             formatted_qty = self._format_quantity(symbol, new_quantity)
             formatted_price = self._format_price(symbol, new_price)
 
-            logger.info(f"Modifying order {order_id}: ${usd_amount:.2f} USD ({formatted_qty} {symbol}) at {formatted_price} (market: {market_price})")
+            logger.info("Modifying order %s: $%.2f USD (%s %s) at %s (market: %s)", order_id, usd_amount, formatted_qty, symbol, formatted_price, market_price)
 
             # Binance futures_modify_order (side is required by API)
             modified_order = self.client.futures_modify_order(
@@ -184,14 +358,11 @@ class BinanceManager:
             self.last_order_price = formatted_price
             self.market_price_at_order = market_price
 
-            # Log order modification to separate file
-            from utils.logging_setup import orders_logger
-            orders_logger.info(f"ORDER_MODIFIED | Symbol: {symbol} | OrderID: {order_id} | New_Price: {formatted_price} | New_Quantity: {formatted_qty} | USD_Amount: ${usd_amount:.2f} | Market_Price: {market_price}")
-
-            # Log to bot activity
-            bot_logger.info(f"ORDER_MODIFIED | Symbol: {symbol} | OrderID: {order_id} | USD: ${usd_amount:.2f} | Qty: {formatted_qty} | Price: ${formatted_price:.8f} | Market: ${market_price:.8f}")
+            # Log order modification to orders.log and bot activity
+            orders_logger.info("ORDER_MODIFIED | Symbol: %s | OrderID: %s | New_Price: %s | New_Quantity: %s | USD_Amount: $%.2f | Market_Price: %s", symbol, order_id, formatted_price, formatted_qty, usd_amount, market_price)
+            bot_logger.info("ORDER_MODIFIED | Symbol: %s | OrderID: %s | USD: $%.2f | Qty: %s | Price: $%.8f | Market: $%.8f", symbol, order_id, usd_amount, formatted_qty, formatted_price, market_price)
 
-            logger.info(f"Order {order_id} modified successfully")
+            logger.info("Order %s modified successfully", order_id)
 
             # Update status display
             if self.status_display:
@@ -200,18 +371,18 @@ class BinanceManager:
 
             return modified_order
         except BinanceAPIException as e:
-            logger.error(f"Error modifying order: {e}")
+            logger.error("Error modifying order: %s", e)
             return None
 
     def cancel_order(self, symbol: str, order_id: int) -> bool:
         """Cancel existing order"""
         try:
             self.client.futures_cancel_order(symbol=symbol, orderId=order_id)
-            logger.info(f"Order {order_id} cancelled")
+            logger.info("Order %s cancelled", order_id)
             self.current_order_id = None
 
             # Log to bot activity
-            bot_logger.info(f"ORDER_CANCELLED | Symbol: {symbol} | OrderID: {order_id}")
+            bot_logger.info("ORDER_CANCELLED | Symbol: %s | OrderID: %s", symbol, order_id)
 
             # Update status display
             if self.status_display:
@@ -220,7 +391,7 @@ class BinanceManager:
 
             return True
         except BinanceAPIException as e:
-            logger.error(f"Error cancelling order: {e}")
+            logger.error("Error cancelling order: %s", e)
             return False
 
     def check_order_filled(self, symbol: str, order_id: int) -> Optional[dict]:
@@ -228,14 +399,14 @@ class BinanceManager:
         try:
             order = self.client.futures_get_order(symbol=symbol, orderId=order_id)
             if order['status'] == 'FILLED':
-                logger.info(f"Order {order_id} FILLED!")
+                logger.info("Order %s FILLED!", order_id)
 
                 fill_price = float(order.get('avgPrice', 0))
                 fill_qty = float(order.get('executedQty', 0))
                 fill_usd = fill_price * fill_qty
 
                 # Log to bot activity
-                bot_logger.info(f"ORDER_FILLED | Symbol: {symbol} | OrderID: {order_id} | Fill_Price: ${fill_price:.8f} | Qty: {fill_qty} | USD_Value: ${fill_usd:.2f}")
+                bot_logger.info("ORDER_FILLED | Symbol: %s | OrderID: %s | Fill_Price: $%.8f | Qty: %s | USD_Value: $%.2f", symbol, order_id, fill_price, fill_qty, fill_usd)
 
                 # Update status display
                 if self.status_display:
@@ -245,16 +416,36 @@ class BinanceManager:
                 return order
             return None
         except BinanceAPIException as e:
-            logger.error(f"Error checking order: {e}")
+            logger.error("Error checking order: %s", e)
             return None
 
+    @property
+    def market_price_at_order(self) -> Optional[float]:
+        """Market price when the current order was placed or last modified"""
+        return self._market_price_at_order
+
+    @market_price_at_order.setter
+    def market_price_at_order(self, price: Optional[float]):
+        self._market_price_at_order = price
+        self._update_bounds = None  # recomputed on the next should_update_order()
+
     def should_update_order(self, current_price: float, threshold: float) -> bool:
-        """Check if market price has changed by threshold percent since order was placed"""
-        if self.market_price_at_order is None:
-            return False
+        """Check if market price has changed by threshold percent since order was placed
 
-        price_change = abs(current_price - self.market_price_at_order) / self.market_price_at_order * 100
-        return price_change >= threshold
+        The lower/upper trigger prices are computed once per order price (and
+        threshold), so each tick is just two comparisons.
+        """
+        bounds = self._update_bounds
+        if bounds is None or bounds[0] != threshold:
+            reference = self._market_price_at_order
+            if reference is None:
+                return False
+            bounds = self._update_bounds = (
+                threshold,
+                reference * (1 - threshold / 100),
+                reference * (1 + threshold / 100),
+            )
+        return current_price <= bounds[1] or current_price >= bounds[2]
 
     def get_open_orders(self, symbol: str) -> list:
         """Get all open orders for a symbol"""
@@ -262,61 +453,200 @@ class BinanceManager:
             orders = self.client.futures_get_open_orders(symbol=symbol)
             return orders
         except BinanceAPIException as e:
-            logger.error(f"Error getting open orders: {e}")
+            logger.error("Error getting open orders: %s", e)
             return []
 
-    async def start_user_stream(self, on_order_update: Callable):
-        """Start WebSocket user data stream for real-time order updates
+    async def _handle_user_event(self, msg: dict, on_order_update: Callable):
+        """Dispatch a user data stream event, calling back on our order's fill"""
+        # Handle different event types
+        if msg.get('e') == 'listenKeyExpired':
+            # No more user events arrive on this socket (mark price frames
+            # would keep it looking alive); drop the key and end the stream
+            # so the caller reconnects on a fresh one
+            logger.warning("listenKey expired, a new one will be requested")
+            self._listen_key = None
+            raise ConnectionError("Binance listenKey expired")
+        elif msg.get('e') == 'ORDER_TRADE_UPDATE':
+            order_update = msg['o']
+            order_id = order_update['i']
+            order_status = order_update['X']
+            symbol = order_update['s']
+
+            logger.debug("WebSocket: Order %s status: %s", order_id, order_status)
+
+            # Only trigger callback for FILLED orders
+            if order_status == 'FILLED' and order_id == self.current_order_id:
+                logger.info("🔔 WebSocket: Order %s FILLED!", order_id)
+                bot_logger.info("WEBSOCKET_ORDER_FILL | OrderID: %s | Symbol: %s", order_id, symbol)
+
+                # The callback runs the whole DEX hedge; run it beside the
+                # stream so frames keep being drained meanwhile (python-binance
+                # kills the socket once 100 unread messages queue up)
+                task = asyncio.create_task(self._dispatch_fill(symbol, order_id, on_order_update))
+                self._fill_tasks.add(task)
+                task.add_done_callback(self._fill_tasks.discard)
+
+    async def _dispatch_fill(self, symbol: str, order_id: int, on_order_update: Callable):
+        """Fetch the filled order and hand it to the fill callback"""
+        try:
+            # Get full order details from REST API (WebSocket doesn't have all fields)
+            filled_order = await self.async_client.futures_get_order(symbol=symbol, orderId=order_id)
+
+            # Call the callback
+            await on_order_update(filled_order)
+        except Exception as e:
+            logger.exception("Order fill callback error")
+            bot_logger.error("ORDER_FILL_CALLBACK_ERROR | OrderID: %s | %s", order_id, e)
+
+    def _handle_mark_price(self, data: dict):
+        """Record a markPriceUpdate payload and wake the price dispatcher"""
+        if 'p' not in data:
+            return
+        mark_price = float(data['p'])
+        self.current_price = mark_price
+        self.current_price_ts = time.monotonic()
+
+        # Update status display
+        if self.status_display:
+            self.status_display.update_price(mark_price)
+
+        self._price_event.set()
+
+    async def _dispatch_prices(self, on_price_update: Callable):
+        """Feed the latest mark price to the callback, one call at a time
+
+        Ticks that arrive while the callback is still running only overwrite
+        current_price, so a slow consumer (e.g. a REST order modify) always
+        picks up the freshest price instead of working through a backlog.
+        """
+        while True:
+            await self._price_event.wait()
+            self._price_event.clear()
+            try:
+                await on_price_update(self.current_price)
+            except Exception as e:
+                logger.error("Price callback error: %s", e)
+
+    async def _ensure_listen_key(self) -> str:
+        """Return the account listenKey, creating it (and its keepalive) once
+
+        Both the multiplexed and standalone user streams share this key, and
+        it outlives individual connections, so stream reconnects reuse it
+        instead of asking Binance for a new one. A key close to expiry is
+        extended first; one that has expired is replaced.
+        """
+        await self.connect()
+        now = time.monotonic()
+        if self._listen_key and now >= self._listen_key_expiry:
+            self._listen_key = None
+        if not self._listen_key:
+            self._listen_key = await self.async_client.futures_stream_get_listen_key()
+            self._listen_key_expiry = now + LISTEN_KEY_TTL
+        elif self._listen_key_expiry - now < LISTEN_KEY_REFRESH_MARGIN:
+            await self.keepalive_user_stream()
+        if not self._keepalive_task:
+            self._keepalive_task = asyncio.create_task(self._keepalive_listen_key())
+        return self._listen_key
+
+    async def keepalive_user_stream(self):
+        """Send one listenKey keepalive (a cheap, unweighted signed round-trip)"""
+        if not self._listen_key:
+            await self._ensure_listen_key()
+            return
+        await self.async_client.futures_stream_keepalive(listenKey=self._listen_key)
+        self._listen_key_expiry = time.monotonic() + LISTEN_KEY_TTL
+
+    async def _keepalive_listen_key(self):
+        """Extend the user data listenKey before Binance expires it (60 min)"""
+        while True:
+            await asyncio.sleep(LISTEN_KEY_KEEPALIVE)
+            try:
+                await self.keepalive_user_stream()
+                logger.debug("listenKey keepalive sent")
+            except Exception as e:
+                logger.warning("listenKey keepalive failed: %s", e)
+
+    async def start_streams(self, symbol: str, on_price_update: Callable, on_order_update: Callable):
+        """Run mark price and user data updates over one multiplexed WebSocket
+
+        Subscribes to `<symbol>@markPrice@1s` and the account listenKey on the
+        combined-stream endpoint and routes each frame by its `stream` name,
+        so a single connection (one handshake, one heartbeat) serves both.
 
         Args:
-            on_order_update: Async callback function to handle order updates
-                            Called with (order_data: dict) when order status changes
+            symbol: Trading symbol to monitor
+            on_price_update: Async callback called with (price: float)
+            on_order_update: Async callback called with (order_data: dict) on fill
         """
+        dispatch_task = asyncio.create_task(self._dispatch_prices(on_price_update))
         try:
-            # Create async client
-            self.async_client = await AsyncClient.create(self.api_key, self.api_secret)
-            self.bsm = BinanceSocketManager(self.async_client)
+            listen_key = await self._ensure_listen_key()
 
-            # Start futures user data stream
-            self.user_socket = self.bsm.futures_user_socket()
+            price_stream = f"{symbol.lower()}@markPrice@1s"
+            self.user_socket = self.price_socket = self.bsm.futures_multiplex_socket([price_stream, listen_key])
 
-            logger.info("🔌 Starting Binance WebSocket user data stream...")
-            bot_logger.info("WEBSOCKET_START | Starting user data stream for real-time order updates")
+            logger.info("🔌 Starting Binance multiplexed WebSocket for %s...", symbol)
+            bot_logger.info("WEBSOCKET_START | Multiplexed mark price + user data stream for %s", symbol)
 
             async with self.user_socket as stream:
                 while True:
                     msg = await stream.recv()
+                    if msg.get('e') == 'error':
+                        # Queue overflow or out of reconnects; recv() would block forever
+                        raise ConnectionError(f"Binance WebSocket error: {msg.get('m')}")
+                    data = msg.get('data')
+                    if not data:
+                        continue
+
+                    if msg.get('stream') == price_stream:
+                        self._handle_mark_price(data)
+                    else:
+                        await self._handle_user_event(data, on_order_update)
 
-                    # Handle different event types
-                    if msg['e'] == 'ORDER_TRADE_UPDATE':
-                        order_update = msg['o']
-                        order_id = order_update['i']
-                        order_status = order_update['X']
-                        symbol = order_update['s']
+        except Exception as e:
+            logger.exception("WebSocket error")
+            bot_logger.error("WEBSOCKET_ERROR | %s", e)
+            raise
+        finally:
+            dispatch_task.cancel()
+            await self.stop_user_stream()
 
-                        logger.debug(f"WebSocket: Order {order_id} status: {order_status}")
+    async def start_user_stream(self, on_order_update: Callable):
+        """Start WebSocket user data stream for real-time order updates
 
-                        # Only trigger callback for FILLED orders
-                        if order_status == 'FILLED' and order_id == self.current_order_id:
-                            logger.info(f"🔔 WebSocket: Order {order_id} FILLED!")
-                            bot_logger.info(f"WEBSOCKET_ORDER_FILL | OrderID: {order_id} | Symbol: {symbol}")
+        Args:
+            on_order_update: Async callback function to handle order updates
+                            Called with (order_data: dict) when order status changes
+        """
+        try:
+            # Start futures user data stream on the shared listenKey
+            listen_key = await self._ensure_listen_key()
+            self.user_socket = self.bsm.futures_multiplex_socket([listen_key])
 
-                            # Get full order details from REST API (WebSocket doesn't have all fields)
-                            filled_order = self.client.futures_get_order(symbol=symbol, orderId=order_id)
+            logger.info("🔌 Starting Binance WebSocket user data stream...")
+            bot_logger.info("WEBSOCKET_START | Starting user data stream for real-time order updates")
 
-                            # Call the callback
-                            await on_order_update(filled_order)
+            async with self.user_socket as stream:
+                while True:
+                    msg = await stream.recv()
+                    if msg.get('e') == 'error':
+                        raise ConnectionError(f"Binance WebSocket error: {msg.get('m')}")
+                    if msg.get('data'):
+                        await self._handle_user_event(msg['data'], on_order_update)
 
         except Exception as e:
-            logger.error(f"WebSocket error: {e}")
-            bot_logger.error(f"WEBSOCKET_ERROR | {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception("WebSocket error")
+            bot_logger.error("WEBSOCKET_ERROR | %s", e)
+            raise
         finally:
             await self.stop_user_stream()
 
     async def stop_user_stream(self):
-        """Stop WebSocket user data stream"""
+        """Stop WebSocket user data stream
+
+        The AsyncClient and listenKey are kept for a reconnect; close()
+        releases them.
+        """
         try:
             if self.user_socket:
                 logger.info("🔌 Stopping WebSocket user data stream...")
@@ -327,14 +657,9 @@ class BinanceManager:
                 logger.info("🔌 Stopping WebSocket price stream...")
                 self.price_socket = None
 
-            if self.async_client:
-                await self.async_client.close_connection()
-                self.async_client = None
-                self.bsm = None
-
             bot_logger.info("WEBSOCKET_STOP | User data stream stopped")
         except Exception as e:
-            logger.error(f"Error stopping WebSocket: {e}")
+            logger.error("Error stopping WebSocket: %s", e)
 
     async def start_price_stream(self, symbol: str, on_price_update: Callable):
         """Start WebSocket mark price stream for real-time price monitoring
@@ -344,36 +669,30 @@ class BinanceManager:
             on_price_update: Async callback function to handle price updates
                            Called with (price: float) when price changes
         """
+        dispatch_task = asyncio.create_task(self._dispatch_prices(on_price_update))
         try:
             # Create async client if not already created
-            if not self.async_client:
-                self.async_client = await AsyncClient.create(self.api_key, self.api_secret)
-                self.bsm = BinanceSocketManager(self.async_client)
+            await self.connect()
 
             # Start futures mark price stream
             self.price_socket = self.bsm.symbol_mark_price_socket(symbol)
 
-            logger.info(f"🔌 Starting Binance WebSocket price stream for {symbol}...")
-            bot_logger.info(f"WEBSOCKET_PRICE_START | Starting mark price stream for {symbol}")
+            logger.info("🔌 Starting Binance WebSocket price stream for %s...", symbol)
+            bot_logger.info("WEBSOCKET_PRICE_START | Starting mark price stream for %s", symbol)
 
             async with self.price_socket as stream:
                 while True:
                     msg = await stream.recv()
+                    if msg.get('e') == 'error':
+                        raise ConnectionError(f"Binance WebSocket error: {msg.get('m')}")
 
                     # Mark price updates every 1 second - extract from nested 'data' field
-                    if 'data' in msg and 'p' in msg['data']:
-                        mark_price = float(msg['data']['p'])
-                        self.current_price = mark_price
-
-                        # Update status display
-                        if self.status_display:
-                            self.status_display.update_price(mark_price)
-
-                        # Call the callback
-                        await on_price_update(mark_price)
+                    if 'data' in msg:
+                        self._handle_mark_price(msg['data'])
 
         except Exception as e:
-            logger.error(f"Price WebSocket error: {e}")
-            bot_logger.error(f"WEBSOCKET_PRICE_ERROR | {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+            logger.exception("Price WebSocket error")
+            bot_logger.error("WEBSOCKET_PRICE_ERROR | %s", e)
+            raise
+        finally:
+            dispatch_task.cancel()
@@ -2,100 +2,151 @@
 Jupiter DEX swap manager for Solana
 """
 import json
-import base64
 import logging
 from typing import Optional
-import base58
 import aiohttp
 from solders.keypair import Keypair
-from solders.transaction import VersionedTransaction
+
+from utils import json_utils
+from utils.solana_tx import b58decode, b64decode, b64encode, sign_in_place
 
 logger = logging.getLogger(__name__)
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# /execute waits for the transaction to land, so it gets a longer budget
+# than the session's 10s default used for quotes
+EXECUTE_TIMEOUT = aiohttp.ClientTimeout(total=60, connect=3)
+
 
 class JupiterSwapManager:
+    # Decoded keypairs keyed by the stripped private key string
+    _keypair_cache = {}
+
     def __init__(self, solana_private_key: str, jupiter_api_url: str, jupiter_api_key: str, max_slippage: float):
         self.private_key = solana_private_key
         self.jupiter_api_url = jupiter_api_url
         self.jupiter_api_key = jupiter_api_key
         self.max_slippage = max_slippage
         self.keypair = self._load_keypair(solana_private_key)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def _session_get(self) -> aiohttp.ClientSession:
+        """Return the shared keep-alive session, creating it on first use
+
+        Created lazily because aiohttp needs a running event loop.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, keepalive_timeout=75),
+                timeout=aiohttp.ClientTimeout(total=10, connect=3),
+                headers={"x-api-key": self.jupiter_api_key},
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
 
     def _load_keypair(self, private_key_str: str) -> Keypair:
-        """Load keypair from private key string (base58 or JSON array)"""
-        private_key_str = private_key_str.strip()
+        """Load keypair from private key string (base58 or JSON array)
 
-        logger.info(f"Loading keypair from {len(private_key_str)} char key: {private_key_str[:20]}...")
+        Keypairs are memoized per key, so managers sharing a wallet only
+        decode it once.
+        """
+        private_key_str = private_key_str.strip()
 
+        kp = JupiterSwapManager._keypair_cache.get(private_key_str)
+        if kp is not None:
+            return kp
+
+        logger.debug("Loading keypair from %s char key", len(private_key_str))
+
+        # A JSON array starts with '['; anything else is treated as base58
+        if private_key_str.startswith('['):
+            kp = self._keypair_from_json(private_key_str)
+        else:
+            kp = self._keypair_from_base58(private_key_str)
+
+        if kp is None:
+            raise ValueError(
+                f"Invalid private key format. Expected:\n"
+                f"  - Base58 encoded string (88 chars = 64 bytes), or\n"
+                f"  - JSON array: [1,2,3,...]\n"
+                f"Got length: {len(private_key_str)}"
+            )
+
+        JupiterSwapManager._keypair_cache[private_key_str] = kp
+        return kp
+
+    @staticmethod
+    def _keypair_from_base58(private_key_str: str) -> Optional[Keypair]:
+        """Decode a base58 secret key (64-byte keypair or 32-byte seed)"""
+        # Rust base58 decoder when based58 is installed
         try:
-            secret_bytes = base58.b58decode(private_key_str)
-            logger.debug(f"Base58 decoded to {len(secret_bytes)} bytes")
-
-            if len(secret_bytes) == 64:
-                seed = secret_bytes[:32]
-                kp = Keypair.from_seed(seed)
-                logger.info(f"✓ Loaded keypair from base58 format (64 bytes)")
-                return kp
-            elif len(secret_bytes) == 32:
-                kp = Keypair.from_seed(secret_bytes)
-                logger.info(f"✓ Loaded keypair from base58 format (32 bytes)")
-                return kp
-            else:
-                logger.error(f"Invalid decoded length: {len(secret_bytes)}, expected 32 or 64")
-                raise ValueError(f"Invalid key length: {len(secret_bytes)} bytes")
+            secret_bytes = b58decode(private_key_str)
         except Exception as e:
-            logger.debug(f"Base58 decode failed: {e}")
-
+            logger.debug("Base58 decode failed: %s", e)
+            return None
+        logger.debug("Base58 decoded to %s bytes", len(secret_bytes))
+
+        # Check the length before handing bytes to solders (its decoders panic
+        # with a BaseException on the wrong size). A 64-byte key is rebuilt
+        # from its seed half, so a mismatched public half can't leak through.
+        if len(secret_bytes) == 64:
+            logger.info("✓ Loaded keypair from base58 format (64 bytes)")
+            return Keypair.from_seed(secret_bytes[:32])
+        elif len(secret_bytes) == 32:
+            logger.info("✓ Loaded keypair from base58 format (32 bytes)")
+            return Keypair.from_seed(secret_bytes)
+
+        logger.error("Invalid decoded length: %s, expected 32 or 64", len(secret_bytes))
+        return None
+
+    @staticmethod
+    def _keypair_from_json(private_key_str: str) -> Optional[Keypair]:
+        """Parse a JSON byte-array secret key (64-byte keypair or 32-byte seed)"""
         try:
             json_cleaned = private_key_str.replace('\n', '').replace('\r', '').replace(' ', '')
-            secret_array = json.loads(json_cleaned)
-            if isinstance(secret_array, list):
-                secret_bytes = bytes(secret_array)
-                if len(secret_bytes) == 64:
-                    seed = secret_bytes[:32]
-                    kp = Keypair.from_seed(seed)
-                    logger.info(f"✓ Loaded keypair from JSON array format (64 bytes)")
-                    return kp
-                elif len(secret_bytes) == 32:
-                    kp = Keypair.from_seed(secret_bytes)
-                    logger.info(f"✓ Loaded keypair from JSON array format (32 bytes)")
-                    return kp
+            secret_bytes = bytes(json.loads(json_cleaned))
         except Exception as e:
-            logger.debug(f"JSON array parse failed: {e}")
+            logger.debug("JSON array parse failed: %s", e)
+            return None
 
-        logger.error(f"Private key (first 50 chars): {private_key_str[:50]}")
-        raise ValueError(
-            f"Invalid private key format. Expected:\n"
-            f"  - Base58 encoded string (88 chars = 64 bytes), or\n"
-            f"  - JSON array: [1,2,3,...]\n"
-            f"Got length: {len(private_key_str)}, starts with: {private_key_str[:50]}"
-        )
+        if len(secret_bytes) == 64:
+            logger.info("✓ Loaded keypair from JSON array format (64 bytes)")
+            return Keypair.from_seed(secret_bytes[:32])
+        elif len(secret_bytes) == 32:
+            logger.info("✓ Loaded keypair from JSON array format (32 bytes)")
+            return Keypair.from_seed(secret_bytes)
+
+        logger.error("Invalid key length: %s bytes, expected 32 or 64", len(secret_bytes))
+        return None
 
     async def get_order(self, input_mint: str, output_mint: str, amount: int) -> dict:
         """Get swap order from Jupiter Ultra API (GET request with query params)"""
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.jupiter_api_url}/order"
-                params = {
-                    "inputMint": input_mint,
-                    "outputMint": output_mint,
-                    "amount": amount,
-                    "taker": str(self.keypair.pubkey())
-                }
-                headers = {
-                    "x-api-key": self.jupiter_api_key
-                }
-
-                async with session.get(url, params=params, headers=headers) as resp:
-                    result = await resp.json()
-                    if resp.status == 200 and 'transaction' in result:
-                        logger.info(f"Order received")
-                        return result
-                    else:
-                        logger.error(f"Error getting order (status {resp.status}): {result}")
-                        return None
+            session = await self._session_get()
+            url = f"{self.jupiter_api_url}/order"
+            params = {
+                "inputMint": input_mint,
+                "outputMint": output_mint,
+                "amount": amount,
+                "taker": str(self.keypair.pubkey())
+            }
+
+            async with session.get(url, params=params) as resp:
+                result = json_utils.loads(await resp.read())
+                if resp.status == 200 and 'transaction' in result:
+                    logger.info("Order received")
+                    return result
+                else:
+                    logger.error("Error getting order (status %s): %s", resp.status, result)
+                    return None
         except Exception as e:
-            logger.error(f"Error getting Jupiter order: {e}")
+            logger.error("Error getting Jupiter order: %s", e)
             return None
 
     async def execute_swap(self, order: dict) -> Optional[str]:
@@ -113,72 +164,60 @@ class JupiterSwapManager:
                 logger.error("No requestId in order response")
                 return None
 
-            logger.info(f"Request ID: {request_id}")
-
-            # Deserialize VersionedTransaction from base64
-            tx_bytes = base64.b64decode(tx_base64)
-            tx = VersionedTransaction.from_bytes(tx_bytes)
+            logger.info("Request ID: %s", request_id)
 
-            logger.debug(f"Transaction deserialized")
-            logger.debug(f"Number of signature slots: {len(tx.signatures)}")
-
-            # Get the message from the transaction
-            message = tx.message
-            message_bytes = bytes(message)
-            logger.debug(f"Message size: {len(message_bytes)} bytes")
-
-            # Create a new VersionedTransaction with the presigner
-            tx_signed = VersionedTransaction(message, [self.keypair])
+            # Sign the message bytes and write the signature into the fee
+            # payer's slot, without a deserialize/reserialize round-trip
+            buf = bytearray(b64decode(tx_base64))
+            if not sign_in_place(buf, self.keypair):
+                logger.error("Order transaction is not payable by our wallet (taker mismatch)")
+                return None
 
-            logger.info("✓ Transaction signed and reconstructed with Presigner")
+            logger.info("✓ Transaction signed")
 
             # Serialize signed transaction back to base64
-            signed_tx_bytes = bytes(tx_signed)
-            signed_tx_base64 = base64.b64encode(signed_tx_bytes).decode()
+            signed_tx_base64 = b64encode(buf)
 
-            logger.debug(f"Signed transaction size: {len(signed_tx_base64)} chars")
+            logger.debug("Signed transaction size: %s chars", len(signed_tx_base64))
 
             # Submit to Jupiter's /execute endpoint
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.jupiter_api_url}/execute"
-                headers = {
-                    "x-api-key": self.jupiter_api_key,
-                    "Content-Type": "application/json"
-                }
-                payload = {
-                    "signedTransaction": signed_tx_base64,
-                    "requestId": request_id
-                }
-
-                logger.debug(f"POST to {url}")
-                logger.info("Submitting signed transaction to Jupiter /execute...")
-                async with session.post(url, json=payload, headers=headers) as resp:
-                    result = await resp.json()
-                    logger.debug(f"Response status: {resp.status}")
-                    logger.debug(f"Response body: {result}")
-
-                    # Check Jupiter's status field from API response
-                    status = result.get('status', 'Unknown')
-                    tx_hash = result.get('signature') or result.get('txid')
-
-                    if status == 'Success' and tx_hash:
-                        logger.info(f"✓ Jupiter API reports: SUCCESS")
-                        logger.info(f"  Transaction signature: {tx_hash}")
-                        logger.info(f"  Slot: {result.get('slot', 'N/A')}")
-                        return {'success': True, 'signature': tx_hash, 'result': result}
-                    elif status == 'Failed':
-                        error = result.get('error', 'Unknown error')
-                        logger.error(f"✗ Jupiter API reports: FAILED")
-                        logger.error(f"  Transaction signature: {tx_hash}")
-                        logger.error(f"  Error: {error}")
-                        logger.error(f"  Code: {result.get('code', 'N/A')}")
-                        logger.error(f"  Slot: {result.get('slot', 'N/A')}")
-                        return {'success': False, 'signature': tx_hash, 'error': error, 'result': result}
-                    else:
-                        logger.error(f"Unexpected response from Jupiter: {result}")
-                        return None
+            session = await self._session_get()
+            url = f"{self.jupiter_api_url}/execute"
+            payload = {
+                "signedTransaction": signed_tx_base64,
+                "requestId": request_id
+            }
+
+            logger.debug("POST to %s", url)
+            logger.info("Submitting signed transaction to Jupiter /execute...")
+            async with session.post(url, data=json_utils.dumpb(payload), headers=JSON_HEADERS,
+                                    timeout=EXECUTE_TIMEOUT) as resp:
+                result = json_utils.loads(await resp.read())
+                logger.debug("Response status: %s", resp.status)
+                logger.debug("Response body: %s", result)
+
+                # Check Jupiter's status field from API response
+                status = result.get('status', 'Unknown')
+                tx_hash = result.get('signature') or result.get('txid')
+
+                if status == 'Success' and tx_hash:
+                    logger.info("✓ Jupiter API reports: SUCCESS")
+                    logger.info("  Transaction signature: %s", tx_hash)
+                    logger.info("  Slot: %s", result.get('slot', 'N/A'))
+                    return {'success': True, 'signature': tx_hash, 'result': result}
+                elif status == 'Failed':
+                    error = result.get('error', 'Unknown error')
+                    logger.error("✗ Jupiter API reports: FAILED")
+                    logger.error("  Transaction signature: %s", tx_hash)
+                    logger.error("  Error: %s", error)
+                    logger.error("  Code: %s", result.get('code', 'N/A'))
+                    logger.error("  Slot: %s", result.get('slot', 'N/A'))
+                    return {'success': False, 'signature': tx_hash, 'error': error, 'result': result}
+                else:
+                    logger.error("Unexpected response from Jupiter: %s", result)
+                    return None
         except Exception as e:
-            logger.error(f"Error executing swap: {e}")
+            logger.error("Error executing swap: %s", e)
             import traceback
             logger.error(traceback.format_exc())
             return None
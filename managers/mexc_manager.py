@@ -4,24 +4,74 @@ MEXC Futures API manager
 import logging
 import asyncio
 import time
+import threading
 import hmac
 import hashlib
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional, Callable
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from utils.logging_setup import bot_logger
+from utils import json_utils
 
 logger = logging.getLogger(__name__)
 
+# Private WebSocket: keepalive ping period, and reconnects before polling
+MEXC_WS_PING_INTERVAL = 15  # seconds
+MEXC_WS_MAX_RECONNECTS = 3
+MEXC_POLL_FALLBACK_INTERVAL = 5  # seconds
+
+
+@dataclass(slots=True)
+class OrderResult:
+    """Summary of a submitted MEXC order"""
+    orderId: str
+    symbol: str
+    price: float
+    quantity: float
+
+
+@lru_cache(maxsize=256)
+def _normalize_symbol(symbol: str) -> str:
+    """Convert Binance-style symbol to MEXC format
+
+    MEXC uses underscore: BTC_USDT instead of BTCUSDT
+    """
+    if '_' in symbol:
+        return symbol
+    # Convert BTCUSDT -> BTC_USDT
+    if symbol.endswith('USDT'):
+        base = symbol[:-4]
+        return f"{base}_USDT"
+    return symbol
+
 
 class MEXCManager:
     BASE_URL = "https://contract.mexc.com"
+    WS_URL = "wss://contract.mexc.com/edge"
+
+    # MEXC order parameters shared by every limit sell:
+    # side: 3 = open short (sell)
+    # type: 1 = limit order
+    # openType: 1 = isolated, 2 = cross
+    # leverage: can be set (default 10)
+    _ORDER_PARAMS_TEMPLATE = {'side': 3, 'type': 1, 'openType': 1, 'leverage': 10}
 
     def __init__(self, api_key: str, api_secret: str, status_display: Optional['StatusDisplay'] = None):
         self.api_key = api_key
         self.api_secret = api_secret
+        # Pre-keyed HMAC: each signature copies it instead of redoing the key schedule
+        self._api_key_bytes = api_key.encode('utf-8')
+        self._hmac_template = hmac.new(api_secret.encode('utf-8'), b'', hashlib.sha256)
+        # Default headers of both REST sessions; requests only add the signature pair
+        self._base_headers = {'Content-Type': 'application/json', 'ApiKey': api_key}
         self.current_price = None
         self.current_order_id = None
+        self.order_symbol = None  # MEXC symbol of current_order_id
         self.last_order_price = None
         self.market_price_at_order = None
         self.symbol_precision = {}
@@ -31,73 +81,143 @@ class MEXCManager:
         self.ws_client = None
         self.ws_running = False
 
-    def _generate_signature(self, params: dict) -> str:
+        # One keep-alive session for all REST calls; only idempotent GETs are retried
+        self._http = requests.Session()
+        self._scratch = threading.local()  # per-thread params dict for _signed_get
+        self._aio = None  # aiohttp session for the async REST calls
+        self._http.headers.update(self._base_headers)
+        retry = Retry(total=2, backoff_factor=0.1, allowed_methods=frozenset({'GET'}))
+        self._http.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+
+    def _generate_signature(self, params: dict, timestamp: str) -> str:
         """Generate HMAC SHA256 signature for MEXC API"""
         # Sort parameters alphabetically
-        sorted_params = sorted(params.items())
-        query_string = '&'.join([f"{k}={v}" for k, v in sorted_params])
+        query_string = '&'.join(f"{k}={v}" for k, v in sorted(params.items())) if params else ''
 
         # Create signature: accessKey + timestamp + request parameters
-        sign_str = f"{self.api_key}{params.get('timestamp', '')}{query_string}"
-        signature = hmac.new(
-            self.api_secret.encode('utf-8'),
-            sign_str.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-
-        return signature
+        h = self._hmac_template.copy()
+        h.update(b'%s%s%s' % (self._api_key_bytes, timestamp.encode(), query_string.encode('utf-8')))
+        return h.hexdigest()
+
+    def _sign(self, params: dict, headers: dict):
+        """Add the timestamp to params and the Request-Time/Signature headers"""
+        timestamp = time.time_ns() // 1_000_000
+        params['timestamp'] = timestamp
+        # One str() shared by the header and the signed payload
+        headers['Request-Time'] = ts = str(timestamp)
+        headers['Signature'] = self._generate_signature(params, ts)
 
     def _request(self, method: str, endpoint: str, params: dict = None, signed: bool = False) -> dict:
         """Make HTTP request to MEXC API"""
         url = f"{self.BASE_URL}{endpoint}"
-        headers = {
-            'Content-Type': 'application/json',
-            'ApiKey': self.api_key
-        }
+        headers = None  # Content-Type and ApiKey are session defaults
 
         if params is None:
             params = {}
 
         if signed:
-            # Add timestamp for signed requests
-            params['timestamp'] = int(time.time() * 1000)
-            headers['Request-Time'] = str(params['timestamp'])
-            headers['Signature'] = self._generate_signature(params)
+            headers = {}
+            self._sign(params, headers)
 
         try:
             if method == 'GET':
-                response = requests.get(url, params=params, headers=headers)
+                response = self._http.get(url, params=params, headers=headers)
             elif method == 'POST':
-                response = requests.post(url, json=params, headers=headers)
+                response = self._http.post(url, data=json_utils.dumpb(params), headers=headers)
             elif method == 'DELETE':
-                response = requests.delete(url, params=params, headers=headers)
+                response = self._http.delete(url, params=params, headers=headers)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
             response.raise_for_status()
-            return response.json()
+            return json_utils.loads(response.content)
         except Exception as e:
-            logger.error(f"MEXC API request failed: {e}")
+            logger.error("MEXC API request failed: %s", e)
             if hasattr(e, 'response') and e.response is not None:
-                logger.error(f"Response: {e.response.text}")
+                logger.error("Response: %s", e.response.text)
             return None
 
-    def _normalize_symbol(self, symbol: str) -> str:
-        """Convert Binance-style symbol to MEXC format
+    async def _asession(self) -> aiohttp.ClientSession:
+        """Shared aiohttp session for the async REST calls, created on first use"""
+        if self._aio is None or self._aio.closed:
+            self._aio = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=16, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=10),
+                headers=self._base_headers,
+            )
+        return self._aio
+
+    async def close(self):
+        """Close the async REST session"""
+        if self._aio is not None:
+            await self._aio.close()
+            self._aio = None
+
+    async def _arequest(self, method: str, endpoint: str, params: dict = None, signed: bool = False) -> dict:
+        """Async counterpart of _request, for use directly on the event loop"""
+        url = f"{self.BASE_URL}{endpoint}"
+        headers = None
 
-        MEXC uses underscore: BTC_USDT instead of BTCUSDT
+        if params is None:
+            params = {}
+
+        if signed:
+            headers = {}
+            self._sign(params, headers)
+
+        try:
+            session = await self._asession()
+            if method == 'POST':
+                request = session.post(url, data=json_utils.dumpb(params), headers=headers)
+            elif method in ('GET', 'DELETE'):
+                request = session.request(method, url, params=params, headers=headers)
+            else:
+                raise ValueError(f"Unsupported HTTP method: {method}")
+
+            async with request as response:
+                body = await response.read()
+                if response.status >= 400:
+                    logger.error("MEXC API request failed: HTTP %s", response.status)
+                    logger.error("Response: %r", body[:500])
+                    return None
+                return json_utils.loads(body)
+        except Exception as e:
+            logger.error("MEXC API request failed: %s", e)
+            return None
+
+    def _signed_get(self, endpoint: str, extra_params: dict = None) -> dict:
+        """Signed GET for polled endpoints, reusing a per-thread params dict
+
+        Only the timestamp (and any extra params) change between polls, so
+        the dict is cleared and refilled instead of rebuilt. It is thread-local
+        because REST calls run on worker threads via asyncio.to_thread.
         """
-        if '_' in symbol:
-            return symbol
-        # Convert BTCUSDT -> BTC_USDT
-        if symbol.endswith('USDT'):
-            base = symbol[:-4]
-            return f"{base}_USDT"
-        return symbol
+        scratch = getattr(self._scratch, 'params', None)
+        if scratch is None:
+            scratch = self._scratch.params = {}
+        scratch.clear()
+        if extra_params:
+            scratch.update(extra_params)
+        scratch['timestamp'] = timestamp = time.time_ns() // 1_000_000
+        ts = str(timestamp)
+
+        try:
+            response = self._http.get(
+                f"{self.BASE_URL}{endpoint}",
+                params=scratch,
+                headers={'Request-Time': ts, 'Signature': self._generate_signature(scratch, ts)},
+            )
+            response.raise_for_status()
+            return json_utils.loads(response.content)
+        except Exception as e:
+            logger.error("MEXC API request failed: %s", e)
+            if hasattr(e, 'response') and e.response is not None:
+                logger.error("Response: %s", e.response.text)
+            return None
 
     def _get_symbol_precision(self, symbol: str) -> dict:
         """Get quantity and price precision for a symbol"""
-        mexc_symbol = self._normalize_symbol(symbol)
+        mexc_symbol = _normalize_symbol(symbol)
 
         if mexc_symbol in self.symbol_precision:
             return self.symbol_precision[mexc_symbol]
@@ -106,145 +226,204 @@ class MEXCManager:
             # Get contract details
             detail = self._request('GET', '/api/v1/contract/detail', {'symbol': mexc_symbol})
 
-            if detail and 'data' in detail:
-                data = detail['data']
-                precision = {
-                    'qty_decimals': data.get('volumeScale', 2),
-                    'price_decimals': data.get('priceScale', 2),
-                    'min_qty': float(data.get('minVol', 0)),
-                    'qty_step': float(data.get('volScale', 0.01)),
-                    'min_price': 0,  # MEXC doesn't provide this
-                    'price_step': float(data.get('priceUnit', 0.01)),
-                    'min_notional': 0  # MEXC doesn't provide this
-                }
-                self.symbol_precision[mexc_symbol] = precision
-                logger.info(f"Symbol {mexc_symbol}: qty_step={precision['qty_step']}, price_step={precision['price_step']}")
-                return precision
-
-            logger.error(f"Symbol {mexc_symbol} not found in contract details")
+            return self._store_precision(mexc_symbol, detail)
+        except Exception as e:
+            logger.error("Error getting symbol precision: %s", e)
             return None
+
+    async def _aget_precision(self, mexc_symbol: str) -> Optional[dict]:
+        """Async _get_symbol_precision (cached the same way)"""
+        if mexc_symbol in self.symbol_precision:
+            return self.symbol_precision[mexc_symbol]
+
+        try:
+            detail = await self._arequest('GET', '/api/v1/contract/detail', {'symbol': mexc_symbol})
+            return self._store_precision(mexc_symbol, detail)
         except Exception as e:
-            logger.error(f"Error getting symbol precision: {e}")
+            logger.error("Error getting symbol precision: %s", e)
             return None
 
-    def _format_quantity(self, symbol: str, quantity: float) -> float:
-        """Format quantity to match symbol's step size"""
-        mexc_symbol = self._normalize_symbol(symbol)
-        precision = self._get_symbol_precision(mexc_symbol)
+    def _store_precision(self, mexc_symbol: str, detail: dict) -> Optional[dict]:
+        """Parse a contract/detail response into the cached precision dict"""
+        if detail and 'data' in detail:
+            data = detail['data']
+            precision = {
+                'qty_decimals': data.get('volumeScale', 2),
+                'price_decimals': data.get('priceScale', 2),
+                'min_qty': float(data.get('minVol', 0)),
+                'qty_step': float(data.get('volScale', 0.01)),
+                'min_price': 0,  # MEXC doesn't provide this
+                'price_step': float(data.get('priceUnit', 0.01)),
+                'min_notional': 0  # MEXC doesn't provide this
+            }
+            # Reciprocals so formatting multiplies instead of dividing
+            precision['qty_step_inv'] = 1.0 / precision['qty_step'] if precision['qty_step'] else 0.0
+            precision['price_step_inv'] = 1.0 / precision['price_step'] if precision['price_step'] else 0.0
+            self.symbol_precision[mexc_symbol] = precision
+            logger.info("Symbol %s: qty_step=%s, price_step=%s", mexc_symbol, precision['qty_step'], precision['price_step'])
+            return precision
+
+        logger.error("Symbol %s not found in contract details", mexc_symbol)
+        return None
+
+    def _format_quantity(self, mexc_symbol: str, quantity: float, precision: Optional[dict] = None) -> float:
+        """Format quantity to match symbol's step size
+
+        Takes an already-normalized symbol; pass `precision` when the caller
+        has fetched it already.
+        """
+        if precision is None:
+            precision = self._get_symbol_precision(mexc_symbol)
 
         if not precision or precision['qty_step'] == 0:
             return round(quantity, precision['qty_decimals'] if precision else 2)
 
-        qty_step = precision['qty_step']
-        formatted = round(quantity / qty_step) * qty_step
+        formatted = round(round(quantity * precision['qty_step_inv']) * precision['qty_step'], precision['qty_decimals'])
 
         if precision['min_qty'] > 0 and formatted < precision['min_qty']:
-            logger.warning(f"Quantity {formatted} below minimum {precision['min_qty']}")
+            logger.warning("Quantity %s below minimum %s", formatted, precision['min_qty'])
 
         return formatted
 
-    def _format_price(self, symbol: str, price: float) -> float:
-        """Format price to match symbol's tick size"""
-        mexc_symbol = self._normalize_symbol(symbol)
-        precision = self._get_symbol_precision(mexc_symbol)
+    def _format_price(self, mexc_symbol: str, price: float, precision: Optional[dict] = None) -> float:
+        """Format price to match symbol's tick size (same arguments as _format_quantity)"""
+        if precision is None:
+            precision = self._get_symbol_precision(mexc_symbol)
 
         if not precision or precision['price_step'] == 0:
             return round(price, precision['price_decimals'] if precision else 2)
 
-        price_step = precision['price_step']
-        formatted = round(price / price_step) * price_step
+        return round(round(price * precision['price_step_inv']) * precision['price_step'], precision['price_decimals'])
 
-        decimals = precision['price_decimals']
-        return round(formatted, decimals)
+    @staticmethod
+    def _ticker_request_spec(mexc_symbol: str) -> tuple:
+        """(method, path, params) of the ticker request, shared by sync and async paths"""
+        return 'GET', '/api/v1/contract/ticker', {'symbol': mexc_symbol}
 
-    def get_current_price(self, symbol: str) -> float:
-        """Get current market price from MEXC perpetual futures"""
-        mexc_symbol = self._normalize_symbol(symbol)
+    def _record_price(self, mexc_symbol: str, ticker: Optional[dict]) -> Optional[float]:
+        """Parse lastPrice from a ticker response and record it"""
+        if ticker and 'data' in ticker:
+            price = float(ticker['data']['lastPrice'])
+            self.current_price = price
+            logger.info("Current %s price: %s", mexc_symbol, price)
 
-        try:
-            ticker = self._request('GET', '/api/v1/contract/ticker', {'symbol': mexc_symbol})
+            # Log to bot activity
+            bot_logger.info("PRICE_UPDATE | Symbol: %s | Price: $%.8f", mexc_symbol, price)
 
-            if ticker and 'data' in ticker:
-                price = float(ticker['data']['lastPrice'])
-                self.current_price = price
-                logger.info(f"Current {mexc_symbol} price: {price}")
+            # Update status display
+            if self.status_display:
+                self.status_display.update_price(price)
 
-                # Log to bot activity
-                bot_logger.info(f"PRICE_UPDATE | Symbol: {mexc_symbol} | Price: ${price:.8f}")
+            return price
 
-                # Update status display
-                if self.status_display:
-                    self.status_display.update_price(price)
+        logger.error("Invalid ticker response for %s", mexc_symbol)
+        return None
 
-                return price
+    def get_current_price(self, symbol: str) -> float:
+        """Get current market price from MEXC perpetual futures"""
+        mexc_symbol = _normalize_symbol(symbol)
 
-            logger.error(f"Invalid ticker response for {mexc_symbol}")
+        try:
+            ticker = self._request(*self._ticker_request_spec(mexc_symbol))
+            return self._record_price(mexc_symbol, ticker)
+        except Exception as e:
+            logger.error("Error fetching price: %s", e)
             return None
+
+    async def aget_current_price(self, symbol: str) -> Optional[float]:
+        """Async get_current_price over the shared aiohttp session
+
+        Lets callers overlap the ticker round-trip with other requests,
+        e.g. gather it with a Jupiter quote.
+        """
+        mexc_symbol = _normalize_symbol(symbol)
+
+        try:
+            ticker = await self._arequest(*self._ticker_request_spec(mexc_symbol))
+            return self._record_price(mexc_symbol, ticker)
         except Exception as e:
-            logger.error(f"Error fetching price: {e}")
+            logger.error("Error fetching price: %s", e)
             return None
 
-    def place_limit_sell_order(self, symbol: str, usd_amount: float, price: float, market_price: float) -> dict:
+    def place_limit_sell_order(self, symbol: str, usd_amount: float, price: float, market_price: float) -> Optional[OrderResult]:
         """Place a limit sell order on MEXC perpetual using USD amount
 
         Note: MEXC's order API may be under maintenance. This uses the pymexc bypass.
         """
-        mexc_symbol = self._normalize_symbol(symbol)
+        mexc_symbol = _normalize_symbol(symbol)
 
         try:
-            # Calculate token quantity from USD amount and price
-            token_quantity = usd_amount / price
-            formatted_qty = self._format_quantity(mexc_symbol, token_quantity)
-            formatted_price = self._format_price(mexc_symbol, price)
-
-            logger.info(f"Placing order: ${usd_amount:.2f} USD ({formatted_qty} {mexc_symbol}) at {formatted_price} (market: {market_price})")
-
-            # MEXC order parameters:
-            # side: 3 = open short (sell)
-            # type: 1 = limit order
-            # open_type: 1 = isolated, 2 = cross
-            # leverage: can be set (default 10)
-            params = {
-                'symbol': mexc_symbol,
-                'price': formatted_price,
-                'vol': formatted_qty,
-                'side': 3,  # 3 = open short (sell)
-                'type': 1,  # 1 = limit order
-                'openType': 1,  # isolated margin
-                'leverage': 10  # default leverage
-            }
-
+            precision = self._get_symbol_precision(mexc_symbol)
+            params = self._order_params(mexc_symbol, usd_amount, price, market_price, precision)
             order = self._request('POST', '/api/v1/private/order/submit', params, signed=True)
+            return self._record_order(order, mexc_symbol, usd_amount, params['vol'], params['price'], market_price)
+        except Exception as e:
+            logger.error("Error placing order: %s", e)
+            return None
 
-            if order and 'data' in order:
-                order_id = order['data']
-                self.current_order_id = order_id
-                self.last_order_price = formatted_price
-                self.market_price_at_order = market_price
+    async def place_limit_sell_order_async(self, symbol: str, usd_amount: float, price: float, market_price: float) -> Optional[OrderResult]:
+        """Async place_limit_sell_order over the shared aiohttp session"""
+        mexc_symbol = _normalize_symbol(symbol)
 
-                # Log order details
-                from utils.logging_setup import orders_logger
-                orders_logger.info(f"ORDER_PLACED | Symbol: {mexc_symbol} | OrderID: {order_id} | Side: SELL | USD_Amount: ${usd_amount:.2f} | Quantity: {formatted_qty} | Price: {formatted_price} | Market_Price: {market_price}")
+        try:
+            precision = await self._aget_precision(mexc_symbol)
+            params = self._order_params(mexc_symbol, usd_amount, price, market_price, precision)
+            order = await self._arequest('POST', '/api/v1/private/order/submit', params, signed=True)
+            return self._record_order(order, mexc_symbol, usd_amount, params['vol'], params['price'], market_price)
+        except Exception as e:
+            logger.error("Error placing order: %s", e)
+            return None
 
-                # Log to bot activity
-                bot_logger.info(f"ORDER_CREATED | Symbol: {mexc_symbol} | OrderID: {order_id} | Side: SELL | USD: ${usd_amount:.2f} | Qty: {formatted_qty} | Price: ${formatted_price:.8f} | Market: ${market_price:.8f}")
+    async def prepare_order(self, symbol: str) -> Optional[float]:
+        """Fetch contract precision and the market price concurrently
 
-                logger.info(f"Order placed: {order_id} - Sell ${usd_amount:.2f} USD ({formatted_qty} {mexc_symbol}) at {formatted_price}")
+        Warms the precision cache so the following place_limit_sell_order_async
+        only has the submit round-trip left; returns the market price.
+        """
+        mexc_symbol = _normalize_symbol(symbol)
+        _, price = await asyncio.gather(self._aget_precision(mexc_symbol), self.aget_current_price(symbol))
+        return price
+
+    def _order_params(self, mexc_symbol: str, usd_amount: float, price: float, market_price: float, precision: Optional[dict]) -> dict:
+        """Size and round a limit sell for usd_amount at price"""
+        # Calculate token quantity from USD amount and price
+        token_quantity = usd_amount / price
+        formatted_qty = self._format_quantity(mexc_symbol, token_quantity, precision)
+        formatted_price = self._format_price(mexc_symbol, price, precision)
+
+        logger.info("Placing order: $%.2f USD (%s %s) at %s (market: %s)", usd_amount, formatted_qty, mexc_symbol, formatted_price, market_price)
+
+        return {**self._ORDER_PARAMS_TEMPLATE, 'symbol': mexc_symbol, 'price': formatted_price, 'vol': formatted_qty}
+
+    def _record_order(self, order: dict, mexc_symbol: str, usd_amount: float, formatted_qty: float, formatted_price: float, market_price: float) -> Optional[OrderResult]:
+        """Track and log a submit response; returns the order summary or None"""
+        if order and 'data' in order:
+            order_id = order['data']
+            self.current_order_id = order_id
+            self.order_symbol = mexc_symbol
+            self.last_order_price = formatted_price
+            self.market_price_at_order = market_price
+
+            # Log order details
+            from utils.logging_setup import orders_logger
+            orders_logger.info("ORDER_PLACED | Symbol: %s | OrderID: %s | Side: SELL | USD_Amount: $%.2f | Quantity: %s | Price: %s | Market_Price: %s", mexc_symbol, order_id, usd_amount, formatted_qty, formatted_price, market_price)
 
-                # Update status display
-                if self.status_display:
-                    self.status_display.set_order(order_id, formatted_price, formatted_qty)
-                    self.status_display.add_action(f"✅ ORDER PLACED: ID={order_id} | ${formatted_price:.6f} | Qty={formatted_qty:.4f}")
+            # Log to bot activity
+            bot_logger.info("ORDER_CREATED | Symbol: %s | OrderID: %s | Side: SELL | USD: $%.2f | Qty: %s | Price: $%.8f | Market: $%.8f", mexc_symbol, order_id, usd_amount, formatted_qty, formatted_price, market_price)
 
-                return {'orderId': order_id, 'symbol': mexc_symbol, 'price': formatted_price, 'quantity': formatted_qty}
+            logger.info("Order placed: %s - Sell $%.2f USD (%s %s) at %s", order_id, usd_amount, formatted_qty, mexc_symbol, formatted_price)
 
-            logger.error(f"Failed to place order: {order}")
-            return None
-        except Exception as e:
-            logger.error(f"Error placing order: {e}")
-            return None
+            # Update status display
+            if self.status_display:
+                self.status_display.set_order(order_id, formatted_price, formatted_qty)
+                self.status_display.add_action(f"✅ ORDER PLACED: ID={order_id} | ${formatted_price:.6f} | Qty={formatted_qty:.4f}")
 
-    def modify_order(self, symbol: str, order_id: str, usd_amount: float, new_price: float, market_price: float) -> dict:
+            return OrderResult(order_id, mexc_symbol, formatted_price, formatted_qty)
+
+        logger.error("Failed to place order: %s", order)
+        return None
+
+    def modify_order(self, symbol: str, order_id: str, usd_amount: float, new_price: float, market_price: float) -> Optional[OrderResult]:
         """Modify existing order (MEXC doesn't support modify, so cancel + recreate)
 
         Args:
@@ -255,14 +434,14 @@ class MEXCManager:
             market_price: Current market price (for logging)
 
         Returns:
-            New order dict or None on failure
+            New OrderResult or None on failure
         """
-        mexc_symbol = self._normalize_symbol(symbol)
+        mexc_symbol = _normalize_symbol(symbol)
 
         try:
             # MEXC doesn't have order modification endpoint
             # Fallback to cancel + create atomically
-            logger.info(f"MEXC doesn't support modify - using cancel+create for order {order_id}")
+            logger.info("MEXC doesn't support modify - using cancel+create for order %s", order_id)
 
             # Cancel old order
             self.cancel_order(symbol, order_id)
@@ -273,26 +452,26 @@ class MEXCManager:
             if new_order:
                 # Log as modification for consistency
                 from utils.logging_setup import orders_logger
-                orders_logger.info(f"ORDER_MODIFIED | Symbol: {mexc_symbol} | OldOrderID: {order_id} | NewOrderID: {new_order.get('orderId')} | New_Price: {new_price} | USD_Amount: ${usd_amount:.2f} | Market_Price: {market_price}")
-                logger.info(f"Order modified (cancel+create): {order_id} → {new_order.get('orderId')}")
+                orders_logger.info("ORDER_MODIFIED | Symbol: %s | OldOrderID: %s | NewOrderID: %s | New_Price: %s | USD_Amount: $%.2f | Market_Price: %s", mexc_symbol, order_id, new_order.orderId, new_price, usd_amount, market_price)
+                logger.info("Order modified (cancel+create): %s → %s", order_id, new_order.orderId)
 
             return new_order
         except Exception as e:
-            logger.error(f"Error modifying order: {e}")
+            logger.error("Error modifying order: %s", e)
             return None
 
     def cancel_order(self, symbol: str, order_id: str) -> bool:
         """Cancel existing order"""
-        mexc_symbol = self._normalize_symbol(symbol)
+        mexc_symbol = _normalize_symbol(symbol)
 
         try:
             params = {'orderIds': [order_id]}
             result = self._request('POST', '/api/v1/private/order/cancel', params, signed=True)
-            logger.info(f"Order {order_id} cancellation result: {result}")
+            logger.info("Order %s cancellation result: %s", order_id, result)
             self.current_order_id = None
 
             # Log to bot activity
-            bot_logger.info(f"ORDER_CANCELLED | Symbol: {mexc_symbol} | OrderID: {order_id}")
+            bot_logger.info("ORDER_CANCELLED | Symbol: %s | OrderID: %s", mexc_symbol, order_id)
 
             # Update status display
             if self.status_display:
@@ -301,24 +480,23 @@ class MEXCManager:
 
             return True
         except Exception as e:
-            logger.error(f"Error cancelling order: {e}")
+            logger.error("Error cancelling order: %s", e)
             return False
 
     def check_order_filled(self, symbol: str, order_id: str) -> Optional[dict]:
         """Check if order has been filled"""
-        mexc_symbol = self._normalize_symbol(symbol)
+        mexc_symbol = _normalize_symbol(symbol)
 
         try:
             # Get open orders - if order is not in list, it's filled
-            open_orders = self.get_open_orders(mexc_symbol)
+            open_ids = self.get_open_order_ids(mexc_symbol)
+            if open_ids is None:
+                return None  # request failed; don't mistake that for a fill
 
-            # Check if order_id is in open orders
-            order_still_open = any(str(o.get('orderId')) == str(order_id) for o in open_orders)
-
-            if not order_still_open:
+            if str(order_id) not in open_ids:
                 # Order is not open anymore - assume it's filled
                 # TODO: Query order history to get fill details
-                logger.info(f"Order {order_id} appears to be FILLED (not in open orders)")
+                logger.info("Order %s appears to be FILLED (not in open orders)", order_id)
 
                 # For now, return a basic filled order structure
                 # In production, you'd want to query order history for actual fill details
@@ -331,7 +509,7 @@ class MEXCManager:
                 }
 
                 # Log to bot activity
-                bot_logger.info(f"ORDER_FILLED | Symbol: {mexc_symbol} | OrderID: {order_id}")
+                bot_logger.info("ORDER_FILLED | Symbol: %s | OrderID: %s", mexc_symbol, order_id)
 
                 # Update status display
                 if self.status_display:
@@ -342,34 +520,71 @@ class MEXCManager:
 
             return None
         except Exception as e:
-            logger.error(f"Error checking order: {e}")
+            logger.error("Error checking order: %s", e)
             return None
 
+    @property
+    def market_price_at_order(self) -> Optional[float]:
+        """Market price when the current order was placed or last modified"""
+        return self._market_price_at_order
+
+    @market_price_at_order.setter
+    def market_price_at_order(self, price: Optional[float]):
+        self._market_price_at_order = price
+        self._update_bounds = None  # recomputed on the next should_update_order()
+
     def should_update_order(self, current_price: float, threshold: float) -> bool:
-        """Check if market price has changed by threshold percent since order was placed"""
-        if self.market_price_at_order is None:
-            return False
+        """Check if market price has changed by threshold percent since order was placed
 
-        price_change = abs(current_price - self.market_price_at_order) / self.market_price_at_order * 100
-        return price_change >= threshold
+        The lower/upper trigger prices are computed once per order price (and
+        threshold), so each tick is just two comparisons.
+        """
+        bounds = self._update_bounds
+        if bounds is None or bounds[0] != threshold:
+            reference = self._market_price_at_order
+            if reference is None:
+                return False
+            bounds = self._update_bounds = (
+                threshold,
+                reference * (1 - threshold / 100),
+                reference * (1 + threshold / 100),
+            )
+        return current_price <= bounds[1] or current_price >= bounds[2]
 
     def get_open_orders(self, symbol: str) -> list:
         """Get all open orders for a symbol"""
-        mexc_symbol = self._normalize_symbol(symbol)
+        mexc_symbol = _normalize_symbol(symbol)
 
         try:
-            result = self._request('GET', f'/api/v1/private/order/list/open_orders/{mexc_symbol}', signed=True)
+            result = self._signed_get(f'/api/v1/private/order/list/open_orders/{mexc_symbol}')
 
             if result and 'data' in result:
                 return result['data']
 
             return []
         except Exception as e:
-            logger.error(f"Error getting open orders: {e}")
+            logger.error("Error getting open orders: %s", e)
             return []
 
+    def get_open_order_ids(self, symbol: str) -> Optional[set]:
+        """IDs (as strings) of open orders for a symbol, or None if the request failed
+
+        Fill detection only needs the IDs, so the order objects are dropped
+        right after parsing instead of being passed around.
+        """
+        mexc_symbol = _normalize_symbol(symbol)
+
+        result = self._signed_get(f'/api/v1/private/order/list/open_orders/{mexc_symbol}')
+        if not result or 'data' not in result:
+            return None
+        return {str(o['orderId']) for o in result['data']}
+
     async def start_user_stream(self, on_order_update: Callable):
-        """Start order monitoring (uses polling instead of WebSocket due to pymexc issues)
+        """Start order monitoring over the MEXC private WebSocket
+
+        Fills are pushed on `push.personal.order`. If the socket cannot be
+        (re)established after MEXC_WS_MAX_RECONNECTS attempts, falls back to
+        REST polling every MEXC_POLL_FALLBACK_INTERVAL seconds.
 
         Args:
             on_order_update: Async callback function to handle order updates
@@ -378,49 +593,124 @@ class MEXCManager:
         try:
             self.ws_running = True
 
-            logger.info("📊 Starting MEXC order monitoring (polling mode)...")
-            bot_logger.info("POLLING_START | Using polling for order updates (MEXC WebSocket unavailable)")
+            for attempt in range(1, MEXC_WS_MAX_RECONNECTS + 1):
+                try:
+                    if await self._ws_order_stream(on_order_update):
+                        return
+                except Exception as e:
+                    logger.warning("MEXC WebSocket failed (attempt %s/%s): %s", attempt, MEXC_WS_MAX_RECONNECTS, e)
+                    bot_logger.warning("WEBSOCKET_ERROR | MEXC attempt %s: %s", attempt, e)
+                if not self.ws_running:
+                    return
+                await asyncio.sleep(attempt)
 
-            last_check_order_id = self.current_order_id
+            await self._poll_order_fill(on_order_update, MEXC_POLL_FALLBACK_INTERVAL)
 
-            # Poll for order updates every second
-            while self.ws_running:
-                try:
-                    if self.current_order_id and str(self.current_order_id) == str(last_check_order_id):
-                        # Get order details
-                        open_orders = self.get_open_orders(self.current_order_id)
+        except Exception as e:
+            logger.error("Polling error: %s", e)
+            bot_logger.error("POLLING_ERROR | %s", e)
+            import traceback
+            logger.error(traceback.format_exc())
+            raise
+        finally:
+            await self.stop_user_stream()
 
-                        # If order is not in open orders, it's been filled
-                        order_still_open = any(str(o.get('orderId')) == str(self.current_order_id) for o in open_orders)
+    async def _ws_order_stream(self, on_order_update: Callable) -> bool:
+        """Log in to the private WebSocket and wait for our order to fill
 
-                        if not order_still_open:
-                            logger.info(f"📊 Polling: Order {self.current_order_id} FILLED!")
-                            bot_logger.info(f"POLLING_ORDER_FILL | OrderID: {self.current_order_id}")
+        Returns True once the fill callback ran, False if stopped or the
+        server closed the socket.
+        """
+        async with aiohttp.ClientSession() as session:
+            async with session.ws_connect(self.WS_URL, heartbeat=None) as ws:
+                self.ws_client = ws
+
+                req_time = str(time.time_ns() // 1_000_000)
+                h = self._hmac_template.copy()
+                h.update(self._api_key_bytes + req_time.encode())
+                await ws.send_bytes(json_utils.dumpb({
+                    'method': 'login',
+                    'param': {'apiKey': self.api_key, 'reqTime': req_time, 'signature': h.hexdigest()},
+                }))
+
+                logger.info("🔌 Starting MEXC WebSocket order stream...")
+                bot_logger.info("WEBSOCKET_START | MEXC private order stream")
+
+                ping_task = asyncio.create_task(self._ws_ping(ws))
+                try:
+                    async for msg in ws:
+                        if not self.ws_running:
+                            return False
+                        if msg.type not in (aiohttp.WSMsgType.TEXT, aiohttp.WSMsgType.BINARY):
+                            break
+
+                        event = json_utils.loads(msg.data)
+                        channel = event.get('channel')
+                        if channel == 'rs.login' and event.get('data') != 'success':
+                            raise ConnectionError(f"MEXC WebSocket login failed: {event.get('data')}")
+                        if channel == 'rs.error':
+                            raise ConnectionError(f"MEXC WebSocket error: {event.get('data')}")
+                        if channel != 'push.personal.order':
+                            continue
+
+                        data = event.get('data') or {}
+                        # state 3 = completed (fully filled)
+                        if data.get('state') == 3 and self.current_order_id and str(data.get('orderId')) == str(self.current_order_id):
+                            logger.info("🔔 WebSocket: Order %s FILLED!", self.current_order_id)
+                            bot_logger.info("WEBSOCKET_ORDER_FILL | OrderID: %s", self.current_order_id)
 
-                            # Build filled order structure
                             filled_order = {
                                 'orderId': self.current_order_id,
                                 'status': 'FILLED',
-                                'avgPrice': self.last_order_price,  # Best guess
-                                'executedQty': 0,  # Unknown without history query
+                                'avgPrice': data.get('dealAvgPrice') or self.last_order_price,
+                                'executedQty': data.get('dealVol', 0),
                             }
-
-                            # Call the callback
                             await on_order_update(filled_order)
-                            break
-
-                except Exception as e:
-                    logger.error(f"Error checking order status: {e}")
-
-                await asyncio.sleep(1)
-
-        except Exception as e:
-            logger.error(f"Polling error: {e}")
-            bot_logger.error(f"POLLING_ERROR | {e}")
-            import traceback
-            logger.error(traceback.format_exc())
-        finally:
-            await self.stop_user_stream()
+                            return True
+                finally:
+                    ping_task.cancel()
+        return False
+
+    async def _ws_ping(self, ws):
+        """MEXC drops private sockets that go 60s without a ping"""
+        ping = json_utils.dumpb({'method': 'ping'})
+        while True:
+            await asyncio.sleep(MEXC_WS_PING_INTERVAL)
+            await ws.send_bytes(ping)
+
+    async def _poll_order_fill(self, on_order_update: Callable, interval: float):
+        """Fallback: detect the fill by polling open orders"""
+        logger.info("📊 Starting MEXC order monitoring (polling mode)...")
+        bot_logger.info("POLLING_START | Using polling for order updates (MEXC WebSocket unavailable)")
+
+        last_check_order_id = str(self.current_order_id)
+
+        while self.ws_running:
+            try:
+                if self.current_order_id and str(self.current_order_id) == last_check_order_id:
+                    open_ids = await asyncio.to_thread(self.get_open_order_ids, self.order_symbol)
+
+                    # If order is not in open orders, it's been filled
+                    if open_ids is not None and last_check_order_id not in open_ids:
+                        logger.info("📊 Polling: Order %s FILLED!", self.current_order_id)
+                        bot_logger.info("POLLING_ORDER_FILL | OrderID: %s", self.current_order_id)
+
+                        # Build filled order structure
+                        filled_order = {
+                            'orderId': self.current_order_id,
+                            'status': 'FILLED',
+                            'avgPrice': self.last_order_price,  # Best guess
+                            'executedQty': 0,  # Unknown without history query
+                        }
+
+                        # Call the callback
+                        await on_order_update(filled_order)
+                        break
+
+            except Exception as e:
+                logger.error("Error checking order status: %s", e)
+
+            await asyncio.sleep(interval)
 
     async def stop_user_stream(self):
         """Stop WebSocket user data stream"""
@@ -429,9 +719,9 @@ class MEXCManager:
 
             if self.ws_client:
                 logger.info("🔌 Stopping WebSocket user data stream...")
-                # WebSocket cleanup
+                await self.ws_client.close()
                 self.ws_client = None
 
             bot_logger.info("WEBSOCKET_STOP | User data stream stopped")
         except Exception as e:
-            logger.error(f"Error stopping WebSocket: {e}")
+            logger.error("Error stopping WebSocket: %s", e)
@@ -1,23 +1,70 @@
 """
 OKX DEX swap manager for multi-chain (BSC + Solana)
+
+Chain SDKs (solders, base58, web3) are imported on first use of their chain,
+so a Solana-only or BSC-only setup does not pay the other's import time.
 """
+from __future__ import annotations
+
 import json
+import asyncio
 import base64
 import logging
 import time
 import hmac
 import hashlib
-from typing import Optional, Literal
-import base58
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, List, Optional, Literal, Tuple
+from urllib.parse import urlencode
 import aiohttp
-from solders.keypair import Keypair
-from solders.transaction import VersionedTransaction
-from web3 import Web3
+
+from utils import json_utils
+from utils.solana_tx import b58decode, b64decode, b64encode, sign_in_place
+
+if TYPE_CHECKING:
+    from solders.keypair import Keypair
 
 logger = logging.getLogger(__name__)
 
 ChainType = Literal['bsc', 'solana']
 
+JSON_HEADERS = {'Content-Type': 'application/json'}
+
+# Characters that occur in base64 but never in base58
+_NON_BASE58_CHARS = frozenset('+/=0OIl')
+
+
+def _decode_tx(data: str) -> bytes:
+    """Decode a serialized transaction that OKX sends as base58 or base64"""
+    if not _NON_BASE58_CHARS.isdisjoint(data):
+        return b64decode(data)
+    try:
+        return b58decode(data)
+    except Exception:
+        # Valid in both alphabets but not base58 after all
+        return b64decode(data)
+
+
+# How long an identical quote is served from cache, in seconds
+QUOTE_CACHE_TTL = 0.25
+QUOTE_CACHE_MAX_ENTRIES = 512
+
+# BSC gas price is refreshed in the background every GAS_PRICE_REFRESH seconds
+# (about one block); a cached value older than GAS_PRICE_MAX_AGE is re-fetched
+GAS_PRICE_REFRESH = 2.5
+GAS_PRICE_MAX_AGE = 10.0
+
+
+@dataclass(frozen=True, slots=True)
+class ChainCfg:
+    """Static per-chain settings for the OKX aggregator"""
+    chain_id: str
+    type: str
+    name: str
+    rpc_url: Optional[str] = None
+
 
 class OKXDexManager:
     """
@@ -26,20 +73,24 @@ class OKXDexManager:
 
     # Chain configurations
     CHAINS = {
-        'bsc': {
-            'chainId': '56',
-            'type': 'evm',
-            'name': 'Binance Smart Chain',
-            'rpc_url': 'https://bsc-dataseed1.binance.org'
-        },
-        'solana': {
-            'chainId': '501',
-            'type': 'solana',
-            'name': 'Solana Mainnet'
-        }
+        'bsc': ChainCfg(chain_id='56', type='evm', name='Binance Smart Chain', rpc_url='https://bsc-dataseed1.binance.org'),
+        'solana': ChainCfg(chain_id='501', type='solana', name='Solana Mainnet'),
     }
 
     BASE_URL = "https://www.okx.com"
+    DEFAULT_SOLANA_RPC_URLS = ('https://api.mainnet-beta.solana.com',)
+
+    # sendTransaction request; only params (tx + shared options) change per
+    # submit. Never mutate these, copy the template instead.
+    _SEND_TX_OPTIONS = {
+        "encoding": "base64",
+        "skipPreflight": False,
+        "preflightCommitment": "confirmed",
+        "maxRetries": 3
+    }
+    _SEND_TX_TEMPLATE = {"jsonrpc": "2.0", "id": 1, "method": "sendTransaction"}
+    QUOTE_PATH = '/api/v5/dex/aggregator/quote'
+    SWAP_PATH = '/api/v5/dex/aggregator/swap'
 
     def __init__(
         self,
@@ -48,7 +99,10 @@ class OKXDexManager:
         passphrase: str,
         solana_private_key: Optional[str] = None,
         bsc_private_key: Optional[str] = None,
-        max_slippage: float = 1.0
+        max_slippage: float = 1.0,
+        solana_rpc_urls: Optional[List[str]] = None,
+        quote_cache_ttl: float = QUOTE_CACHE_TTL,
+        max_concurrency: int = 10
     ):
         """
         Initialize OKX DEX manager
@@ -60,46 +114,145 @@ class OKXDexManager:
             solana_private_key: Solana wallet private key (base58 or JSON)
             bsc_private_key: BSC wallet private key (hex format)
             max_slippage: Maximum slippage tolerance (default 1.0%)
+            solana_rpc_urls: Solana RPC endpoints to broadcast to (default: public mainnet)
+            quote_cache_ttl: Seconds an identical quote is reused (0 disables caching)
+            max_concurrency: Max quote requests batch_quote keeps in flight
         """
         self.api_key = api_key
         self.secret_key = secret_key
         self.passphrase = passphrase
         self.max_slippage = max_slippage
+        self.solana_rpc_urls = list(solana_rpc_urls or self.DEFAULT_SOLANA_RPC_URLS)
+        # Pre-keyed HMAC: each signature copies it instead of redoing the key schedule
+        self._hmac_template = hmac.new(secret_key.encode('utf-8'), b'', hashlib.sha256)
+        # Static auth headers; _get_headers adds the signature and timestamp
+        self._base_headers = {
+            'OK-ACCESS-KEY': api_key,
+            'OK-ACCESS-PASSPHRASE': passphrase,
+            'Content-Type': 'application/json'
+        }
 
         # Solana wallet
         self.solana_keypair = None
+        self.solana_address: Optional[str] = None
         if solana_private_key:
             self.solana_keypair = self._load_solana_keypair(solana_private_key)
-            logger.info(f"Solana wallet loaded: {self.solana_keypair.pubkey()}")
+            self.solana_address = str(self.solana_keypair.pubkey())
+            logger.info("Solana wallet loaded: %s", self.solana_address)
 
         # BSC wallet (Web3)
         self.bsc_account = None
+        self.bsc_address: Optional[str] = None
         self.bsc_web3 = None
+        self._bsc_nonce: Optional[int] = None  # next nonce, tracked locally after the first chain read
+        self._gas_price_cache: Tuple[float, Optional[int]] = (0.0, None)  # (monotonic time, wei)
+        self._gas_price_task: Optional[asyncio.Task] = None
         if bsc_private_key:
-            self.bsc_web3 = Web3(Web3.HTTPProvider(self.CHAINS['bsc']['rpc_url']))
-            self.bsc_account = self.bsc_web3.eth.account.from_key(bsc_private_key)
-            logger.info(f"BSC wallet loaded: {self.bsc_account.address}")
+            from web3 import AsyncWeb3, AsyncHTTPProvider
+            from eth_account import Account
+            self.bsc_web3 = AsyncWeb3(AsyncHTTPProvider(self.CHAINS['bsc'].rpc_url))
+            self.bsc_account = Account.from_key(bsc_private_key)
+            self.bsc_address = self.bsc_account.address
+            logger.info("BSC wallet loaded: %s", self.bsc_address)
+
+        # Keep-alive session shared by OKX API and Solana RPC calls
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Recent quotes, (monotonic time, quote) by request key, and the
+        # futures of requests currently in flight so duplicates can join them
+        self._quote_ttl = quote_cache_ttl
+        self._quote_cache: OrderedDict = OrderedDict()  # least recently used first
+        self._quote_inflight: dict = {}
+        self._quote_semaphore = asyncio.Semaphore(max_concurrency)
+
+        # Swap executor per chain
+        self._executors = {
+            'bsc': self.execute_swap_bsc,
+            'solana': self.execute_swap_solana,
+        }
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the shared HTTP session, creating it on first use
+
+        Created lazily because aiohttp needs a running event loop.
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                # Bounded to stay well inside OKX's per-IP rate limits
+                connector=aiohttp.TCPConnector(
+                    limit=32, limit_per_host=16, ttl_dns_cache=300,
+                    keepalive_timeout=75, enable_cleanup_closed=True
+                ),
+                timeout=aiohttp.ClientTimeout(total=10, connect=3),
+                json_serialize=json_utils.dumps,
+            )
+        return self._session
+
+    async def warmup(self):
+        """Open connections to the OKX API and chain RPCs ahead of the first quote
+
+        Pays DNS + TCP + TLS setup for every host up front and in parallel;
+        the pooled session keeps the connections for later requests.
+        Failures are ignored, the real request simply connects again.
+        """
+        session = await self._ensure_session()
+
+        async def touch(url: str):
+            async with session.head(url, allow_redirects=False):
+                pass
+
+        probes = [touch(self.BASE_URL)] + [touch(url) for url in self.solana_rpc_urls]
+        if self.bsc_web3 is not None:
+            probes.append(self.bsc_web3.eth.chain_id)
+        results = await asyncio.gather(*probes, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.debug("Warmup request failed: %s", result)
+
+    async def close(self):
+        """Stop the gas price refresher and close the HTTP sessions"""
+        if self._gas_price_task is not None:
+            self._gas_price_task.cancel()
+            self._gas_price_task = None
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self.bsc_web3 is not None:
+            # AsyncHTTPProvider keeps its own cached aiohttp session per RPC URL
+            # (web3 6.x has no provider disconnect); fetch and close it. A later
+            # request on this provider simply caches a fresh one.
+            provider_session = await self.bsc_web3.provider.cache_async_session(None)
+            await provider_session.close()
+
+    async def __aenter__(self):
+        self._start_gas_price_refresher()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
 
     def _load_solana_keypair(self, private_key_str: str) -> Keypair:
         """Load Solana keypair from private key string (base58 or JSON array)"""
+        from solders.keypair import Keypair
+
         private_key_str = private_key_str.strip()
 
-        logger.info(f"Loading Solana keypair from {len(private_key_str)} char key")
+        logger.info("Loading Solana keypair from %s char key", len(private_key_str))
 
         # Try base58 format
         try:
-            secret_bytes = base58.b58decode(private_key_str)
+            secret_bytes = b58decode(private_key_str)
             if len(secret_bytes) == 64:
                 seed = secret_bytes[:32]
                 kp = Keypair.from_seed(seed)
-                logger.info(f"✓ Loaded keypair from base58 format (64 bytes)")
+                logger.info("✓ Loaded keypair from base58 format (64 bytes)")
                 return kp
             elif len(secret_bytes) == 32:
                 kp = Keypair.from_seed(secret_bytes)
-                logger.info(f"✓ Loaded keypair from base58 format (32 bytes)")
+                logger.info("✓ Loaded keypair from base58 format (32 bytes)")
                 return kp
         except Exception as e:
-            logger.debug(f"Base58 decode failed: {e}")
+            logger.debug("Base58 decode failed: %s", e)
 
         # Try JSON array format
         try:
@@ -110,14 +263,14 @@ class OKXDexManager:
                 if len(secret_bytes) == 64:
                     seed = secret_bytes[:32]
                     kp = Keypair.from_seed(seed)
-                    logger.info(f"✓ Loaded keypair from JSON array format (64 bytes)")
+                    logger.info("✓ Loaded keypair from JSON array format (64 bytes)")
                     return kp
                 elif len(secret_bytes) == 32:
                     kp = Keypair.from_seed(secret_bytes)
-                    logger.info(f"✓ Loaded keypair from JSON array format (32 bytes)")
+                    logger.info("✓ Loaded keypair from JSON array format (32 bytes)")
                     return kp
         except Exception as e:
-            logger.debug(f"JSON array parse failed: {e}")
+            logger.debug("JSON array parse failed: %s", e)
 
         raise ValueError(
             f"Invalid Solana private key format. Expected base58 or JSON array, "
@@ -138,27 +291,30 @@ class OKXDexManager:
             Base64-encoded signature
         """
         message = timestamp + method + request_path + body
-        mac = hmac.new(
-            bytes(self.secret_key, encoding='utf8'),
-            bytes(message, encoding='utf-8'),
-            digestmod=hashlib.sha256
-        )
+        mac = self._hmac_template.copy()
+        mac.update(message.encode('utf-8'))
         return base64.b64encode(mac.digest()).decode()
 
     def _get_headers(self, method: str, request_path: str, body: str = '') -> dict:
         """
         Generate authentication headers for OKX API
         """
-        timestamp = time.strftime('%Y-%m-%dT%H:%M:%S.000Z', time.gmtime())
-        signature = self._generate_signature(timestamp, method, request_path, body)
-
-        return {
-            'OK-ACCESS-KEY': self.api_key,
-            'OK-ACCESS-SIGN': signature,
-            'OK-ACCESS-TIMESTAMP': timestamp,
-            'OK-ACCESS-PASSPHRASE': self.passphrase,
-            'Content-Type': 'application/json'
-        }
+        # 'YYYY-MM-DDTHH:MM:SS.mmm' + 'Z', as OKX expects
+        timestamp = datetime.now(timezone.utc).isoformat(timespec='milliseconds')[:23] + 'Z'
+
+        headers = self._base_headers.copy()
+        headers['OK-ACCESS-SIGN'] = self._generate_signature(timestamp, method, request_path, body)
+        headers['OK-ACCESS-TIMESTAMP'] = timestamp
+        return headers
+
+    def _signed_get(self, request_path: str, params: dict) -> Tuple[str, dict]:
+        """Return (url, headers) for a signed GET
+
+        The query is encoded once, so the signed path and the requested URL
+        are byte-for-byte identical.
+        """
+        full_path = f"{request_path}?{urlencode(params)}"
+        return f"{self.BASE_URL}{full_path}", self._get_headers('GET', full_path)
 
     async def get_quote(
         self,
@@ -180,50 +336,99 @@ class OKXDexManager:
 
         Returns:
             Quote response dict or None if failed
+
+        Quotes are cached for quote_cache_ttl seconds, and concurrent calls
+        for the same quote share a single request.
         """
+        slippage_value = slippage if slippage is not None else self.max_slippage
+        key = (chain, from_token_address, to_token_address, str(amount), slippage_value)
+
+        cached = self._quote_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self._quote_ttl:
+            self._quote_cache.move_to_end(key)
+            return cached[1]
+
+        inflight = self._quote_inflight.get(key)
+        if inflight is not None:
+            return await asyncio.shield(inflight)
+
+        future = asyncio.get_running_loop().create_future()
+        self._quote_inflight[key] = future
+        quote_data = None
         try:
-            if chain not in self.CHAINS:
-                raise ValueError(f"Unsupported chain: {chain}")
+            quote_data = await self._fetch_quote(chain, from_token_address, to_token_address, amount, slippage_value)
+        finally:
+            del self._quote_inflight[key]
+            future.set_result(quote_data)
+
+        if quote_data is not None and self._quote_ttl > 0:
+            self._quote_cache[key] = (time.monotonic(), quote_data)
+            self._quote_cache.move_to_end(key)
+            if len(self._quote_cache) > QUOTE_CACHE_MAX_ENTRIES:
+                self._quote_cache.popitem(last=False)
+        return quote_data
+
+    async def batch_quote(self, requests: List[tuple]) -> List[Optional[dict]]:
+        """
+        Get quotes for many pairs concurrently over the shared session
 
-            chain_id = self.CHAINS[chain]['chainId']
-            slippage_value = slippage if slippage is not None else self.max_slippage
+        Args:
+            requests: get_quote argument tuples, e.g. (chain, from_token_address,
+                to_token_address, amount[, slippage])
+
+        Returns:
+            Quote dict (or None if failed) per request, in request order
+
+        At most max_concurrency requests are in flight at once.
+        """
+        async def one(args: tuple) -> Optional[dict]:
+            async with self._quote_semaphore:
+                return await self.get_quote(*args)
+
+        return await asyncio.gather(*(one(args) for args in requests))
+
+    async def _fetch_quote(
+        self,
+        chain: ChainType,
+        from_token_address: str,
+        to_token_address: str,
+        amount: str,
+        slippage_value: float
+    ) -> Optional[dict]:
+        """Request a quote from the OKX aggregator, bypassing the cache"""
+        try:
+            chain_cfg = self.CHAINS.get(chain)
+            if chain_cfg is None:
+                raise ValueError(f"Unsupported chain: {chain}")
 
             # Build request
-            request_path = '/api/v5/dex/aggregator/quote'
             params = {
-                'chainId': chain_id,
+                'chainId': chain_cfg.chain_id,
                 'fromTokenAddress': from_token_address,
                 'toTokenAddress': to_token_address,
                 'amount': str(amount),
                 'slippage': str(slippage_value / 100)  # Convert % to decimal (1% -> 0.01)
             }
 
-            # Build query string
-            query_string = '&'.join([f"{k}={v}" for k, v in params.items()])
-            full_path = f"{request_path}?{query_string}"
+            url, headers = self._signed_get(self.QUOTE_PATH, params)
 
-            headers = self._get_headers('GET', full_path)
-            url = f"{self.BASE_URL}{full_path}"
+            logger.info("Getting quote for %s: %s -> %s", chain, from_token_address, to_token_address)
+            logger.debug("Quote URL: %s", url)
 
-            logger.info(f"Getting quote for {chain}: {from_token_address} -> {to_token_address}")
-            logger.debug(f"Quote URL: {url}")
+            session = await self._ensure_session()
+            async with session.get(url, headers=headers) as resp:
+                result = json_utils.loads(await resp.read())
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as resp:
-                    result = await resp.json()
-
-                    if resp.status == 200 and result.get('code') == '0':
-                        quote_data = result.get('data', [{}])[0]
-                        logger.info(f"✓ Quote received: {quote_data.get('toTokenAmount', 'N/A')} output")
-                        return quote_data
-                    else:
-                        logger.error(f"Quote failed (status {resp.status}): {result}")
-                        return None
+                if resp.status == 200 and result.get('code') == '0':
+                    quote_data = result.get('data', [{}])[0]
+                    logger.info("✓ Quote received: %s output", quote_data.get('toTokenAmount', 'N/A'))
+                    return quote_data
+                else:
+                    logger.error("Quote failed (status %s): %s", resp.status, result)
+                    return None
 
-        except Exception as e:
-            logger.error(f"Error getting OKX DEX quote: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+        except Exception:
+            logger.exception("Error getting OKX DEX quote")
             return None
 
     async def get_swap_data(
@@ -250,25 +455,23 @@ class OKXDexManager:
             Swap data response or None if failed
         """
         try:
-            if chain not in self.CHAINS:
+            chain_cfg = self.CHAINS.get(chain)
+            if chain_cfg is None:
                 raise ValueError(f"Unsupported chain: {chain}")
-
-            chain_id = self.CHAINS[chain]['chainId']
             slippage_value = slippage if slippage is not None else self.max_slippage
 
             # Auto-detect wallet address
             if not user_wallet_address:
-                if chain == 'solana' and self.solana_keypair:
-                    user_wallet_address = str(self.solana_keypair.pubkey())
-                elif chain == 'bsc' and self.bsc_account:
-                    user_wallet_address = self.bsc_account.address
+                if chain == 'solana' and self.solana_address:
+                    user_wallet_address = self.solana_address
+                elif chain == 'bsc' and self.bsc_address:
+                    user_wallet_address = self.bsc_address
                 else:
                     raise ValueError(f"No wallet configured for {chain}")
 
             # Build request
-            request_path = '/api/v5/dex/aggregator/swap'
             params = {
-                'chainId': chain_id,
+                'chainId': chain_cfg.chain_id,
                 'fromTokenAddress': from_token_address,
                 'toTokenAddress': to_token_address,
                 'amount': str(amount),
@@ -276,32 +479,95 @@ class OKXDexManager:
                 'userWalletAddress': user_wallet_address
             }
 
-            query_string = '&'.join([f"{k}={v}" for k, v in params.items()])
-            full_path = f"{request_path}?{query_string}"
+            url, headers = self._signed_get(self.SWAP_PATH, params)
 
-            headers = self._get_headers('GET', full_path)
-            url = f"{self.BASE_URL}{full_path}"
+            logger.info("Getting swap data for %s", chain)
 
-            logger.info(f"Getting swap data for {chain}")
+            session = await self._ensure_session()
+            async with session.get(url, headers=headers) as resp:
+                result = json_utils.loads(await resp.read())
 
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=headers) as resp:
-                    result = await resp.json()
-
-                    if resp.status == 200 and result.get('code') == '0':
-                        swap_data = result.get('data', [{}])[0]
-                        logger.info(f"✓ Swap data received")
-                        return swap_data
-                    else:
-                        logger.error(f"Swap data failed (status {resp.status}): {result}")
-                        return None
+                if resp.status == 200 and result.get('code') == '0':
+                    swap_data = result.get('data', [{}])[0]
+                    logger.info("✓ Swap data received")
+                    return swap_data
+                else:
+                    logger.error("Swap data failed (status %s): %s", resp.status, result)
+                    return None
 
-        except Exception as e:
-            logger.error(f"Error getting swap data: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+        except Exception:
+            logger.exception("Error getting swap data")
             return None
 
+    async def quote_or_swap_data(
+        self,
+        chain: ChainType,
+        from_token_address: str,
+        to_token_address: str,
+        amount: str,
+        will_execute: bool,
+        slippage: Optional[float] = None
+    ) -> Optional[dict]:
+        """
+        Get a quote, or swap data if the route is going to be executed
+
+        Swap data carries the same quote under 'routerResult', so callers
+        that will swap skip the separate quote round trip.
+
+        Args:
+            chain: 'bsc' or 'solana'
+            from_token_address: Input token address
+            to_token_address: Output token address
+            amount: Amount in base units
+            will_execute: True to fetch swap data, False for a (cached) quote
+            slippage: Slippage tolerance
+
+        Returns:
+            Swap data or quote dict, or None if failed
+        """
+        if will_execute:
+            return await self.get_swap_data(chain, from_token_address, to_token_address, amount, slippage)
+        return await self.get_quote(chain, from_token_address, to_token_address, amount, slippage)
+
+    async def _post_rpc(self, url: str, body: bytes) -> dict:
+        """POST a pre-serialized JSON-RPC request and return the parsed response"""
+        session = await self._ensure_session()
+        async with session.post(url, data=body, headers=JSON_HEADERS) as resp:
+            return json_utils.loads(await resp.read())
+
+    async def _broadcast_solana(self, rpc_payload: dict) -> dict:
+        """Send a JSON-RPC request to every Solana endpoint, first success wins
+
+        The remaining requests are cancelled once one endpoint returns a
+        result. If none do, the last error response is returned; if every
+        request raised, the last exception is re-raised.
+        """
+        body = json_utils.dumpb(rpc_payload)
+        if len(self.solana_rpc_urls) == 1:
+            return await self._post_rpc(self.solana_rpc_urls[0], body)
+
+        pending = {asyncio.create_task(self._post_rpc(url, body)) for url in self.solana_rpc_urls}
+        last_result, last_error = None, None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is not None:
+                        last_error = task.exception()
+                        logger.debug("Solana RPC request failed: %s", last_error)
+                        continue
+                    result = task.result()
+                    if 'result' in result:
+                        return result
+                    last_result = result
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if last_result is not None:
+            return last_result
+        raise last_error
+
     async def execute_swap_solana(self, swap_data: dict) -> Optional[dict]:
         """
         Execute swap on Solana using swap instructions
@@ -326,84 +592,84 @@ class OKXDexManager:
             tx_base64 = tx_data.get('data') or tx_data.get('transaction')
 
             if not tx_base64:
-                logger.error(f"No transaction in swap data: {tx_data}")
+                logger.error("No transaction in swap data: %s", tx_data)
                 return None
 
             logger.info("Signing and executing Solana transaction...")
 
-            # Deserialize transaction (try base58 first, then base64)
-            try:
-                # Try base58 format (OKX returns base58)
-                tx_bytes = base58.b58decode(tx_base64)
-                tx = VersionedTransaction.from_bytes(tx_bytes)
-                logger.info("✓ Decoded transaction from base58 format")
-            except Exception as e:
-                logger.debug(f"Base58 decode failed: {e}, trying base64...")
-                # Fallback to base64
-                tx_bytes = base64.b64decode(tx_base64)
-                tx = VersionedTransaction.from_bytes(tx_bytes)
-                logger.info("✓ Decoded transaction from base64 format")
-
-            # Sign transaction
-            message = tx.message
-            tx_signed = VersionedTransaction(message, [self.solana_keypair])
+            # Decode (OKX returns base58, base64 is also accepted), then sign
+            # the message bytes and write the signature into the fee payer's
+            # slot, without a deserialize/reserialize round-trip
+            buf = bytearray(_decode_tx(tx_base64))
+            if not sign_in_place(buf, self.solana_keypair):
+                logger.error("Swap transaction is not payable by our wallet")
+                return None
 
             logger.info("✓ Transaction signed")
 
-            # Serialize signed transaction
-            signed_tx_bytes = bytes(tx_signed)
-            signed_tx_base64 = base64.b64encode(signed_tx_bytes).decode()
+            # Encoded once, straight from the signed buffer
+            signed_tx_base64 = b64encode(buf)
 
             # Submit transaction to Solana RPC
             logger.info("📡 Broadcasting transaction to Solana...")
 
-            rpc_url = "https://api.mainnet-beta.solana.com"
-            async with aiohttp.ClientSession() as session:
-                rpc_payload = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "sendTransaction",
-                    "params": [
-                        signed_tx_base64,
-                        {
-                            "encoding": "base64",
-                            "skipPreflight": False,
-                            "preflightCommitment": "confirmed",
-                            "maxRetries": 3
-                        }
-                    ]
-                }
+            rpc_payload = self._SEND_TX_TEMPLATE.copy()
+            rpc_payload["params"] = [signed_tx_base64, self._SEND_TX_OPTIONS]
 
-                async with session.post(rpc_url, json=rpc_payload) as resp:
-                    result = await resp.json()
+            result = await self._broadcast_solana(rpc_payload)
 
-                    if 'result' in result:
-                        tx_signature = result['result']
-                        logger.info(f"✅ Transaction broadcast successful!")
-                        logger.info(f"   Signature: {tx_signature}")
-                        logger.info(f"   Solscan: https://solscan.io/tx/{tx_signature}")
-
-                        return {
-                            'success': True,
-                            'signature': tx_signature,
-                            'signed_transaction': signed_tx_base64,
-                            'solscan_url': f"https://solscan.io/tx/{tx_signature}"
-                        }
-                    else:
-                        error = result.get('error', {})
-                        logger.error(f"❌ Transaction broadcast failed: {error}")
-                        return {
-                            'success': False,
-                            'error': error,
-                            'signed_transaction': signed_tx_base64
-                        }
+            if 'result' in result:
+                tx_signature = result['result']
+                logger.info("✅ Transaction broadcast successful!")
+                logger.info("   Signature: %s", tx_signature)
+                logger.info("   Solscan: https://solscan.io/tx/%s", tx_signature)
 
-        except Exception as e:
-            logger.error(f"Error executing Solana swap: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+                return {
+                    'success': True,
+                    'signature': tx_signature,
+                    'signed_transaction': signed_tx_base64,
+                    'solscan_url': f"https://solscan.io/tx/{tx_signature}"
+                }
+            else:
+                error = result.get('error', {})
+                logger.error("❌ Transaction broadcast failed: %s", error)
+                return {
+                    'success': False,
+                    'error': error,
+                    'signed_transaction': signed_tx_base64
+                }
+
+        except Exception:
+            logger.exception("Error executing Solana swap")
             return None
 
+    def _start_gas_price_refresher(self):
+        """Start the background gas price refresh for a configured BSC wallet"""
+        if self.bsc_web3 is not None and self._gas_price_task is None:
+            self._gas_price_task = asyncio.create_task(self._refresh_gas_price())
+
+    async def _fetch_gas_price(self) -> int:
+        """Read the gas price from the chain and cache it"""
+        price = await self.bsc_web3.eth.gas_price
+        self._gas_price_cache = (time.monotonic(), price)
+        return price
+
+    async def _refresh_gas_price(self):
+        """Keep the cached BSC gas price at most one refresh interval old"""
+        while True:
+            try:
+                await self._fetch_gas_price()
+            except Exception as e:
+                logger.debug("Gas price refresh failed: %s", e)
+            await asyncio.sleep(GAS_PRICE_REFRESH)
+
+    async def _gas_price(self) -> int:
+        """Cached BSC gas price, fetched directly only if the cache is stale"""
+        fetched_at, price = self._gas_price_cache
+        if price is not None and time.monotonic() - fetched_at <= GAS_PRICE_MAX_AGE:
+            return price
+        return await self._fetch_gas_price()
+
     async def execute_swap_bsc(self, swap_data: dict) -> Optional[dict]:
         """
         Execute swap on BSC (EVM chain)
@@ -418,6 +684,9 @@ class OKXDexManager:
             if not self.bsc_account or not self.bsc_web3:
                 raise ValueError("BSC wallet not configured")
 
+            from web3 import Web3
+            from web3.exceptions import TimeExhausted
+
             # Extract transaction data
             tx_data = swap_data.get('tx')
             if not tx_data:
@@ -426,56 +695,83 @@ class OKXDexManager:
 
             logger.info("Preparing BSC transaction...")
 
+            # Gas price comes from the background-refreshed cache; on the first
+            # swap it and the nonce are independent reads, so fetch them
+            # together. After that the nonce is tracked locally.
+            self._start_gas_price_refresher()
+            if self._bsc_nonce is None:
+                gas_price, self._bsc_nonce = await asyncio.gather(
+                    self._gas_price(),
+                    self.bsc_web3.eth.get_transaction_count(self.bsc_address, 'pending')
+                )
+            else:
+                gas_price = await self._gas_price()
+            nonce = self._bsc_nonce
+
             # Build transaction dict
             transaction = {
-                'from': self.bsc_account.address,
+                'from': self.bsc_address,
                 'to': Web3.to_checksum_address(tx_data['to']),
                 'value': int(tx_data.get('value', 0)),
                 'data': tx_data['data'],
                 'gas': int(tx_data.get('gas', 300000)),
-                'gasPrice': self.bsc_web3.eth.gas_price,
-                'nonce': self.bsc_web3.eth.get_transaction_count(self.bsc_account.address),
+                'gasPrice': gas_price,
+                'nonce': nonce,
                 'chainId': 56
             }
 
-            logger.info(f"Transaction: {transaction['from']} -> {transaction['to']}")
-            logger.info(f"Value: {transaction['value']} wei")
-            logger.info(f"Gas: {transaction['gas']}")
+            logger.info("Transaction: %s -> %s", transaction['from'], transaction['to'])
+            logger.info("Value: %s wei", transaction['value'])
+            logger.info("Gas: %s", transaction['gas'])
 
             # Sign transaction
-            signed_tx = self.bsc_web3.eth.account.sign_transaction(transaction, self.bsc_account.key)
+            signed_tx = self.bsc_account.sign_transaction(transaction)
 
             logger.info("✓ Transaction signed")
 
             # Send transaction
-            tx_hash = self.bsc_web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+            try:
+                tx_hash = await self.bsc_web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+            except Exception:
+                self._bsc_nonce = None  # re-read from chain on the next swap
+                raise
+            self._bsc_nonce = nonce + 1
             tx_hash_hex = tx_hash.hex()
 
-            logger.info(f"✓ Transaction sent: {tx_hash_hex}")
+            logger.info("✓ Transaction sent: %s", tx_hash_hex)
 
-            # Wait for receipt (optional, can be async)
+            # Wait for receipt without blocking the loop; BSC blocks are ~3s,
+            # so poll every 0.5s rather than web3's default 0.1s
             logger.info("Waiting for transaction confirmation...")
-            receipt = self.bsc_web3.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+            try:
+                receipt = await self.bsc_web3.eth.wait_for_transaction_receipt(
+                    tx_hash, timeout=120, poll_latency=0.5
+                )
+            except TimeExhausted:
+                logger.warning("⏳ Transaction not mined after 120s: %s", tx_hash_hex)
+                return {
+                    'success': False,
+                    'pending': True,
+                    'tx_hash': tx_hash_hex
+                }
 
             if receipt['status'] == 1:
-                logger.info(f"✓ BSC swap successful!")
+                logger.info("✓ BSC swap successful!")
                 return {
                     'success': True,
                     'tx_hash': tx_hash_hex,
                     'receipt': dict(receipt)
                 }
             else:
-                logger.error(f"✗ Transaction failed: {receipt}")
+                logger.error("✗ Transaction failed: %s", receipt)
                 return {
                     'success': False,
                     'tx_hash': tx_hash_hex,
                     'receipt': dict(receipt)
                 }
 
-        except Exception as e:
-            logger.error(f"Error executing BSC swap: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+        except Exception:
+            logger.exception("Error executing BSC swap")
             return None
 
     async def swap(
@@ -500,7 +796,11 @@ class OKXDexManager:
             Result dict with success status and transaction info
         """
         try:
-            logger.info(f"=== Starting {chain.upper()} swap ===")
+            executor = self._executors.get(chain)
+            if executor is None:
+                raise ValueError(f"Unsupported chain: {chain}")
+
+            logger.info("=== Starting %s swap ===", chain.upper())
 
             # Get swap data
             swap_data = await self.get_swap_data(
@@ -511,16 +811,8 @@ class OKXDexManager:
                 logger.error("Failed to get swap data")
                 return None
 
-            # Execute based on chain type
-            if chain == 'solana':
-                return await self.execute_swap_solana(swap_data)
-            elif chain == 'bsc':
-                return await self.execute_swap_bsc(swap_data)
-            else:
-                raise ValueError(f"Unsupported chain: {chain}")
+            return await executor(swap_data)
 
-        except Exception as e:
-            logger.error(f"Error in swap operation: {e}")
-            import traceback
-            logger.error(traceback.format_exc())
+        except Exception:
+            logger.exception("Error in swap operation")
             return None
@@ -5,64 +5,85 @@ Measure latency to Binance API and Jupiter API
 import asyncio
 import time
 import logging
-from statistics import mean, median, stdev
-from config import TradingBotConfig
+from statistics import mean, median, quantiles, stdev
+from config import get_config
 from managers.binance_manager import BinanceManager
 from managers.jupiter_manager import JupiterSwapManager
+from utils import event_loop
 
 logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
+# Max blocking REST calls in flight at once while measuring
+REST_CONCURRENCY = 5
 
-async def measure_binance_rest_latency(binance: BinanceManager, symbol: str, iterations: int = 10):
-    """Measure REST API latency for common operations"""
-    print("\n" + "="*60)
-    print("📊 BINANCE REST API LATENCY")
-    print("="*60)
 
-    # Measure get_current_price
-    latencies = []
-    print(f"\nTesting get_current_price() - {iterations} iterations...")
-    for i in range(iterations):
-        start = time.perf_counter()
-        binance.get_current_price(symbol)
-        end = time.perf_counter()
-        latency_ms = (end - start) * 1000
-        latencies.append(latency_ms)
-        print(f"  [{i+1}/{iterations}] {latency_ms:.2f}ms")
-        await asyncio.sleep(0.1)  # Small delay between requests
+def _timed_call(fn, *args) -> int:
+    """Run a blocking call and return its latency in ns"""
+    start_ns = time.perf_counter_ns()
+    fn(*args)
+    return time.perf_counter_ns() - start_ns
+
+
+def _to_ms(latencies_ns: list) -> list:
+    """Convert integer ns samples to float ms once, after measuring"""
+    return [ns / 1e6 for ns in latencies_ns]
+
+
+def _print_stats(name: str, latencies: list):
+    """Print summary statistics for latency samples in ms
 
-    print(f"\n📈 get_current_price() Statistics:")
+    Tail percentiles are what an arbitrage fill actually waits on, so
+    p95/p99 are shown alongside the mean.
+    """
+    print(f"\n📈 {name} Statistics:")
     print(f"   Mean:   {mean(latencies):.2f}ms")
     print(f"   Median: {median(latencies):.2f}ms")
     print(f"   Min:    {min(latencies):.2f}ms")
     print(f"   Max:    {max(latencies):.2f}ms")
     if len(latencies) > 1:
         print(f"   StdDev: {stdev(latencies):.2f}ms")
+        # Percentile cut points 1..99; 'inclusive' interpolates within the samples
+        cuts = quantiles(latencies, n=100, method='inclusive')
+        print(f"   p50/p95/p99: {cuts[49]:.2f} / {cuts[94]:.2f} / {cuts[98]:.2f}ms")
 
-    # Measure get_open_orders
-    latencies = []
-    print(f"\nTesting get_open_orders() - {iterations} iterations...")
-    for i in range(iterations):
-        start = time.perf_counter()
-        binance.get_open_orders(symbol)
-        end = time.perf_counter()
-        latency_ms = (end - start) * 1000
-        latencies.append(latency_ms)
+
+async def _measure_blocking(fn, *args, iterations: int) -> list:
+    """Time `iterations` calls of a blocking fn on worker threads, REST_CONCURRENCY at a time
+
+    Returns latencies in ns.
+    """
+    semaphore = asyncio.Semaphore(REST_CONCURRENCY)
+
+    async def one():
+        async with semaphore:
+            return await asyncio.to_thread(_timed_call, fn, *args)
+
+    return await asyncio.gather(*(one() for _ in range(iterations)))
+
+
+async def measure_binance_rest_latency(binance: BinanceManager, symbol: str, iterations: int = 10):
+    """Measure REST API latency for common operations"""
+    print("\n" + "="*60)
+    print("📊 BINANCE REST API LATENCY")
+    print("="*60)
+
+    # Measure get_current_price
+    print(f"\nTesting get_current_price() - {iterations} iterations, {REST_CONCURRENCY} concurrent...")
+    latencies = _to_ms(await _measure_blocking(binance.get_current_price, symbol, iterations=iterations))
+    for i, latency_ms in enumerate(latencies):
         print(f"  [{i+1}/{iterations}] {latency_ms:.2f}ms")
-        await asyncio.sleep(0.1)
 
-    print(f"\n📈 get_open_orders() Statistics:")
-    print(f"   Mean:   {mean(latencies):.2f}ms")
-    print(f"   Median: {median(latencies):.2f}ms")
-    print(f"   Min:    {min(latencies):.2f}ms")
-    print(f"   Max:    {max(latencies):.2f}ms")
-    if len(latencies) > 1:
-        print(f"   StdDev: {stdev(latencies):.2f}ms")
+    _print_stats("get_current_price()", latencies)
 
 
-async def measure_binance_websocket_latency(binance: BinanceManager, duration: int = 10):
-    """Measure WebSocket connection and keep-alive latency"""
+async def measure_binance_websocket_latency(binance: BinanceManager, duration: int = 10, keepalives: int = 5):
+    """Measure WebSocket connection and listenKey keepalive latency
+
+    Keepalives are the only REST call the bot keeps making while it runs on
+    the user stream, so they are timed against the open stream instead of
+    polling signed endpoints like get_open_orders.
+    """
     print("\n" + "="*60)
     print("📊 BINANCE WEBSOCKET LATENCY")
     print("="*60)
@@ -76,27 +97,36 @@ async def measure_binance_websocket_latency(binance: BinanceManager, duration: i
         """Track when messages arrive"""
         message_times.append(time.perf_counter())
 
+    stream_task = asyncio.create_task(binance.start_user_stream(message_callback))
+    keepalive_ns = [0] * keepalives
     try:
-        # Measure connection time
-        await asyncio.wait_for(
-            binance.start_user_stream(message_callback),
-            timeout=duration
-        )
-    except asyncio.TimeoutError:
-        connection_time = (message_times[0] - connection_start) * 1000 if message_times else 0
-
-        print(f"\n📈 WebSocket Statistics:")
-        print(f"   Connection time: {connection_time:.2f}ms")
-        print(f"   Messages received: {len(message_times)}")
-
-        if len(message_times) > 1:
-            # Calculate intervals between messages
-            intervals = [(message_times[i] - message_times[i-1]) * 1000
-                        for i in range(1, len(message_times))]
-            print(f"   Mean interval: {mean(intervals):.2f}ms")
-            print(f"   Median interval: {median(intervals):.2f}ms")
-
-        await binance.stop_user_stream()
+        # Spread keepalives over the measurement window
+        interval = duration / (keepalives + 1)
+        for i in range(keepalives):
+            await asyncio.sleep(interval)
+            start_ns = time.perf_counter_ns()
+            await binance.keepalive_user_stream()
+            keepalive_ns[i] = time.perf_counter_ns() - start_ns
+        await asyncio.sleep(interval)
+    finally:
+        stream_task.cancel()
+        await asyncio.gather(stream_task, return_exceptions=True)
+
+    connection_time = (message_times[0] - connection_start) * 1000 if message_times else 0
+
+    print(f"\n📈 WebSocket Statistics:")
+    print(f"   Connection time: {connection_time:.2f}ms")
+    print(f"   Messages received: {len(message_times)}")
+
+    if len(message_times) > 1:
+        # Calculate intervals between messages
+        intervals = [(message_times[i] - message_times[i-1]) * 1000
+                    for i in range(1, len(message_times))]
+        print(f"   Mean interval: {mean(intervals):.2f}ms")
+        print(f"   Median interval: {median(intervals):.2f}ms")
+
+    if keepalives:
+        _print_stats("listenKey keepalive", _to_ms(keepalive_ns))
 
 
 async def measure_jupiter_latency(jupiter: JupiterSwapManager, symbol: str, iterations: int = 5):
@@ -110,30 +140,22 @@ async def measure_jupiter_latency(jupiter: JupiterSwapManager, symbol: str, iter
     market_config = get_market_config(symbol)
 
     # Test quote request (GET /order)
-    latencies = []
+    latencies_ns = [0] * iterations
     print(f"\nTesting get_order() - {iterations} iterations...")
     print(f"   (USDC → Output token quote)")
 
     for i in range(iterations):
-        start = time.perf_counter()
+        start_ns = time.perf_counter_ns()
         await jupiter.get_order(
             input_mint=market_config['input_mint'],
             output_mint=market_config['output_mint'],
             amount=10_000_000  # 10 USDC in lamports
         )
-        end = time.perf_counter()
-        latency_ms = (end - start) * 1000
-        latencies.append(latency_ms)
-        print(f"  [{i+1}/{iterations}] {latency_ms:.2f}ms")
+        latencies_ns[i] = time.perf_counter_ns() - start_ns
+        print(f"  [{i+1}/{iterations}] {latencies_ns[i] / 1e6:.2f}ms")
         await asyncio.sleep(0.5)  # Delay between requests
 
-    print(f"\n📈 get_order() Statistics:")
-    print(f"   Mean:   {mean(latencies):.2f}ms")
-    print(f"   Median: {median(latencies):.2f}ms")
-    print(f"   Min:    {min(latencies):.2f}ms")
-    print(f"   Max:    {max(latencies):.2f}ms")
-    if len(latencies) > 1:
-        print(f"   StdDev: {stdev(latencies):.2f}ms")
+    _print_stats("get_order()", _to_ms(latencies_ns))
 
 
 async def main():
@@ -147,7 +169,7 @@ async def main():
     print("\nResults will help determine if running on a")
     print("dedicated server would improve execution speed.")
 
-    config = TradingBotConfig()
+    config = get_config()
     symbol = "PIPPINUSDT"  # Default test symbol
 
     # Initialize managers
@@ -160,9 +182,13 @@ async def main():
     )
 
     # Run measurements
-    await measure_binance_rest_latency(binance, symbol)
-    await measure_jupiter_latency(jupiter, symbol)
-    await measure_binance_websocket_latency(binance)
+    try:
+        await measure_binance_rest_latency(binance, symbol)
+        await measure_jupiter_latency(jupiter, symbol)
+        await measure_binance_websocket_latency(binance)
+    finally:
+        await jupiter.close()
+        await binance.close()
 
     # Summary and recommendations
     print("\n" + "="*60)
@@ -182,4 +208,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())
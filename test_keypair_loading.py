@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+"""
+Check that Solana private keys load in every supported format
+(base58 and JSON array, 64-byte keypair and 32-byte seed)
+"""
+import json
+import sys
+import base58
+from solders.keypair import Keypair
+from managers.jupiter_manager import JupiterSwapManager
+
+
+def main():
+    print("=" * 60)
+    print("Solana Keypair Loading Test")
+    print("=" * 60)
+
+    expected = Keypair()
+    secret = bytes(expected)  # 64 bytes: seed + pubkey
+    seed = secret[:32]
+
+    formats = {
+        'base58 (64 bytes)': base58.b58encode(secret).decode(),
+        'base58 (32 bytes)': base58.b58encode(seed).decode(),
+        'JSON array (64 bytes)': json.dumps(list(secret)),
+        'JSON array (32 bytes)': json.dumps(list(seed)),
+        # The public half must be derived from the seed, not trusted
+        'base58 (64 bytes, wrong public half)': base58.b58encode(seed + bytes(Keypair().pubkey())).decode(),
+    }
+
+    failed = 0
+    for name, key in formats.items():
+        try:
+            jupiter = JupiterSwapManager(key, 'https://api.jup.ag/ultra/v1', '', 1.0)
+            ok = jupiter.keypair.pubkey() == expected.pubkey()
+        except BaseException as e:  # solders panics derive from BaseException
+            print(f"✗ {name}: {e!r}")
+            failed += 1
+            continue
+        print(f"{'✓' if ok else '✗'} {name}")
+        failed += not ok
+
+    print("=" * 60)
+    print("All formats loaded!" if not failed else f"{failed} format(s) failed")
+    return failed
+
+
+if __name__ == "__main__":
+    sys.exit(1 if main() else 0)
@@ -3,8 +3,10 @@ Test script for OKX DEX integration
 """
 import asyncio
 import logging
-from config import TradingBotConfig
+from config import get_config
 from managers.okx_dex_manager import OKXDexManager
+from utils import event_loop
+from utils.token_units import base_units
 
 # Setup logging
 logging.basicConfig(
@@ -14,27 +16,17 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def test_bsc_quote():
+async def test_bsc_quote(okx: OKXDexManager) -> bool:
     """Test getting a quote for BSC swap"""
     print("\n=== Testing BSC Quote ===")
 
-    config = TradingBotConfig()
-
-    okx = OKXDexManager(
-        api_key=config.okx_api_key,
-        secret_key=config.okx_secret_key,
-        passphrase=config.okx_passphrase,
-        bsc_private_key=config.bsc_private_key,
-        max_slippage=1.0
-    )
-
     # Test: USDT -> BUSD on BSC
     # USDT on BSC: 0x55d398326f99059fF775485246999027B3197955
     # BUSD on BSC: 0xe9e7CEA3DedcA5984780Bafc599bD69ADd087D56
 
     usdt_address = "0x55d398326f99059fF775485246999027B3197955"
     busd_address = "0xe9e7CEA3DedcA5984780Bafc599bD69ADd087D56"
-    amount = str(1 * 10**18)  # 1 USDT (18 decimals)
+    amount = str(base_units(usdt_address, 1))  # 1 USDT
 
     quote = await okx.get_quote('bsc', usdt_address, busd_address, amount)
 
@@ -45,29 +37,20 @@ async def test_bsc_quote():
         print(f"  Route: {quote.get('routerResult', {}).get('dexRouterList', [])}")
     else:
         print("✗ Failed to get BSC quote")
+    return bool(quote)
 
 
-async def test_solana_quote():
+async def test_solana_quote(okx: OKXDexManager) -> bool:
     """Test getting a quote for Solana swap"""
     print("\n=== Testing Solana Quote ===")
 
-    config = TradingBotConfig()
-
-    okx = OKXDexManager(
-        api_key=config.okx_api_key,
-        secret_key=config.okx_secret_key,
-        passphrase=config.okx_passphrase,
-        solana_private_key=config.solana_private_key,
-        max_slippage=1.0
-    )
-
     # Test: USDC -> SOL on Solana
     # USDC: EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v
     # SOL (wrapped): So11111111111111111111111111111111111111112
 
     usdc_address = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
     sol_address = "So11111111111111111111111111111111111111112"
-    amount = str(1 * 10**6)  # 1 USDC (6 decimals)
+    amount = str(base_units(usdc_address, 1))  # 1 USDC
 
     quote = await okx.get_quote('solana', usdc_address, sol_address, amount)
 
@@ -78,35 +61,53 @@ async def test_solana_quote():
         print(f"  Route: {quote.get('routerResult', {}).get('dexRouterList', [])}")
     else:
         print("✗ Failed to get Solana quote")
+    return bool(quote)
 
 
-async def test_swap_data():
-    """Test getting swap transaction data"""
-    print("\n=== Testing Swap Data Retrieval ===")
+async def test_batch_quote(okx: OKXDexManager) -> bool:
+    """Test quoting several pairs in one batch"""
+    print("\n=== Testing Batch Quote ===")
 
-    config = TradingBotConfig()
+    usdt_address = "0x55d398326f99059fF775485246999027B3197955"
+    busd_address = "0xe9e7CEA3DedcA5984780Bafc599bD69ADd087D56"
+    usdc_address = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
+    sol_address = "So11111111111111111111111111111111111111112"
 
-    okx = OKXDexManager(
-        api_key=config.okx_api_key,
-        secret_key=config.okx_secret_key,
-        passphrase=config.okx_passphrase,
-        solana_private_key=config.solana_private_key,
-        max_slippage=1.0
-    )
+    quotes = await okx.batch_quote([
+        ('bsc', usdt_address, busd_address, str(base_units(usdt_address, 1))),  # 1 USDT
+        ('solana', usdc_address, sol_address, str(base_units(usdc_address, 1))),  # 1 USDC
+        ('solana', usdc_address, sol_address, str(base_units(usdc_address, '0.10'))),  # 0.10 USDC
+    ])
+
+    for quote in quotes:
+        if quote:
+            print(f"✓ {quote.get('fromTokenAmount')} -> {quote.get('toTokenAmount')}")
+        else:
+            print("✗ Quote failed")
+    return all(quotes)
+
+
+async def test_swap_data(okx: OKXDexManager) -> bool:
+    """Test getting swap transaction data"""
+    print("\n=== Testing Swap Data Retrieval ===")
 
     # Small test: 0.10 USDC -> SOL
     usdc_address = "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v"
     sol_address = "So11111111111111111111111111111111111111112"
-    amount = str(int(0.10 * 10**6))  # 0.10 USDC
+    amount = str(base_units(usdc_address, '0.10'))  # 0.10 USDC
 
-    swap_data = await okx.get_swap_data('solana', usdc_address, sol_address, amount)
+    # Swap data embeds the quote, so no separate get_quote call is needed
+    swap_data = await okx.quote_or_swap_data('solana', usdc_address, sol_address, amount, will_execute=True)
 
     if swap_data:
+        router_result = swap_data.get('routerResult', {})
         print(f"✓ Swap data retrieved!")
         print(f"  Has transaction: {'tx' in swap_data}")
-        print(f"  Router list: {swap_data.get('routerResult', {}).get('dexRouterList', [])}")
+        print(f"  To: {router_result.get('toTokenAmount')} SOL")
+        print(f"  Router list: {router_result.get('dexRouterList', [])}")
     else:
         print("✗ Failed to get swap data")
+    return bool(swap_data)
 
 
 async def main():
@@ -115,25 +116,36 @@ async def main():
     print("OKX DEX Integration Test")
     print("=" * 60)
 
-    try:
-        # Test BSC quote
-        await test_bsc_quote()
+    config = get_config()
 
-        # Test Solana quote
-        await test_solana_quote()
-
-        # Test swap data (doesn't execute)
-        await test_swap_data()
-
-        print("\n" + "=" * 60)
-        print("Tests completed!")
-        print("=" * 60)
+    # One manager (and HTTP session) for both chains, shared by every test
+    okx = OKXDexManager(
+        api_key=config.okx_api_key,
+        secret_key=config.okx_secret_key,
+        passphrase=config.okx_passphrase,
+        solana_private_key=config.solana_private_key,
+        bsc_private_key=config.bsc_private_key,
+        max_slippage=1.0
+    )
 
-    except Exception as e:
-        logger.error(f"Test failed: {e}")
-        import traceback
-        traceback.print_exc()
+    # The tests are independent, so run them concurrently; swap data is
+    # fetched but not executed
+    tests = (test_bsc_quote, test_solana_quote, test_batch_quote, test_swap_data)
+    print(f"\nRunning {len(tests)} tests concurrently...")
+    async with okx:
+        # Connect up front so the first test isn't charged the TLS handshakes
+        await okx.warmup()
+        results = await asyncio.gather(*(test(okx) for test in tests), return_exceptions=True)
+
+    print("\n" + "=" * 60)
+    for test, result in zip(tests, results):
+        if isinstance(result, Exception):
+            print(f"✗ {test.__name__}: {result!r}")
+        else:
+            print(f"{'✓' if result else '✗'} {test.__name__}")
+    print("Tests completed!")
+    print("=" * 60)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())
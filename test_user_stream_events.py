@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Check that BinanceManager.start_streams ends (so the bot reconnects) on
+stream-killing frames instead of blocking in recv() forever
+
+Runs offline: the AsyncClient and socket manager are replaced by fakes that
+replay canned frames.
+"""
+import asyncio
+import sys
+from unittest import mock
+from binance import Client
+from managers.binance_manager import BinanceManager
+
+SYMBOL = 'PIPPINUSDT'
+PRICE_STREAM = f"{SYMBOL.lower()}@markPrice@1s"
+MARK_PRICE = {'stream': PRICE_STREAM, 'data': {'e': 'markPriceUpdate', 'p': '0.1'}}
+
+
+class FakeSocket:
+    """Replays frames, then keeps sending mark prices like the live socket"""
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def recv(self):
+        await asyncio.sleep(0)
+        return self.frames.pop(0) if self.frames else MARK_PRICE
+
+
+class FakeAsyncClient:
+    async def futures_stream_get_listen_key(self):
+        return 'listen-key'
+
+    async def futures_stream_keepalive(self, listenKey):
+        pass
+
+    async def close_connection(self):
+        pass
+
+
+class FakeSocketManager:
+    def __init__(self, frames):
+        self.frames = frames
+
+    def futures_multiplex_socket(self, streams):
+        return FakeSocket(self.frames)
+
+
+async def ends_stream(frames) -> bool:
+    """True if start_streams raises or returns after replaying frames"""
+    with mock.patch.object(Client, 'ping'):  # no network on construction
+        binance = BinanceManager('key', 'secret')
+    binance.async_client = FakeAsyncClient()
+    binance.bsm = FakeSocketManager(frames)
+
+    async def on_price(price):
+        pass
+
+    async def on_order(order):
+        pass
+
+    try:
+        await asyncio.wait_for(binance.start_streams(SYMBOL, on_price, on_order), timeout=2.0)
+        return True
+    except asyncio.TimeoutError:
+        return False
+    except ConnectionError as e:
+        print(f"   raised: {e}")
+        return True
+    finally:
+        await binance.close()
+
+
+async def main():
+    print("=" * 60)
+    print("Binance User Stream Event Test")
+    print("=" * 60)
+
+    cases = {
+        'listenKeyExpired': [MARK_PRICE, {'stream': 'listen-key', 'data': {'e': 'listenKeyExpired'}}],
+        'error frame': [MARK_PRICE, {'e': 'error', 'm': 'Queue overflow. Message not filled'}],
+    }
+
+    failed = 0
+    for name, frames in cases.items():
+        print(f"\n{name}:")
+        ok = await ends_stream(frames)
+        print(f"{'✓' if ok else '✗'} {name} {'ends the stream' if ok else 'left the stream running'}")
+        failed += not ok
+
+    print("\n" + "=" * 60)
+    print("All checks passed!" if not failed else f"{failed} check(s) failed")
+    return failed
+
+
+if __name__ == "__main__":
+    sys.exit(1 if asyncio.run(main()) else 0)
@@ -4,19 +4,28 @@ Quick test to verify WebSocket connection to Binance
 """
 import asyncio
 import logging
-from config import TradingBotConfig
+from config import get_config
 from managers.binance_manager import BinanceManager
+from utils import event_loop
 
 # Enable debug logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Upper bound on how long to wait for an order update
+LISTEN_TIMEOUT = 10.0
+
+# Set by test_callback on the first order update
+got_update = asyncio.Event()
+
+
 async def test_callback(order_data):
     """Test callback function"""
     print(f"✅ Received order update: {order_data.get('orderId', 'unknown')}")
     print(f"   Status: {order_data.get('status', 'unknown')}")
     print(f"   Symbol: {order_data.get('symbol', 'unknown')}")
+    got_update.set()
 
 
 async def main():
@@ -24,33 +33,49 @@ async def main():
     print("WebSocket Connection Test")
     print("=" * 60)
 
+    binance = None
     try:
-        config = TradingBotConfig()
+        config = get_config()
         print("✅ Config loaded")
 
         binance = BinanceManager(config.binance_api_key, config.binance_api_secret)
         print("✅ BinanceManager created")
 
         print("\n🔌 Connecting to Binance WebSocket...")
-        print("   (This will listen for order updates for 10 seconds)")
+        print(f"   (This will listen for order updates for up to {LISTEN_TIMEOUT:.0f} seconds)")
         print("   If you have an active order that fills, you'll see it here\n")
 
-        # Run WebSocket for 10 seconds
-        try:
-            await asyncio.wait_for(
-                binance.start_user_stream(test_callback),
-                timeout=10.0
-            )
-        except asyncio.TimeoutError:
-            print("\n✅ WebSocket test completed (10s timeout)")
+        # Stop at the first order update, a stream error, or the timeout,
+        # whichever comes first
+        stream_task = asyncio.create_task(binance.start_user_stream(test_callback))
+        update_task = asyncio.create_task(got_update.wait())
+        done, pending = await asyncio.wait(
+            {stream_task, update_task},
+            timeout=LISTEN_TIMEOUT,
+            return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        await binance.stop_user_stream()
+
+        if update_task in done:
+            print("\n✅ WebSocket test completed (order update received)")
+        elif stream_task in done:
+            print("\n❌ WebSocket stream stopped before any order update")
+            stream_task.result()  # re-raise the stream error, if any
+        else:
+            print(f"\n✅ WebSocket test completed ({LISTEN_TIMEOUT:.0f}s timeout)")
             print("   Connection was successful!")
-            await binance.stop_user_stream()
 
     except Exception as e:
         print(f"\n❌ Error: {e}")
         import traceback
         traceback.print_exc()
+    finally:
+        if binance is not None:
+            await binance.close()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    event_loop.run(main())
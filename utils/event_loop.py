@@ -0,0 +1,17 @@
+"""
+Event loop runner using uvloop when it is installed
+"""
+import asyncio
+from typing import Any, Coroutine
+
+try:
+    import uvloop
+except ImportError:  # optional (not available on Windows), stdlib loop is used otherwise
+    uvloop = None
+
+
+def run(main: Coroutine) -> Any:
+    """asyncio.run(main) on a uvloop event loop if available"""
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        return runner.run(main)
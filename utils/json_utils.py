@@ -0,0 +1,49 @@
+"""
+JSON helpers backed by orjson when it is installed, stdlib json otherwise
+"""
+import json
+
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used otherwise
+    orjson = None
+
+# orjson.JSONDecodeError subclasses this, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data):
+    """Parse JSON from str or bytes"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, pretty: bool = False) -> str:
+    """Serialize to a JSON string (2-space indented when pretty=True)"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None).decode()
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; stdlib handles those
+    return json.dumps(obj, indent=2 if pretty else None)
+
+
+def dumpb(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, e.g. for a request body"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+
+def load(f):
+    """Parse JSON from an open file"""
+    return loads(f.read())
+
+
+def dump(obj, f):
+    """Write obj as JSON to an open text file"""
+    f.write(dumps(obj))
@@ -1,42 +1,120 @@
 """
 Logging configuration for the trading bot
 """
+import atexit
 import logging
+import queue
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
+
+# One formatter shared by all file handlers ('{' style formats a little faster than '%')
+FORMATTER = logging.Formatter('{asctime} | {message}', style='{')
+
+# Max records buffered per file during a burst; the buffers are also flushed
+# whenever the log queue runs empty, and immediately for ERROR and above
+BUFFER_CAPACITY = 256
+# Size of each log file's write buffer (bytes)
+WRITE_BUFFER_SIZE = 64 * 1024
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """FileHandler that writes through a 64KB buffer without flushing per record
+
+    StreamHandler flushes after every record; here emit() only writes and
+    the buffer reaches disk on flush(), which _BatchHandler calls once per
+    batch (and logging.shutdown() at exit).
+    """
+
+    def _open(self):
+        # newline='' writes '\n' as is (no CRLF translation on Windows)
+        return open(self.baseFilename, self.mode, buffering=WRITE_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors, newline='')
+
+    def emit(self, record):
+        # FileHandler.emit minus the per-record flush
+        try:
+            if self.stream is None:
+                if self.mode != 'w' or not self._closed:
+                    self.stream = self._open()
+            if self.stream:
+                self.stream.write(self.format(record) + self.terminator)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _BatchHandler(MemoryHandler):
+    """MemoryHandler that also flushes its target's write buffer after each batch"""
+
+    def flush(self):
+        super().flush()
+        target = self.target  # None once closed
+        if target is not None:
+            target.flush()
+
+
+class _FlushingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs empty
+
+    Records still batch up while a burst is being drained, but none wait in a
+    buffer once the listener goes idle, so a SIGKILL loses at most the burst
+    in flight instead of up to BUFFER_CAPACITY lines per file.
+    """
+
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
 
 
 def setup_file_loggers():
-    """Setup separate file loggers for orders, trades, and bot activity"""
-    import datetime
-
-    # Orders logger
-    orders_logger = logging.getLogger('orders')
-    orders_handler = logging.FileHandler('orders.log', mode='a')
-    orders_formatter = logging.Formatter('%(asctime)s | %(message)s')
-    orders_handler.setFormatter(orders_formatter)
-    orders_logger.addHandler(orders_handler)
-    orders_logger.setLevel(logging.INFO)
-    orders_logger.propagate = False
-
-    # Trades logger
-    trades_logger = logging.getLogger('trades')
-    trades_handler = logging.FileHandler('trades.log', mode='a')
-    trades_formatter = logging.Formatter('%(asctime)s | %(message)s')
-    trades_handler.setFormatter(trades_formatter)
-    trades_logger.addHandler(trades_handler)
-    trades_logger.setLevel(logging.INFO)
-    trades_logger.propagate = False
-
-    # Activity logger (main log with all actions)
-    bot_logger = logging.getLogger('bot_activity')
-    bot_handler = logging.FileHandler('activity.log', mode='a')
-    bot_formatter = logging.Formatter('%(asctime)s | %(message)s')
-    bot_handler.setFormatter(bot_formatter)
-    bot_logger.addHandler(bot_handler)
-    bot_logger.setLevel(logging.INFO)
-    bot_logger.propagate = False
+    """Setup separate file loggers for orders, trades, and bot activity
+
+    The loggers only enqueue records; a QueueListener thread does the file
+    writes so logging from coroutines never blocks the event loop on disk I/O.
+    Each file sits behind a MemoryHandler so bursts are written in batches,
+    and each batch reaches the file as one buffered write; the batch is
+    flushed as soon as the queue is empty.
+    Calling it again returns the already configured loggers.
+    """
+    names = ('orders', 'trades', 'bot_activity')
+    if logging.getLogger(names[0]).handlers:
+        return tuple(logging.getLogger(name) for name in names)
 
+    log_queue = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+
+    buffered_handlers = []
+    loggers = []
+    for name, filename in (('orders', 'orders.log'), ('trades', 'trades.log'), ('bot_activity', 'activity.log')):
+        # Each file only takes records from its own logger
+        # Opened on the first record, by the listener thread
+        file_handler = _BufferedFileHandler(filename, mode='a', encoding='utf-8', delay=True)
+        file_handler.setFormatter(FORMATTER)
+        handler = _BatchHandler(BUFFER_CAPACITY, flushLevel=logging.ERROR,
+                                target=file_handler, flushOnClose=True)
+        handler.addFilter(logging.Filter(name))
+        buffered_handlers.append(handler)
+
+        file_logger = logging.getLogger(name)
+        file_logger.addHandler(queue_handler)
+        file_logger.setLevel(logging.INFO)
+        file_logger.propagate = False
+        loggers.append(file_logger)
+
+    listener = _FlushingQueueListener(log_queue, *buffered_handlers)
+    listener.start()
+    # On interpreter exit (atexit runs LIFO): stop the listener so the queue
+    # is drained into the buffers, then flush the buffers to disk
+    for handler in buffered_handlers:
+        atexit.register(handler.flush)
+    atexit.register(listener.stop)
+
+    orders_logger, trades_logger, bot_logger = loggers
     return orders_logger, trades_logger, bot_logger
 
 
 # Initialize loggers
 orders_logger, trades_logger, bot_logger = setup_file_loggers()
+
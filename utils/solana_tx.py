@@ -0,0 +1,82 @@
+"""
+Helpers for encoding and signing serialized Solana transactions without
+deserializing them
+"""
+import binascii
+from typing import Tuple
+try:
+    import pybase64
+except ImportError:  # optional SIMD codec, binascii is used otherwise
+    pybase64 = None
+try:
+    from based58 import b58decode as _rust_b58decode
+except ImportError:  # optional Rust codec, pure-Python base58 is used otherwise
+    _rust_b58decode = None
+
+SIGNATURE_LEN = 64
+PUBKEY_LEN = 32
+
+
+def b64decode(data: str) -> bytes:
+    """Decode a base64 transaction"""
+    if pybase64 is not None:
+        return pybase64.b64decode(data, validate=False)
+    return binascii.a2b_base64(data)
+
+
+def b64encode(data) -> str:
+    """Encode transaction bytes as a base64 string"""
+    if pybase64 is not None:
+        return pybase64.b64encode_as_string(data)
+    return binascii.b2a_base64(data, newline=False).decode('ascii')
+
+
+def b58decode(data: str) -> bytes:
+    """Decode a base58 string (keys, base58 transactions)"""
+    if _rust_b58decode is not None:
+        return _rust_b58decode(data.encode())
+    import base58
+    return base58.b58decode(data)
+
+
+def read_shortvec(buf, offset: int) -> Tuple[int, int]:
+    """Decode a Solana compact-u16 at offset; returns (value, next_offset)"""
+    value = 0
+    for i in range(3):
+        byte = buf[offset + i]
+        value |= (byte & 0x7f) << (7 * i)
+        if not byte & 0x80:
+            return value, offset + i + 1
+    raise ValueError("Invalid compact-u16 length")
+
+
+def locate_message(buf) -> Tuple[int, int, int]:
+    """Return (num_signatures, first signature offset, message offset)
+
+    Wire layout: compact-u16 signature count, 64-byte signatures, message.
+    """
+    num_sigs, sig_start = read_shortvec(buf, 0)
+    return num_sigs, sig_start, sig_start + num_sigs * SIGNATURE_LEN
+
+
+def sign_in_place(buf: bytearray, keypair) -> bool:
+    """Sign a serialized transaction for its fee payer, writing slot 0
+
+    Only the fee payer's pubkey is read from the message (after the optional
+    version prefix and 3-byte header), then `keypair.sign_message` signs the
+    message bytes and the signature is spliced into the buffer. Returns False,
+    leaving buf untouched, if there is no signature slot or the fee payer is
+    not this keypair.
+    """
+    num_sigs, sig_start, msg_start = locate_message(buf)
+    if num_sigs < 1:
+        return False
+
+    keys_offset = msg_start + 1 if buf[msg_start] & 0x80 else msg_start
+    _, key0 = read_shortvec(buf, keys_offset + 3)
+    if buf[key0:key0 + PUBKEY_LEN] != bytes(keypair.pubkey()):
+        return False
+
+    signature = keypair.sign_message(bytes(buf[msg_start:]))
+    buf[sig_start:sig_start + SIGNATURE_LEN] = bytes(signature)
+    return True
@@ -0,0 +1,43 @@
+"""
+Token decimals and human amount -> base unit conversion
+"""
+from decimal import Decimal
+from typing import Union
+
+# Decimals of known tokens, by mint / contract address
+TOKEN_DECIMALS = {
+    # Solana
+    "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v": 6,   # USDC
+    "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB": 6,   # USDT
+    "So11111111111111111111111111111111111111112": 9,    # wrapped SOL
+    # BSC
+    "0x55d398326f99059fF775485246999027B3197955": 18,   # USDT
+    "0xe9e7CEA3DedcA5984780Bafc599bD69ADd087D56": 18,   # BUSD
+    "0x8AC76a51cc950d9822D68b83fE1Ad97B32Cd580d": 18,   # USDC
+}
+
+# USD stablecoins: one token is one USD, so a USD value converts straight to
+# base units. Hedge swaps are sized in USD and only accept these as input.
+USD_STABLE_INPUTS = frozenset({
+    "EPjFWdd5AufqSSqeM2qN1xzybapC8G4wEGGkZwyTDt1v",  # Solana USDC
+    "Es9vMFrzaCERmJfrF4H2FYD4KCoNkY11McCe8BenwNYB",  # Solana USDT
+    "0x55d398326f99059fF775485246999027B3197955",   # BSC USDT
+    "0xe9e7CEA3DedcA5984780Bafc599bD69ADd087D56",   # BSC BUSD
+    "0x8AC76a51cc950d9822D68b83fE1Ad97B32Cd580d",   # BSC USDC
+})
+
+# 10**decimals, computed once per token
+_SCALE = {address: Decimal(10) ** decimals for address, decimals in TOKEN_DECIMALS.items()}
+
+
+def base_units(token_address: str, amount: Union[Decimal, float, int, str]) -> int:
+    """Convert a human amount of a known token to integer base units (truncating)
+
+    Floats go through str() first so e.g. 0.57 USDC is 570000, not 569999.
+
+    Raises:
+        KeyError: if the token's decimals are not in TOKEN_DECIMALS
+    """
+    if isinstance(amount, float):
+        amount = str(amount)
+    return int(Decimal(amount) * _SCALE[token_address])